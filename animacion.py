@@ -0,0 +1,418 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Animación de cargas en movimiento con cuadros en flujo
+
+Descripción: Simula cargas que siguen una trayectoria (un dipolo que gira,
+dos cargas que se acercan) durante cientos o miles de cuadros. El campo de
+cada cuadro se calcula por adelantado en un pool de procesos (productor) y
+el renderizador consume los cuadros en orden, reutilizando los mismos
+artistas de matplotlib: la parte fija de la figura (ejes, marcas, barra de
+color) se rasteriza una vez y en cada cuadro solo se dibujan encima los
+artistas que cambian (blitting). Cada cuadro se escribe en cuanto está
+listo, como PNG o enviado a ffmpeg, así que en memoria solo hay los
+cuadros que el productor lleva de adelanto.
+
+Al terminar se reportan los cuadros por segundo del cálculo, del
+renderizado y del conjunto.
+
+Uso:
+
+    python animacion.py giratorio --cuadros 600 --salida cuadros
+    python animacion.py acercamiento --video acercamiento.mp4 --fps 30
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+K = 1.0
+Q = 1.0
+RANGO = 5
+RESOLUCION = 200
+DPI = 100
+FPS = 30
+
+# Cuadros que el productor puede llevar de ventaja al renderizador
+ADELANTO = 8
+
+# Máximo de flechas por lado (la malla se submuestrea para dibujarlas)
+FLECHAS_POR_LADO = 25
+
+# Escala logarítmica fija de |E| (N/C), igual para todos los cuadros
+MAGNITUD_MIN = 1e-2
+MAGNITUD_MAX = 1e2
+
+# ============================================================================
+# TRAYECTORIAS (t va de 0 a 1 a lo largo de la animación)
+# ============================================================================
+
+def dipolo_giratorio(t, q=Q, radio=1.0, vueltas=1.0):
+    """Dipolo de separación 2·radio que gira alrededor del origen"""
+    angulo = 2 * np.pi * vueltas * t
+    x, y = radio * np.cos(angulo), radio * np.sin(angulo)
+    return [(q, x, y), (-q, -x, -y)]
+
+
+def cargas_acercandose(t, q=Q, distancia_inicial=8.0, distancia_final=0.5):
+    """Cargas +q y −q sobre el eje x que se acercan hasta casi tocarse"""
+    d = distancia_inicial + (distancia_final - distancia_inicial) * t
+    return [(q, -d / 2, 0.0), (-q, d / 2, 0.0)]
+
+
+TRAYECTORIAS = {
+    'giratorio': dipolo_giratorio,
+    'acercamiento': cargas_acercandose,
+}
+
+# ============================================================================
+# PRODUCTOR: CÁLCULO DE LOS CUADROS
+# ============================================================================
+
+# Malla y parámetros propios de cada proceso worker
+_malla = None
+_k = K
+
+
+def _iniciar_worker(rango, resolucion, k):
+    """Crea la malla del worker una sola vez"""
+    global _malla, _k
+    x = np.linspace(-rango, rango, resolucion)
+    _malla = np.meshgrid(x, x)
+    _k = k
+
+
+def _calcular_cuadro(cargas):
+    """
+    Calcula Ex, Ey en el worker y devuelve (Ex, Ey, inicio, fin).
+
+    inicio y fin son de time.perf_counter, un reloj monótono del sistema, así
+    que los intervalos de distintos procesos se pueden comparar.
+    """
+    inicio = time.perf_counter()
+    X, Y = _malla
+    Ex, Ey = motor_campo.campo_electrico(X, Y, cargas, _k)
+    return Ex, Ey, inicio, time.perf_counter()
+
+
+def _duracion_union(intervalos):
+    """Segundos cubiertos por al menos uno de los intervalos (inicio, fin)"""
+    total = 0.0
+    fin_cubierto = -np.inf
+    for inicio, fin in sorted(intervalos):
+        if fin > fin_cubierto:
+            total += fin - max(inicio, fin_cubierto)
+            fin_cubierto = fin
+    return total
+
+
+def producir_cuadros(trayectoria, cuadros, k=K, rango=RANGO, resolucion=RESOLUCION,
+                     procesos=None, adelanto=ADELANTO, **opciones):
+    """
+    Genera los cuadros de la animación en orden, calculados por adelantado.
+
+    Con procesos > 1 hay a lo más 'adelanto' cuadros en vuelo (calculándose
+    o esperando al renderizador), de modo que la memoria no crece con el
+    número de cuadros.
+
+    Parámetros:
+    -----------
+    trayectoria : función (t, **opciones) -> lista de cargas
+        Posición de las cargas en el instante t ∈ [0, 1)
+    cuadros : int
+        Número de cuadros
+    k, rango, resolucion :
+        Constante de Coulomb y malla de cálculo
+    procesos : int o None
+        Procesos del pool (None = todos los núcleos, 1 = sin pool)
+    adelanto : int
+        Cuadros calculados por adelantado como máximo
+    **opciones
+        Parámetros adicionales de la trayectoria
+
+    Genera:
+    -------
+    (i, cargas, Ex, Ey, inicio, fin)
+        inicio y fin (time.perf_counter) del cálculo del cuadro en su worker
+    """
+    instantes = (trayectoria(i / cuadros, **opciones) for i in range(cuadros))
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1:
+        _iniciar_worker(rango, resolucion, k)
+        for i, cargas in enumerate(instantes):
+            yield (i, cargas) + _calcular_cuadro(cargas)
+        return
+
+    with ProcessPoolExecutor(procesos, initializer=_iniciar_worker,
+                             initargs=(rango, resolucion, k)) as pool:
+        en_vuelo = deque()
+        for i, cargas in enumerate(instantes):
+            en_vuelo.append((i, cargas, pool.submit(_calcular_cuadro, cargas)))
+            if len(en_vuelo) >= adelanto:
+                j, cargas_j, futuro = en_vuelo.popleft()
+                yield (j, cargas_j) + futuro.result()
+        while en_vuelo:
+            j, cargas_j, futuro = en_vuelo.popleft()
+            yield (j, cargas_j) + futuro.result()
+
+# ============================================================================
+# RENDERIZADOR (ARTISTAS REUTILIZADOS)
+# ============================================================================
+
+class RenderizadorAnimacion:
+    """Dibuja cuadros sobre una figura Agg cuyos artistas se reutilizan"""
+
+    def __init__(self, rango=RANGO, resolucion=RESOLUCION, dpi=DPI):
+        self.rango = rango
+        self.dpi = dpi
+
+        # Flechas: una de cada 'paso' filas/columnas de la malla
+        x = np.linspace(-rango, rango, resolucion)
+        self.paso = max(1, -(-resolucion // FLECHAS_POR_LADO))
+        Xf, Yf = np.meshgrid(x[::self.paso], x[::self.paso])
+
+        self.fig = Figure(figsize=(8, 8), dpi=dpi, facecolor='white')
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0.08, 0.08, 0.76, 0.84])
+        cax = self.fig.add_axes([0.87, 0.08, 0.03, 0.84])
+
+        ax = self.ax
+        ax.set_xlim(-rango, rango)
+        ax.set_ylim(-rango, rango)
+        ax.set_aspect('equal')
+        ax.set_xlabel('x (m)', fontsize=12, weight='bold')
+        ax.set_ylabel('y (m)', fontsize=12, weight='bold')
+        ax.grid(True, alpha=0.3, color='gray', linestyle='--')
+
+        # Artistas creados una sola vez; cada cuadro solo cambia sus datos.
+        # Son 'animated' para quedar fuera del fondo estático.
+        paso_px = 2 * rango / (resolucion - 1)
+        extension = (-rango - paso_px / 2, rango + paso_px / 2,
+                     -rango - paso_px / 2, rango + paso_px / 2)
+        self.imagen = ax.imshow(np.ones((resolucion, resolucion)), origin='lower',
+                                extent=extension, cmap='viridis', alpha=0.8,
+                                norm=LogNorm(vmin=MAGNITUD_MIN, vmax=MAGNITUD_MAX, clip=True),
+                                interpolation='bilinear', animated=True)
+        self.fig.colorbar(self.imagen, cax=cax, label='Magnitud del Campo Eléctrico (N/C)')
+        ceros = np.zeros(Xf.shape)
+        self.flechas = ax.quiver(Xf, Yf, ceros, ceros, ceros, cmap='plasma',
+                                 alpha=0.8, scale=25, width=0.004, animated=True)
+        self.cargas = ax.scatter([], [], s=300, edgecolors='white', linewidths=2,
+                                 zorder=5, animated=True)
+        self.titulo = ax.set_title('', fontsize=14, weight='bold', color='#1a1a2e',
+                                   animated=True)
+
+        # Fondo estático rasterizado una sola vez
+        self.canvas.draw()
+        self.fondo = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def dibujar(self, cargas, Ex, Ey, titulo=''):
+        """Actualiza los artistas con un cuadro y lo dibuja sobre el fondo"""
+        E = np.hypot(Ex, Ey)
+        self.imagen.set_data(E)
+
+        p = self.paso
+        Exf, Eyf, Ef = Ex[::p, ::p], Ey[::p, ::p], E[::p, ::p]
+        norma = np.sqrt(Exf**2 + Eyf**2 + 1e-10)
+        self.flechas.set_UVC(Exf / norma, Eyf / norma, Ef)
+        self.flechas.autoscale()
+
+        cargas = motor_campo.preparar_cargas(cargas)
+        self.cargas.set_offsets(cargas[:, 1:])
+        self.cargas.set_facecolor(np.where(cargas[:, :1] > 0, (0.9, 0.2, 0.2, 1.0),
+                                           (0.2, 0.3, 0.9, 1.0)))
+        self.titulo.set_text(titulo)
+
+        self.canvas.restore_region(self.fondo)
+        for artista in (self.imagen, self.flechas, self.cargas):
+            self.ax.draw_artist(artista)
+        for linea in self.ax.get_xgridlines() + self.ax.get_ygridlines():
+            self.ax.draw_artist(linea)
+        self.fig.draw_artist(self.titulo)
+
+    def rgba(self):
+        """Píxeles del último cuadro dibujado (array alto × ancho × 4)"""
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def tamano(self):
+        """(ancho, alto) en píxeles"""
+        ancho, alto = self.canvas.get_width_height()
+        return int(ancho), int(alto)
+
+# ============================================================================
+# SALIDAS: SECUENCIA DE PNG O VIDEO CON FFMPEG
+# ============================================================================
+
+class SalidaPNG:
+    """Escribe cada cuadro como cuadro_00000.png en un directorio"""
+
+    def __init__(self, directorio):
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+
+    def escribir(self, i, renderizador):
+        # Se guardan los píxeles ya dibujados (savefig volvería a renderizar)
+        ruta = os.path.join(self.directorio, f"cuadro_{i:05d}.png")
+        imsave(ruta, renderizador.rgba(), pil_kwargs={'compress_level': 1})
+
+    def cerrar(self):
+        pass
+
+
+class SalidaVideo:
+    """Envía los cuadros RGBA sin comprimir a ffmpeg por su entrada estándar"""
+
+    def __init__(self, ruta, tamano, fps=FPS):
+        if shutil.which('ffmpeg') is None:
+            raise RuntimeError("No se encontró ffmpeg; usa la salida en PNG")
+        ancho, alto = tamano
+        comando = ['ffmpeg', '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{ancho}x{alto}',
+                   '-r', str(fps), '-i', '-',
+                   '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                   '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', ruta]
+        self.proceso = subprocess.Popen(comando, stdin=subprocess.PIPE)
+
+    def escribir(self, i, renderizador):
+        self.proceso.stdin.write(renderizador.rgba().tobytes())
+
+    def cerrar(self):
+        self.proceso.stdin.close()
+        self.proceso.wait()
+
+# ============================================================================
+# ANIMACIÓN COMPLETA
+# ============================================================================
+
+def animar(trayectoria='giratorio', cuadros=300, salida='cuadros', video=None, fps=FPS,
+           k=K, rango=RANGO, resolucion=RESOLUCION, dpi=DPI, procesos=None,
+           adelanto=ADELANTO, informar_cada=50, **opciones):
+    """
+    Calcula y renderiza una animación, escribiendo los cuadros en flujo.
+
+    Parámetros:
+    -----------
+    trayectoria : str o función
+        Nombre en TRAYECTORIAS o función (t, **opciones) -> lista de cargas
+    cuadros : int
+        Número de cuadros
+    salida : str
+        Directorio de los PNG (si no se pide video)
+    video : str o None
+        Archivo de video a generar con ffmpeg
+    fps : int
+        Cuadros por segundo del video
+    k, rango, resolucion, dpi :
+        Física, malla y tamaño de los cuadros
+    procesos, adelanto :
+        Ver producir_cuadros
+    informar_cada : int
+        Cada cuántos cuadros se imprime el progreso
+    **opciones
+        Parámetros adicionales de la trayectoria
+
+    Retorna:
+    --------
+    dict
+        Cuadros por segundo totales, del cálculo y del renderizado (todos
+        con tiempo de pared), segundos de pared esperando al cálculo y
+        segundos de cálculo por cuadro dentro de un worker
+    """
+    if isinstance(trayectoria, str):
+        nombre, trayectoria = trayectoria, TRAYECTORIAS[trayectoria]
+    else:
+        nombre = trayectoria.__name__
+
+    renderizador = RenderizadorAnimacion(rango, resolucion, dpi)
+    escritor = (SalidaVideo(video, renderizador.tamano(), fps) if video
+                else SalidaPNG(salida))
+
+    t_calculo = 0.0
+    intervalos = []
+    t_espera = 0.0
+    t_render = 0.0
+    inicio = time.perf_counter()
+    try:
+        generador = producir_cuadros(trayectoria, cuadros, k, rango, resolucion,
+                                     procesos, adelanto, **opciones)
+        while True:
+            # Tiempo de pared que el renderizador espera al cálculo (con varios
+            # procesos los cuadros se calculan mientras se dibujan los anteriores)
+            inicio_espera = time.perf_counter()
+            cuadro = next(generador, None)
+            t_espera += time.perf_counter() - inicio_espera
+            if cuadro is None:
+                break
+            i, cargas, Ex, Ey, inicio_cuadro, fin_cuadro = cuadro
+            t_calculo += fin_cuadro - inicio_cuadro
+            intervalos.append((inicio_cuadro, fin_cuadro))
+
+            inicio_render = time.perf_counter()
+            renderizador.dibujar(cargas, Ex, Ey, f"{nombre}  ·  cuadro {i + 1}/{cuadros}")
+            escritor.escribir(i, renderizador)
+            t_render += time.perf_counter() - inicio_render
+
+            if (i + 1) % informar_cada == 0:
+                transcurrido = time.perf_counter() - inicio
+                print(f"  {i + 1}/{cuadros} cuadros  ({(i + 1) / transcurrido:.1f} cuadros/s)")
+    finally:
+        escritor.cerrar()
+
+    # Tiempo de pared del cálculo: el que hubo al menos un cuadro
+    # calculándose (los cuadros de distintos workers se solapan)
+    total = time.perf_counter() - inicio
+    t_calculo_pared = _duracion_union(intervalos)
+    estadisticas = {
+        'cuadros': cuadros,
+        'fps_total': cuadros / total if total > 0 else float('inf'),
+        'fps_calculo': cuadros / t_calculo_pared if t_calculo_pared > 0 else float('inf'),
+        'fps_render': cuadros / t_render if t_render > 0 else float('inf'),
+        'segundos_espera': t_espera,
+        'segundos_worker_por_cuadro': t_calculo / cuadros if cuadros > 0 else 0.0,
+    }
+    print(f"✅ {cuadros} cuadros en {total:.2f} s ({estadisticas['fps_total']:.1f} cuadros/s): "
+          f"cálculo {estadisticas['fps_calculo']:.1f} cuadros/s, "
+          f"render {estadisticas['fps_render']:.1f} cuadros/s, espera al cálculo "
+          f"{t_espera:.2f} s, {estadisticas['segundos_worker_por_cuadro'] * 1000:.1f} ms "
+          f"de cálculo por cuadro en cada worker")
+    return estadisticas
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Animación del campo de cargas en movimiento")
+    parser.add_argument('trayectoria', choices=sorted(TRAYECTORIAS))
+    parser.add_argument('--cuadros', type=int, default=300)
+    parser.add_argument('--salida', default='cuadros', help="carpeta de los PNG")
+    parser.add_argument('--video', help="generar un video con ffmpeg en lugar de PNG")
+    parser.add_argument('--fps', type=int, default=FPS)
+    parser.add_argument('--resolucion', type=int, default=RESOLUCION)
+    parser.add_argument('--dpi', type=int, default=DPI)
+    parser.add_argument('--procesos', type=int, default=None,
+                        help="procesos para calcular los cuadros (por defecto, todos los núcleos)")
+    parser.add_argument('--adelanto', type=int, default=ADELANTO)
+    args = parser.parse_args()
+
+    print(f"🎬 Animando '{args.trayectoria}' ({args.cuadros} cuadros)")
+    animar(args.trayectoria, args.cuadros, args.salida, args.video, args.fps,
+           resolucion=args.resolucion, dpi=args.dpi, procesos=args.procesos,
+           adelanto=args.adelanto)
@@ -0,0 +1,247 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Evaluador Barnes–Hut del campo eléctrico (árbol de cuadrantes)
+
+Descripción: La superposición directa de motor_campo cuesta O(N·M) para N
+cargas y M puntos. Este módulo agrupa las cargas en un árbol de cuadrantes y,
+para cada grupo suficientemente lejano de un punto, sustituye sus cargas por
+una expansión multipolar (monopolo + dipolo) respecto al centro de carga del
+grupo (el promedio de las posiciones pesado por |q|).
+El costo baja a aproximadamente O(M·log N), lo que permite trabajar con
+distribuciones lineales o superficiales discretizadas en 10⁵ cargas o más.
+
+La precisión se controla con 'theta' (criterio de apertura): un cuadrante de
+lado s a distancia d de un punto se aproxima si s / d < theta. theta = 0
+equivale a la suma directa; valores típicos están entre 0.3 y 0.8.
+
+Uso básico (mismo contrato que motor_campo.campo_electrico):
+
+    import barnes_hut
+    Ex, Ey = barnes_hut.campo_electrico(X, Y, cargas, k=1.0, theta=0.5)
+"""
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Criterio de apertura: s / d < theta  =>  se usa la expansión multipolar
+THETA = 0.5
+
+# Número máximo de cargas en una hoja (debajo se suma directamente)
+TAM_HOJA = 32
+
+# Profundidad máxima del árbol (evita recursión infinita con cargas repetidas)
+PROFUNDIDAD_MAXIMA = 32
+
+# ============================================================================
+# ÁRBOL DE CUADRANTES
+# ============================================================================
+
+class ArbolCuadrantes:
+    """Árbol de cuadrantes sobre un conjunto de cargas con momentos multipolares"""
+
+    def __init__(self, cargas, tam_hoja=TAM_HOJA):
+        """
+        Construye el árbol a partir de las cargas.
+
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Cada fila contiene (carga, pos_x, pos_y)
+        tam_hoja : int
+            Número máximo de cargas por hoja
+        """
+        self.cargas = motor_campo.preparar_cargas(cargas)
+        self.tam_hoja = max(1, int(tam_hoja))
+
+        # Datos de cada nodo guardados en listas paralelas: el centro
+        # geométrico del cuadrante (para subdividir) y el centro de carga
+        # (origen de la expansión multipolar)
+        self.centro_x = []
+        self.centro_y = []
+        self.polo_x = []
+        self.polo_y = []
+        self.lado = []
+        self.carga_total = []
+        self.dipolo_x = []
+        self.dipolo_y = []
+        self.hijos = []
+        self.cargas_hoja = []
+
+        if len(self.cargas) > 0:
+            self._construir()
+
+    def __len__(self):
+        """Número de nodos del árbol"""
+        return len(self.lado)
+
+    def _nuevo_nodo(self, indices, cx, cy, lado):
+        """Registra un nodo y calcula sus momentos respecto a su centro de carga"""
+        q = self.cargas[indices, 0]
+        xs = self.cargas[indices, 1]
+        ys = self.cargas[indices, 2]
+
+        # Centro de carga pesado por |q|: con cargas de un solo signo el
+        # dipolo se anula y con cargas repetidas el monopolo es exacto. Si
+        # todas las cargas son nulas se usa el centro del cuadrante.
+        peso = np.abs(q)
+        total = peso.sum()
+        px = np.dot(peso, xs) / total if total > 0 else cx
+        py = np.dot(peso, ys) / total if total > 0 else cy
+
+        self.centro_x.append(cx)
+        self.centro_y.append(cy)
+        self.polo_x.append(px)
+        self.polo_y.append(py)
+        self.lado.append(lado)
+        self.carga_total.append(q.sum())
+        self.dipolo_x.append(np.dot(q, xs - px))
+        self.dipolo_y.append(np.dot(q, ys - py))
+        self.hijos.append(None)
+        self.cargas_hoja.append(None)
+        return len(self.lado) - 1
+
+    def _construir(self):
+        """Subdivide el dominio de las cargas hasta llegar a hojas pequeñas"""
+        xs = self.cargas[:, 1]
+        ys = self.cargas[:, 2]
+        x_min, x_max = xs.min(), xs.max()
+        y_min, y_max = ys.min(), ys.max()
+        lado = max(x_max - x_min, y_max - y_min, 1e-12) * (1 + 1e-9)
+
+        todos = np.arange(len(self.cargas))
+        raiz = self._nuevo_nodo(todos, (x_min + x_max) / 2, (y_min + y_max) / 2, lado)
+        pila = [(raiz, todos, 0)]
+
+        while pila:
+            nodo, indices, profundidad = pila.pop()
+            if len(indices) <= self.tam_hoja or profundidad >= PROFUNDIDAD_MAXIMA:
+                self.cargas_hoja[nodo] = self.cargas[indices]
+                continue
+
+            cx = self.centro_x[nodo]
+            cy = self.centro_y[nodo]
+            cuarto = self.lado[nodo] / 4
+            derecha = self.cargas[indices, 1] >= cx
+            arriba = self.cargas[indices, 2] >= cy
+
+            hijos = []
+            for mask_x, signo_x in ((~derecha, -1), (derecha, 1)):
+                for mask_y, signo_y in ((~arriba, -1), (arriba, 1)):
+                    sub = indices[mask_x & mask_y]
+                    if len(sub) == 0:
+                        continue
+                    hijo = self._nuevo_nodo(sub, cx + signo_x * cuarto,
+                                            cy + signo_y * cuarto, 2 * cuarto)
+                    hijos.append(hijo)
+                    pila.append((hijo, sub, profundidad + 1))
+            self.hijos[nodo] = hijos
+
+    def campo(self, x, y, k=1.0, theta=THETA):
+        """
+        Evalúa el campo eléctrico aproximado en los puntos (x, y).
+
+        Los puntos se recorren por nodos: cada nodo recibe el conjunto de
+        puntos que aún no lo han aproximado, de modo que el trabajo en Python
+        es proporcional al número de nodos y no al de puntos.
+
+        Parámetros:
+        -----------
+        x, y : arrays de numpy
+            Coordenadas de los puntos (cualquier forma)
+        k : float
+            Constante de Coulomb
+        theta : float
+            Criterio de apertura (0 = suma directa)
+
+        Retorna:
+        --------
+        Ex, Ey : arrays de numpy
+            Componentes x e y del campo eléctrico, con la forma de x
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.shape != y.shape:
+            raise ValueError("x e y deben tener la misma forma")
+
+        Ex = np.zeros(x.size)
+        Ey = np.zeros(y.size)
+        if len(self) == 0 or x.size == 0:
+            return Ex.reshape(x.shape), Ey.reshape(y.shape)
+
+        px = x.reshape(-1)
+        py = y.reshape(-1)
+        pila = [(0, np.arange(x.size))]
+
+        while pila:
+            nodo, idx = pila.pop()
+            dx = px[idx] - self.polo_x[nodo]
+            dy = py[idx] - self.polo_y[nodo]
+            r2 = dx * dx + dy * dy
+
+            # Puntos lejanos: s² < theta² · d²
+            lejos = self.lado[nodo] ** 2 < (theta * theta) * r2
+            if lejos.any():
+                self._sumar_multipolo(nodo, idx[lejos], dx[lejos], dy[lejos],
+                                      r2[lejos], k, Ex, Ey)
+                idx = idx[~lejos]
+                if len(idx) == 0:
+                    continue
+
+            # Puntos cercanos: suma directa en hojas o bajar un nivel
+            if self.hijos[nodo] is None:
+                ex, ey = motor_campo.campo_electrico(px[idx], py[idx],
+                                                     self.cargas_hoja[nodo], k)
+                Ex[idx] += ex
+                Ey[idx] += ey
+            else:
+                for hijo in self.hijos[nodo]:
+                    pila.append((hijo, idx))
+
+        return Ex.reshape(x.shape), Ey.reshape(y.shape)
+
+    def _sumar_multipolo(self, nodo, idx, dx, dy, r2, k, Ex, Ey):
+        """Suma la expansión monopolo + dipolo del nodo en los puntos idx"""
+        r = np.sqrt(r2)
+        inv_r3 = 1.0 / (r2 * r)
+        Q = self.carga_total[nodo]
+        p_x = self.dipolo_x[nodo]
+        p_y = self.dipolo_y[nodo]
+
+        # Monopolo: k·Q·d / r³
+        # Dipolo:   k·(3·(p·d)·d / r⁵ − p / r³)
+        p_punto_d = p_x * dx + p_y * dy
+        a = k * inv_r3 * (Q + 3.0 * p_punto_d / r2)
+        Ex[idx] += a * dx - k * p_x * inv_r3
+        Ey[idx] += a * dy - k * p_y * inv_r3
+
+# ============================================================================
+# FUNCIÓN CON EL MISMO CONTRATO QUE motor_campo.campo_electrico
+# ============================================================================
+
+def campo_electrico(x, y, cargas, k=1.0, theta=THETA, tam_hoja=TAM_HOJA):
+    """
+    Calcula el campo eléctrico en los puntos (x, y) con el método de Barnes–Hut.
+
+    Parámetros:
+    -----------
+    x, y : arrays de numpy
+        Coordenadas de los puntos donde calcular el campo
+    cargas : lista de tuplas o array de numpy (N, 3)
+        Cada fila contiene (carga, pos_x, pos_y)
+    k : float
+        Constante de Coulomb
+    theta : float
+        Criterio de apertura; menor es más preciso y más lento
+    tam_hoja : int
+        Número máximo de cargas por hoja del árbol
+
+    Retorna:
+    --------
+    Ex, Ey : arrays de numpy
+        Componentes x e y del campo eléctrico, con la forma de x
+    """
+    return ArbolCuadrantes(cargas, tam_hoja).campo(x, y, k, theta)
@@ -0,0 +1,479 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Benchmarks del motor de campo eléctrico
+
+Descripción: Mediciones de rendimiento y precisión de los distintos caminos
+de cálculo. Se ejecuta desde la línea de comandos, por ejemplo:
+
+    python benchmarks.py barnes_hut
+
+La suite de regresión ('suite') barre el núcleo de cálculo y las etapas de
+dibujo, guarda los tiempos en JSON y los compara contra una línea base:
+
+    python benchmarks.py suite --json base.json             # guardar la base
+    python benchmarks.py suite --json hoy.json --base base.json
+
+Si alguna medición es más lenta que la base por encima del umbral, el
+programa termina con código de salida 1.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import barnes_hut
+import motor_campo
+from muestreo_adaptativo import RADIO_CARGA, MuestreoAdaptativo
+
+# ============================================================================
+# UTILIDADES
+# ============================================================================
+
+def cronometrar(funcion, repeticiones=3):
+    """Devuelve el mejor tiempo (s) de varias ejecuciones de funcion()"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def malla(rango, resolucion):
+    """Malla cuadrada de resolucion × resolucion puntos en [-rango, rango]²"""
+    x = np.linspace(-rango, rango, resolucion)
+    return np.meshgrid(x, x)
+
+
+def cargas_en_anillo(n, rango=5, semilla=0):
+    """Distribución lineal de n cargas (anillo con ruido y signos alternos)"""
+    rng = np.random.default_rng(semilla)
+    t = rng.uniform(0, 2 * np.pi, n)
+    radio = 0.6 * rango
+    q = np.where(np.arange(n) % 2 == 0, 1.0, -0.5) / n
+    return np.column_stack([q,
+                            radio * np.cos(t) + rng.normal(0, 0.05, n),
+                            radio * np.sin(t) + rng.normal(0, 0.05, n)])
+
+
+def pico_memoria(funcion):
+    """Ejecuta funcion() y devuelve el pico de memoria reservada (MB)"""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def error_relativo(Ex, Ey, Ex_ref, Ey_ref):
+    """Error relativo RMS del campo (Ex, Ey) respecto a la referencia"""
+    diferencia = (Ex - Ex_ref)**2 + (Ey - Ey_ref)**2
+    return float(np.sqrt(diferencia.sum() / (Ex_ref**2 + Ey_ref**2).sum()))
+
+# ============================================================================
+# BENCHMARK: BARNES–HUT CONTRA SUMA DIRECTA
+# ============================================================================
+
+def benchmark_barnes_hut(resolucion=100, tamanos=(10, 30, 100, 1000, 10000, 100000),
+                         thetas=(0.3, 0.5, 0.8)):
+    """
+    Compara tiempo y error de Barnes–Hut frente a la suma directa.
+
+    Imprime una tabla por número de cargas y reporta el primer N a partir
+    del cual Barnes–Hut (con theta = 0.5) es más rápido que la suma directa.
+    """
+    X, Y = malla(5, resolucion)
+    print(f"Malla {resolucion}×{resolucion} = {X.size} puntos")
+    print(f"{'N':>8} {'directo (s)':>12} " +
+          " ".join(f"{'θ=' + str(t) + ' (s)':>12} {'error':>9}" for t in thetas))
+
+    cruce = None
+    for n in tamanos:
+        cargas = cargas_en_anillo(n)
+        Ex_ref, Ey_ref = motor_campo.campo_electrico(X, Y, cargas)
+        t_directo = cronometrar(lambda: motor_campo.campo_electrico(X, Y, cargas), 1)
+
+        columnas = []
+        for theta in thetas:
+            Ex, Ey = barnes_hut.campo_electrico(X, Y, cargas, theta=theta)
+            t_bh = cronometrar(lambda: barnes_hut.campo_electrico(X, Y, cargas, theta=theta), 1)
+            columnas.append(f"{t_bh:12.4f} {error_relativo(Ex, Ey, Ex_ref, Ey_ref):9.2e}")
+            if theta == 0.5 and cruce is None and t_bh < t_directo:
+                cruce = n
+
+        print(f"{n:8d} {t_directo:12.4f} " + " ".join(columnas))
+
+    if cruce is None:
+        print("Barnes–Hut no superó a la suma directa en los tamaños probados")
+    else:
+        print(f"Cruce: Barnes–Hut (θ=0.5) es más rápido a partir de N = {cruce}")
+
+# ============================================================================
+# BENCHMARK: EVALUACIÓN PARALELA POR TESELAS
+# ============================================================================
+
+def benchmark_paralelo(resolucion=2000, n_cargas=2, workers=None):
+    """
+    Mide la escalabilidad de campo_electrico con distinto número de workers.
+
+    Imprime el tiempo y la aceleración respecto a un solo núcleo para cada
+    backend ('hilos' y 'procesos').
+    """
+    X, Y = malla(5, resolucion)
+    cargas = cargas_en_anillo(n_cargas)
+    maximo = workers or os.cpu_count() or 1
+    niveles = sorted({1, *[2**i for i in range(1, maximo.bit_length())], maximo})
+    print(f"Malla {resolucion}×{resolucion}, {n_cargas} cargas, hasta {maximo} workers")
+
+    t_serie = cronometrar(lambda: motor_campo.campo_electrico(X, Y, cargas, workers=1))
+    print(f"{'backend':>9} {'workers':>8} {'tiempo (s)':>11} {'aceleración':>12}")
+    for backend in ('hilos', 'procesos'):
+        for n in niveles:
+            t = cronometrar(lambda: motor_campo.campo_electrico(
+                X, Y, cargas, workers=n, backend=backend))
+            print(f"{backend:>9} {n:8d} {t:11.4f} {t_serie / t:11.2f}x")
+    motor_campo.cerrar_pools()
+
+# ============================================================================
+# BENCHMARK: PRECISIÓN SIMPLE (float32) CONTRA DOBLE (float64)
+# ============================================================================
+
+def benchmark_precision(resoluciones=(1000, 4000), n_cargas=2):
+    """
+    Compara tiempo, memoria y error del cálculo en float32 y en float64.
+
+    La memoria es el pico reservado durante la llamada (salidas y buffers
+    de trabajo) más las mallas de entrada, que en float32 ocupan la mitad.
+    El error se reporta como el máximo de |E32 − E64| dividido entre la
+    cota documentada en motor_campo; debe ser menor que 1.
+    """
+    cargas = cargas_en_anillo(n_cargas)
+    u = 2.0**-24
+    print(f"{n_cargas} cargas")
+    print(f"{'resolución':>11} {'f64 (s)':>9} {'f32 (s)':>9} {'aceleración':>12} "
+          f"{'f64 (MB)':>9} {'f32 (MB)':>9} {'error/cota':>11}")
+    for resolucion in resoluciones:
+        X, Y = malla(5, resolucion)
+        X32, Y32 = X.astype(np.float32), Y.astype(np.float32)
+
+        t64 = cronometrar(lambda: motor_campo.campo_electrico(X, Y, cargas))
+        t32 = cronometrar(lambda: motor_campo.campo_electrico(X32, Y32, cargas,
+                                                             dtype=np.float32))
+        m64 = X.nbytes + Y.nbytes + pico_memoria(
+            lambda: motor_campo.campo_electrico(X, Y, cargas)) * 2**20
+        m32 = X32.nbytes + Y32.nbytes + pico_memoria(
+            lambda: motor_campo.campo_electrico(X32, Y32, cargas, dtype=np.float32)) * 2**20
+
+        # Error frente a float64 evaluado en los mismos puntos (las mallas
+        # float32 redondean las coordenadas)
+        Ex_ref, Ey_ref = motor_campo.campo_electrico(X32, Y32, cargas)
+        Ex, Ey = motor_campo.campo_electrico(X32, Y32, cargas, dtype=np.float32)
+        suma = np.zeros(X.shape)
+        for q, cx, cy in cargas:
+            suma += abs(q) / ((X32 - cx)**2 + (Y32 - cy)**2 + motor_campo.EPSILON)
+        cota = (len(cargas) + 8) * u * suma
+        razon = max((np.abs(Ex - Ex_ref) / cota).max(), (np.abs(Ey - Ey_ref) / cota).max())
+
+        print(f"{resolucion:>11} {t64:9.3f} {t32:9.3f} {t64 / t32:11.2f}x "
+              f"{m64 / 2**20:9.0f} {m32 / 2**20:9.0f} {razon:11.3f}")
+
+# ============================================================================
+# BENCHMARK: MUESTREO ADAPTATIVO CONTRA MALLA UNIFORME
+# ============================================================================
+
+def benchmark_adaptativo(resolucion=400, tolerancias=(0.4, 0.2, 0.1), n_cargas=(2, 200)):
+    """
+    Compara el muestreo adaptativo con la evaluación directa en la malla de
+    pantalla.
+
+    El árbol se limita a hojas de al menos un píxel (resolucion dada al
+    construirlo). Para cada escena y tolerancia se reporta cuántas veces se
+    evaluó el campo (y qué fracción de los píxeles es), el tiempo y el error
+    mediano y del percentil 99 de ln|E| fuera de los círculos de las cargas.
+    """
+    X, Y = malla(5, resolucion)
+    rng = np.random.default_rng(0)
+
+    for n in n_cargas:
+        if n == 2:
+            cargas = motor_campo.preparar_cargas([(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)])
+        else:
+            cargas = np.column_stack([rng.normal(size=n), rng.uniform(-4, 4, n),
+                                      rng.uniform(-4, 4, n)])
+        ln_ref = np.log(np.hypot(*motor_campo.campo_electrico(X, Y, cargas)))
+        lejos = np.ones(X.shape, dtype=bool)
+        for _, qx, qy in cargas:
+            lejos &= np.hypot(X - qx, Y - qy) >= RADIO_CARGA
+
+        print(f"\nPantalla {resolucion}×{resolucion}, {n} cargas")
+        print(f"{'tolerancia':>11} {'evaluaciones':>13} {'fracción':>9} {'tiempo (s)':>11} "
+              f"{'error med':>10} {'error p99':>10}")
+        for tolerancia in tolerancias:
+            muestreo = None
+
+            def construir():
+                nonlocal muestreo
+                muestreo = MuestreoAdaptativo(cargas, resolucion=resolucion,
+                                              tolerancia=tolerancia)
+                return muestreo.remuestrear()
+
+            t = cronometrar(construir)
+            error = np.abs(np.log(construir()) - ln_ref)[lejos]
+            print(f"{tolerancia:>11} {muestreo.evaluaciones:13d} "
+                  f"{muestreo.evaluaciones / X.size:9.3f} {t:11.4f} "
+                  f"{np.median(error):10.2e} {np.percentile(error, 99):10.2e}")
+
+        # Evaluación directa en los píxeles de la malla de pantalla (exacta)
+        t = cronometrar(lambda: motor_campo.campo_electrico(X, Y, cargas))
+        print(f"{'pantalla':>11} {X.size:13d} {1:9.3f} {t:11.4f} "
+              f"{0:10.2e} {0:10.2e}")
+
+# ============================================================================
+# BENCHMARK: MAPA DE COLORES (contourf CONTRA imshow)
+# ============================================================================
+
+def benchmark_mapa_colores(resoluciones=(100, 300, 1000, 2000), cuadros=5):
+    """
+    Compara el costo por cuadro de dibujar la magnitud del campo con
+    contourf (reconstruido cada cuadro) y con imshow + set_data.
+
+    Se usa el backend Agg, sin ventana; el tiempo incluye generar el
+    artista y rasterizarlo con draw_artist, como en el simulador.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.colors import LogNorm
+    from matplotlib.figure import Figure
+
+    print(f"{'resolución':>11} {'contourf (ms)':>14} {'imshow (ms)':>12} "
+          f"{'imshow log (ms)':>16} {'aceleración':>12}")
+    for resolucion in resoluciones:
+        X, Y = malla(5, resolucion)
+
+        # Magnitudes de varios cuadros de un dipolo en movimiento
+        magnitudes = []
+        for i in range(cuadros):
+            x1 = -1.0 + 0.1 * i
+            Ex, Ey = motor_campo.campo_electrico(X, Y, [(1.0, x1, 0.0), (-1.0, 1.0, 0.0)])
+            magnitudes.append(np.sqrt(Ex**2 + Ey**2))
+
+        def nuevo_lienzo():
+            fig = Figure(figsize=(8, 8))
+            ax = fig.add_subplot()
+            lienzo = FigureCanvasAgg(fig)
+            lienzo.draw()
+            return ax
+
+        ax = nuevo_lienzo()
+        inicio = time.perf_counter()
+        contorno = None
+        for E in magnitudes:
+            if contorno is not None:
+                contorno.remove()
+            contorno = ax.contourf(X, Y, E, levels=20, cmap='viridis',
+                                   alpha=0.7, animated=True)
+            ax.draw_artist(contorno)
+        t_contorno = (time.perf_counter() - inicio) / cuadros * 1000
+
+        tiempos_imagen = []
+        for norma in (None, LogNorm(vmin=1e-2, vmax=1e2, clip=True)):
+            ax = nuevo_lienzo()
+            imagen = ax.imshow(magnitudes[0], origin='lower', extent=(-5, 5, -5, 5),
+                               cmap='viridis', norm=norma, alpha=0.7,
+                               interpolation='bilinear', animated=True)
+            inicio = time.perf_counter()
+            for E in magnitudes:
+                imagen.set_data(E)
+                if norma is None:
+                    imagen.autoscale()
+                ax.draw_artist(imagen)
+            tiempos_imagen.append((time.perf_counter() - inicio) / cuadros * 1000)
+
+        print(f"{resolucion:>11} {t_contorno:14.1f} {tiempos_imagen[0]:12.1f} "
+              f"{tiempos_imagen[1]:16.1f} {t_contorno / tiempos_imagen[0]:11.1f}x")
+
+# ============================================================================
+# SUITE DE REGRESIÓN (JSON + LÍNEA BASE)
+# ============================================================================
+
+# Una medición es regresión si tarda más que (1 + UMBRAL_REGRESION) · base
+UMBRAL_REGRESION = 0.2
+
+
+def metadatos_entorno():
+    """Versiones y máquina donde se midió, para interpretar la comparación"""
+    import matplotlib
+    return {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'nucleos': os.cpu_count(),
+    }
+
+
+def medir_nucleo(tamanos=(2, 10, 100), resoluciones=(20, 100, 500),
+                 tipos=('float64', 'float32'), repeticiones=3):
+    """Tiempo (s) de campo_electrico para cada (cargas, resolución, dtype)"""
+    resultados = {}
+    for n in tamanos:
+        cargas = cargas_en_anillo(n)
+        for resolucion in resoluciones:
+            X, Y = malla(5, resolucion)
+            for tipo in tipos:
+                t = cronometrar(lambda: motor_campo.campo_electrico(X, Y, cargas, dtype=tipo),
+                                repeticiones)
+                resultados[f"nucleo/cargas={n}/res={resolucion}/{tipo}"] = t
+    return resultados
+
+
+def medir_dibujo(resoluciones=(20, 100), repeticiones=3):
+    """
+    Tiempo (s) de las etapas de dibujo de actualizar_simulacion en Agg.
+
+    Se usa una figura como la del simulador: contourf de |E| (20 niveles),
+    quiver de las flechas unitarias y canvas.draw de la figura completa.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    resultados = {}
+    for resolucion in resoluciones:
+        X, Y = malla(5, resolucion)
+        Ex, Ey = motor_campo.campo_electrico(X, Y, [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)])
+        E = np.sqrt(Ex**2 + Ey**2)
+        E_norm = np.sqrt(Ex**2 + Ey**2 + 1e-10)
+
+        fig = Figure(figsize=(8, 8), facecolor='white')
+        lienzo = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.set_xlim(-5, 5)
+        ax.set_ylim(-5, 5)
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3)
+        lienzo.draw()
+
+        def contorno():
+            c = ax.contourf(X, Y, E, levels=20, cmap='viridis', alpha=0.7)
+            ax.draw_artist(c)
+            c.remove()
+
+        def flechas():
+            f = ax.quiver(X, Y, Ex/E_norm, Ey/E_norm, E, cmap='plasma',
+                          alpha=0.8, scale=25, width=0.004)
+            ax.draw_artist(f)
+            f.remove()
+
+        resultados[f"dibujo/contourf/res={resolucion}"] = cronometrar(contorno, repeticiones)
+        resultados[f"dibujo/quiver/res={resolucion}"] = cronometrar(flechas, repeticiones)
+
+        ax.contourf(X, Y, E, levels=20, cmap='viridis', alpha=0.7)
+        ax.quiver(X, Y, Ex/E_norm, Ey/E_norm, E, cmap='plasma', alpha=0.8,
+                  scale=25, width=0.004)
+        resultados[f"dibujo/canvas_draw/res={resolucion}"] = cronometrar(lienzo.draw,
+                                                                         repeticiones)
+    return resultados
+
+
+def comparar_con_base(resultados, base, umbral=UMBRAL_REGRESION):
+    """
+    Compara tiempos con una línea base.
+
+    Retorna:
+    --------
+    lista de tuplas (clave, base, actual, razón) de las regresiones
+    """
+    regresiones = []
+    print(f"{'medición':<40} {'base (ms)':>10} {'actual (ms)':>12} {'razón':>7}")
+    for clave in sorted(resultados):
+        if clave not in base:
+            continue
+        razon = resultados[clave] / base[clave]
+        marca = '  ⚠️ regresión' if razon > 1 + umbral else ''
+        print(f"{clave:<40} {base[clave] * 1000:10.2f} {resultados[clave] * 1000:12.2f} "
+              f"{razon:7.2f}{marca}")
+        if marca:
+            regresiones.append((clave, base[clave], resultados[clave], razon))
+    return regresiones
+
+
+def benchmark_suite(salida=None, base=None, umbral=UMBRAL_REGRESION):
+    """
+    Barre núcleo y dibujo, guarda el JSON y compara contra la línea base.
+
+    Parámetros:
+    -----------
+    salida : str, opcional
+        Archivo JSON donde guardar {'metadatos': ..., 'resultados': ...}
+    base : str, opcional
+        JSON de una ejecución anterior con el que comparar
+    umbral : float
+        Fracción de tiempo extra tolerada antes de marcar una regresión
+
+    Retorna:
+    --------
+    lista de regresiones (vacía si no hay base o no hubo regresiones)
+    """
+    resultados = medir_nucleo()
+    resultados.update(medir_dibujo())
+    informe = {'metadatos': metadatos_entorno(), 'resultados': resultados}
+
+    if salida:
+        with open(salida, 'w', encoding='utf-8') as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {salida}")
+
+    if base is None:
+        for clave in sorted(resultados):
+            print(f"{clave:<40} {resultados[clave] * 1000:10.2f} ms")
+        return []
+
+    with open(base, encoding='utf-8') as archivo:
+        referencia = json.load(archivo)['resultados']
+    regresiones = comparar_con_base(resultados, referencia, umbral)
+    print(f"{len(regresiones)} regresiones (umbral {umbral:.0%})")
+    return regresiones
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+BENCHMARKS = {
+    'adaptativo': benchmark_adaptativo,
+    'barnes_hut': benchmark_barnes_hut,
+    'mapa_colores': benchmark_mapa_colores,
+    'paralelo': benchmark_paralelo,
+    'precision': benchmark_precision,
+    'suite': benchmark_suite,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks del motor de campo")
+    parser.add_argument('nombre', choices=sorted(BENCHMARKS), nargs='?',
+                        help="benchmark a ejecutar (por defecto, todos)")
+    parser.add_argument('--json', help="suite: archivo JSON donde guardar los resultados")
+    parser.add_argument('--base', help="suite: JSON de línea base con el que comparar")
+    parser.add_argument('--umbral', type=float, default=UMBRAL_REGRESION,
+                        help="suite: tiempo extra tolerado (0.2 = 20 %%)")
+    args = parser.parse_args()
+
+    regresiones = []
+    for nombre in ([args.nombre] if args.nombre else sorted(BENCHMARKS)):
+        print(f"\n=== {nombre} ===")
+        if nombre == 'suite':
+            regresiones = benchmark_suite(args.json, args.base, args.umbral)
+        else:
+            BENCHMARKS[nombre]()
+    sys.exit(1 if regresiones else 0)
@@ -0,0 +1,217 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Caché LRU de campos eléctricos ya calculados
+
+Descripción: Los sliders (en la GUI y en el notebook) vuelven una y otra vez
+a las mismas posiciones. Este módulo guarda los resultados (por defecto
+Ex, Ey, |E|; cualquier tupla de arrays que devuelva la función de cálculo)
+indexados por la configuración de cargas, con las posiciones cuantizadas a
+la resolución del slider, y por los parámetros de la malla (rango,
+resolución, k). Los valores de las cargas nunca se cuantizan: una carga de
+0.04 no comparte clave con una de 0. Si la
+configuración ya se calculó, se devuelven los arrays guardados como vistas
+de solo lectura, sin recalcular nada.
+
+El campo de una entrada siempre se calcula en las posiciones que forman su
+clave (las cuantizadas), así que dos escenas que comparten clave comparten
+también el campo correcto. Con paso=None las claves usan las posiciones
+exactas: es lo que conviene si las cargas pueden venir de fuera de los
+sliders (por ejemplo de un archivo) y no deben moverse al cuantizarlas.
+
+El caché está acotado por número de entradas y por bytes; cuando se supera
+cualquiera de los dos límites se descarta la entrada usada hace más tiempo.
+
+Uso básico:
+
+    from cache_campo import CacheCampo
+    cache = CacheCampo()
+    Ex, Ey, E = cache.obtener([(1, -1, 0), (-1, 1, 0)], rango=5, resolucion=20)
+    print(cache.estadisticas())
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Paso de los sliders (m): las posiciones se redondean a este múltiplo
+PASO_CUANTIZACION = 0.1
+
+# Límites del caché
+MAX_ENTRADAS = 128
+MAX_BYTES = 256 * 2**20
+
+# ============================================================================
+# CLASE DEL CACHÉ
+# ============================================================================
+
+class CacheCampo:
+    """Caché LRU de resultados del campo, acotado por entradas y por bytes"""
+
+    def __init__(self, max_entradas=MAX_ENTRADAS, max_bytes=MAX_BYTES,
+                 paso=PASO_CUANTIZACION):
+        """
+        Parámetros:
+        -----------
+        max_entradas : int
+            Número máximo de configuraciones guardadas
+        max_bytes : int
+            Memoria máxima ocupada por los arrays guardados
+        paso : float o None
+            Resolución de cuantización de las posiciones (None = sin
+            cuantizar, claves con los valores exactos); los valores de las
+            cargas se usan siempre exactos
+        """
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.paso = paso
+
+        self.entradas = OrderedDict()
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def cuantizar(self, cargas):
+        """Redondea las posiciones (pos_x, pos_y) a múltiplos de 'paso'; la carga queda igual"""
+        cargas = motor_campo.preparar_cargas(cargas).copy()
+        if self.paso is not None:
+            cargas[:, 1:] = np.round(cargas[:, 1:] / self.paso) * self.paso
+        return cargas
+
+    def clave(self, cargas, rango, resolucion, k=1.0):
+        """Clave del caché: cargas exactas, posiciones cuantizadas y parámetros de la malla"""
+        cargas = motor_campo.preparar_cargas(cargas)
+        valores = np.ascontiguousarray(cargas[:, 0] + 0.0)   # -0.0 y 0.0, misma clave
+        if self.paso is None:
+            posiciones = np.ascontiguousarray(cargas[:, 1:] + 0.0)
+        else:
+            posiciones = np.round(cargas[:, 1:] / self.paso).astype(np.int64)
+        return (valores.tobytes(), posiciones.tobytes(), len(cargas),
+                float(rango), int(resolucion), float(k))
+
+    def buscar(self, clave):
+        """
+        Devuelve la tupla de arrays guardada para 'clave', o None.
+
+        Actualiza los contadores de aciertos y fallos.
+        """
+        resultado = self.entradas.get(clave)
+        if resultado is None:
+            self.fallos += 1
+            return None
+        self.entradas.move_to_end(clave)
+        self.aciertos += 1
+        return resultado
+
+    def guardar(self, clave, arrays, copiar=True):
+        """
+        Guarda los arrays en solo lectura y los devuelve.
+
+        Con copiar=True se guardan copias independientes en float64. Con
+        copiar=False se guardan vistas de los mismos datos (por ejemplo los
+        memmaps de un .npz abierto con formato_campo), sin copiar nada; los
+        memmaps no cuentan para max_bytes porque sus datos están en disco.
+
+        Si la entrada sola supera max_bytes no se guarda.
+        """
+        if copiar:
+            guardados = tuple(_copia_solo_lectura(a) for a in arrays)
+        else:
+            guardados = tuple(_vista_solo_lectura(a) for a in arrays)
+        tamano = _bytes_en_memoria(guardados)
+        if tamano > self.max_bytes:
+            return guardados
+
+        if clave in self.entradas:
+            self.bytes -= _bytes_en_memoria(self.entradas.pop(clave))
+        self.entradas[clave] = guardados
+        self.bytes += tamano
+
+        # Descartar las entradas menos usadas hasta cumplir ambos límites
+        while len(self.entradas) > self.max_entradas or self.bytes > self.max_bytes:
+            _, viejos = self.entradas.popitem(last=False)
+            self.bytes -= _bytes_en_memoria(viejos)
+        return guardados
+
+    def obtener(self, cargas, rango, resolucion, k=1.0, calcular=None):
+        """
+        Devuelve la tupla de arrays guardada para las cargas y la malla, o la
+        calcula y la guarda si no está.
+
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Cada fila contiene (carga, pos_x, pos_y)
+        rango, resolucion : float, int
+            Malla np.meshgrid de linspace(-rango, rango, resolucion)
+        k : float
+            Constante de Coulomb
+        calcular : función (cargas) -> tupla de arrays, opcional
+            Cálculo a usar si no hay acierto. Recibe las cargas con las
+            posiciones cuantizadas (las de la clave) y debe calcular en ellas, no en las originales;
+            puede devolver cualquier tupla de arrays (el simulador guarda
+            (Ex, Ey, |E|, V)). Por defecto se calcula (Ex, Ey, |E|) con
+            motor_campo
+
+        Retorna:
+        --------
+        tupla de arrays de numpy (solo lectura)
+            La que devolvió 'calcular' (o el cálculo por defecto) para esta
+            clave; quien llama debe usar siempre la misma forma de tupla
+            para las mismas claves
+        """
+        clave = self.clave(cargas, rango, resolucion, k)
+        resultado = self.buscar(clave)
+        if resultado is not None:
+            return resultado
+
+        if calcular is None:
+            def calcular(cuantizadas):
+                x = np.linspace(-rango, rango, resolucion)
+                X, Y = np.meshgrid(x, x)
+                Ex, Ey = motor_campo.campo_electrico(X, Y, cuantizadas, k)
+                return Ex, Ey, np.sqrt(Ex**2 + Ey**2)
+
+        return self.guardar(clave, calcular(self.cuantizar(cargas)))
+
+    def limpiar(self):
+        """Vacía el caché (los contadores se conservan)"""
+        self.entradas.clear()
+        self.bytes = 0
+
+    def estadisticas(self):
+        """Diccionario con aciertos, fallos, tasa de aciertos, entradas y bytes"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'entradas': len(self.entradas),
+            'bytes': self.bytes,
+        }
+
+
+def _copia_solo_lectura(arr):
+    """Copia independiente de arr marcada como de solo lectura"""
+    copia = np.array(arr, dtype=float, copy=True)
+    copia.flags.writeable = False
+    return copia
+
+
+def _vista_solo_lectura(arr):
+    """Vista de arr (sin copiar los datos) marcada como de solo lectura"""
+    vista = arr.view()
+    vista.flags.writeable = False
+    return vista
+
+
+def _bytes_en_memoria(arrays):
+    """Bytes que ocupan en memoria los arrays (los memmaps están en disco)"""
+    return sum(a.nbytes for a in arrays if not isinstance(a, np.memmap))
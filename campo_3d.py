@@ -0,0 +1,291 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Campo eléctrico de cargas puntuales en 3D
+
+Descripción: Extiende la Ley de Coulomb del motor_campo a cargas y puntos
+en el espacio:
+
+    E(r) = Σᵢ k·qᵢ·(r − rᵢ) / |r − rᵢ|³
+
+Las cargas se dan como filas (carga, pos_x, pos_y, pos_z); las filas de
+tres columnas de las escenas 2D se interpretan en el plano z = 0, donde el
+campo coincide con el de motor_campo.
+
+Hay dos formas de usarlo:
+
+    - campo_en_volumen: evalúa una malla de resolucion³ puntos por bloques
+      de planos z (nunca construye la malla 3D completa), en memoria o en
+      archivos .npy mapeados, con memoria auxiliar acotada.
+    - corte_plano: evalúa solo un plano x, y o z = constante; es lo que usa
+      el visor de cortes para no calcular el volumen entero.
+
+Uso:
+
+    python campo_3d.py --resolucion 256
+    python campo_3d.py --resolucion 512 --salida volumen --png corte.png
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from motor_campo import PRECISIONES, TAM_BLOQUE, acumular_campo, bloques, validar_salidas
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Puntos del volumen evaluados a la vez (un bloque de planos z); acota la
+# memoria de las coordenadas de cada bloque
+PUNTOS_POR_BLOQUE = 1 << 20
+
+# Archivos de un volumen guardado en disco
+COMPONENTES_3D = ('Ex', 'Ey', 'Ez', 'E')
+METADATOS = 'metadatos.json'
+
+# Ejes de cada corte: normal -> (eje horizontal, eje vertical) del plano
+EJES_CORTE = {'x': ('y', 'z'), 'y': ('x', 'z'), 'z': ('x', 'y')}
+
+# ============================================================================
+# NÚCLEO DE COULOMB EN 3D
+# ============================================================================
+
+def preparar_cargas_3d(cargas):
+    """
+    Convierte una colección de cargas a un array de NumPy de forma (N, 4).
+
+    Parámetros:
+    -----------
+    cargas : lista de tuplas o array de numpy
+        Filas (carga, pos_x, pos_y, pos_z), o (carga, pos_x, pos_y) para
+        cargas en el plano z = 0
+
+    Retorna:
+    --------
+    array de numpy (N, 4)
+        Columnas: carga, pos_x, pos_y, pos_z
+    """
+    cargas = np.asarray(cargas, dtype=float)
+    if cargas.size == 0:
+        return np.zeros((0, 4))
+    cargas = np.atleast_2d(cargas)
+    if cargas.ndim == 2 and cargas.shape[1] == 3:
+        cargas = np.column_stack([cargas, np.zeros(len(cargas))])
+    if cargas.ndim != 2 or cargas.shape[1] != 4:
+        raise ValueError("cargas debe tener forma (N, 4): (carga, pos_x, pos_y, pos_z)")
+    return cargas
+
+
+def campo_electrico_3d(x, y, z, cargas, k=1.0, out=None, tam_bloque=TAM_BLOQUE,
+                       dtype=np.float64):
+    """
+    Calcula el campo eléctrico en los puntos (x, y, z).
+
+    Usa el mismo núcleo que motor_campo (acumular_campo con tres ejes): los
+    pares (punto, carga) se recorren en bloques de a lo más 'tam_bloque'
+    sobre buffers reservados una sola vez, y las restas punto − carga se
+    hacen en float64 antes de pasar a 'dtype'.
+
+    Parámetros:
+    -----------
+    x, y, z : arrays de numpy
+        Coordenadas de los puntos (cualquier forma, la misma para los tres)
+    cargas : lista de tuplas o array de numpy (N, 4) o (N, 3)
+        Ver preparar_cargas_3d
+    k : float
+        Constante de Coulomb
+    out : tupla (Ex, Ey, Ez), opcional
+        Arrays contiguos con la forma de x donde escribir el resultado
+    tam_bloque : int
+        Número máximo de pares (punto, carga) evaluados a la vez
+    dtype : np.float64 o np.float32
+        Precisión del cálculo y de los resultados
+
+    Retorna:
+    --------
+    Ex, Ey, Ez : arrays de numpy
+        Componentes del campo eléctrico, con la forma de x
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in PRECISIONES:
+        raise ValueError("dtype debe ser np.float64 o np.float32")
+
+    x, y, z = (np.asarray(c) for c in (x, y, z))
+    if not x.shape == y.shape == z.shape:
+        raise ValueError("x, y y z deben tener la misma forma")
+    cargas = preparar_cargas_3d(cargas)
+
+    if out is None:
+        resultado = tuple(np.zeros(x.shape, dtype=dtype) for _ in range(3))
+    else:
+        resultado = tuple(out)
+        validar_salidas(resultado, 3, x.shape, dtype)
+        for arr in resultado:
+            arr[...] = 0.0
+
+    if x.size > 0 and len(cargas) > 0:
+        puntos = tuple(c.reshape(-1) for c in (x, y, z))
+        acumular_campo(puntos, cargas, k, tuple(arr.reshape(-1) for arr in resultado),
+                       tam_bloque, dtype)
+    return resultado
+
+
+# ============================================================================
+# CORTES PLANOS
+# ============================================================================
+
+def corte_plano(cargas, k=1.0, rango=5, resolucion=256, eje='z', posicion=0.0,
+                dtype=np.float64):
+    """
+    Evalúa el campo solo en el plano perpendicular a 'eje' en 'posicion'.
+
+    El plano es la malla np.meshgrid(u, u) con u = linspace(-rango, rango,
+    resolucion); sus ejes horizontal y vertical son los de EJES_CORTE[eje]
+    (por ejemplo, para eje='y' son x y z).
+
+    Retorna:
+    --------
+    U, W : arrays de numpy (resolucion, resolucion)
+        Coordenadas horizontal y vertical del plano
+    Ex, Ey, Ez : arrays de numpy (resolucion, resolucion)
+        Las tres componentes del campo en el plano
+    """
+    if eje not in EJES_CORTE:
+        raise ValueError("eje debe ser 'x', 'y' o 'z'")
+    u = np.linspace(-rango, rango, resolucion)
+    U, W = np.meshgrid(u, u)
+    P = np.full_like(U, posicion)
+    coordenadas = {'x': (P, U, W), 'y': (U, P, W), 'z': (U, W, P)}[eje]
+    return (U, W) + campo_electrico_3d(*coordenadas, cargas, k, dtype=dtype)
+
+# ============================================================================
+# VOLUMEN POR BLOQUES DE PLANOS
+# ============================================================================
+
+def campo_en_volumen(cargas, k=1.0, rango=5, resolucion=256, dtype=np.float32,
+                     directorio=None, puntos_por_bloque=PUNTOS_POR_BLOQUE,
+                     workers=1, informar=False):
+    """
+    Calcula Ex, Ey, Ez y |E| en una malla de resolucion³ puntos.
+
+    Los arrays tienen índices [iz, iy, ix] sobre u = linspace(-rango,
+    rango, resolucion) en cada eje. El volumen se recorre en bloques de
+    planos z: cada bloque genera sus coordenadas, se evalúa y se escribe en
+    su rebanada de la salida, así que la memoria auxiliar no depende de la
+    resolución.
+
+    Parámetros:
+    -----------
+    cargas : lista de tuplas o array de numpy (N, 4) o (N, 3)
+        Ver preparar_cargas_3d
+    k : float
+        Constante de Coulomb
+    rango, resolucion : float, int
+        Parámetros de np.linspace en cada eje
+    dtype : np.float32 o np.float64
+        Tipo de los resultados y del cálculo
+    directorio : str, opcional
+        Si se da, los resultados se escriben en Ex.npy, Ey.npy, Ez.npy y
+        E.npy (np.memmap) de esa carpeta, junto con metadatos.json
+    puntos_por_bloque : int
+        Puntos del volumen evaluados a la vez (al menos un plano)
+    workers : int
+        Bloques evaluados en paralelo (hilos: NumPy libera el GIL)
+    informar : bool
+        Si es True se imprime el progreso
+
+    Retorna:
+    --------
+    Ex, Ey, Ez, E : arrays de numpy (resolucion, resolucion, resolucion)
+    """
+    cargas = preparar_cargas_3d(cargas)
+    dtype = np.dtype(dtype)
+    forma = (resolucion,) * 3
+
+    if directorio is None:
+        salidas = tuple(np.empty(forma, dtype=dtype) for _ in COMPONENTES_3D)
+    else:
+        os.makedirs(directorio, exist_ok=True)
+        metadatos = {
+            'rango': float(rango),
+            'resolucion': int(resolucion),
+            'k': float(k),
+            'dtype': dtype.name,
+            'cargas': cargas.tolist(),
+        }
+        with open(os.path.join(directorio, METADATOS), 'w', encoding='utf-8') as archivo:
+            json.dump(metadatos, archivo, indent=2)
+        salidas = tuple(np.lib.format.open_memmap(os.path.join(directorio, nombre + '.npy'),
+                                                  mode='w+', dtype=dtype, shape=forma)
+                        for nombre in COMPONENTES_3D)
+    Ex, Ey, Ez, E = salidas
+
+    u = np.linspace(-rango, rango, resolucion)
+    planos = max(1, min(resolucion, puntos_por_bloque // resolucion**2))
+    inicio = time.perf_counter()
+
+    def calcular_bloque(intervalo):
+        a, b = intervalo
+        Z, Y, X = np.meshgrid(u[a:b], u, u, indexing='ij')
+        campo_electrico_3d(X, Y, Z, cargas, k, out=(Ex[a:b], Ey[a:b], Ez[a:b]), dtype=dtype)
+
+        # |E| = sqrt(Ex² + Ey² + Ez²) sin arrays temporales del tamaño del bloque
+        np.hypot(Ex[a:b], Ey[a:b], out=E[a:b])
+        np.hypot(E[a:b], Ez[a:b], out=E[a:b])
+        return b
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for b in pool.map(calcular_bloque, bloques(resolucion, planos)):
+            if informar:
+                transcurrido = time.perf_counter() - inicio
+                print(f"  planos {b}/{resolucion}  "
+                      f"({b * resolucion**2 / transcurrido / 1e6:.1f} Mpuntos/s)")
+
+    if directorio is not None:
+        for arr in salidas:
+            arr.flush()
+    return salidas
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Campo del dipolo en un volumen 3D")
+    parser.add_argument('--resolucion', type=int, default=256)
+    parser.add_argument('--rango', type=float, default=5)
+    parser.add_argument('--salida', help="carpeta donde guardar el volumen (.npy mapeados)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--float64', action='store_true', help="calcular en doble precisión")
+    parser.add_argument('--png', help="dibujar |E| en el plano y = 0 del volumen")
+    args = parser.parse_args()
+
+    cargas = [(1.0, -1.0, 0.0, 0.0), (-1.0, 1.0, 0.0, 0.0)]
+    n = args.resolucion
+    print(f"🧊 Volumen {n}×{n}×{n} ({n**3 / 1e6:.1f} M puntos)")
+    inicio = time.perf_counter()
+    Ex, Ey, Ez, E = campo_en_volumen(cargas, rango=args.rango, resolucion=n,
+                                     dtype=np.float64 if args.float64 else np.float32,
+                                     directorio=args.salida, workers=args.workers,
+                                     informar=True)
+    print(f"✅ {time.perf_counter() - inicio:.2f} s")
+
+    if args.png:
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.colors import LogNorm
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 8))
+        ax = fig.add_subplot()
+        ax.imshow(E[:, n // 2, :], origin='lower', cmap='viridis',
+                  extent=(-args.rango, args.rango, -args.rango, args.rango),
+                  norm=LogNorm(vmin=1e-2, vmax=1e2, clip=True))
+        ax.set_xlabel('x (m)')
+        ax.set_ylabel('z (m)')
+        ax.set_title('|E| en el plano y ≈ 0')
+        fig.savefig(args.png, dpi=100)
+        print(f"🖼️  {args.png}")
@@ -0,0 +1,301 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Campo eléctrico en disco para mallas muy grandes (fuera de memoria)
+
+Descripción: Con resoluciones de póster (por ejemplo 20000×20000) la malla
+de np.meshgrid y los arrays Ex, Ey, |E| ocupan decenas de GB. Este módulo
+nunca construye la malla completa: recorre el dominio por teselas de filas,
+genera las coordenadas de cada tesela a partir de los parámetros de
+np.linspace y escribe Ex, Ey y |E| directamente en archivos .npy abiertos
+como np.memmap. La memoria usada queda acotada por el tamaño de la tesela.
+
+Los resultados pueden exportarse a un PNG del tamaño completo, escrito fila
+por fila (también con memoria acotada), o submuestrearse para una vista
+previa.
+
+Estructura de la carpeta de salida:
+
+    metadatos.json    rango, resolucion, k, dtype y cargas
+    Ex.npy, Ey.npy    componentes del campo (resolucion × resolucion)
+    E.npy             magnitud del campo
+
+Uso:
+
+    python campo_disco.py --resolucion 20000 --salida poster --png poster.png
+"""
+import argparse
+import json
+import os
+import struct
+import time
+import zlib
+
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Puntos por tesela: con float64 las coordenadas de una tesela ocupan 64 MB
+PUNTOS_POR_TESELA = 1 << 22
+
+# Archivos de la carpeta de salida
+COMPONENTES = ('Ex', 'Ey', 'E')
+METADATOS = 'metadatos.json'
+
+# Escala de colores por defecto (la misma del simulador en modo logarítmico)
+MAGNITUD_MIN = 1e-2
+MAGNITUD_MAX = 1e2
+
+# ============================================================================
+# CAMPO GUARDADO EN DISCO
+# ============================================================================
+
+class CampoEnMalla:
+    """
+    Parámetros de una malla np.meshgrid(linspace(-rango, rango, resolucion))
+    y las cargas que generan su campo.
+
+    Base de los campos que usa exportar_png: las subclases agregan las
+    mallas Ex, Ey y E (arrays o memmaps de resolucion × resolucion).
+    """
+
+    def __init__(self, rango, resolucion, k, cargas):
+        """
+        Parámetros:
+        -----------
+        rango, resolucion : float, int
+            Parámetros de np.linspace en cada eje
+        k : float
+            Constante de Coulomb
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Cada fila contiene (carga, pos_x, pos_y)
+        """
+        self.rango = rango
+        self.resolucion = resolucion
+        self.k = k
+        self.cargas = motor_campo.preparar_cargas(cargas)
+
+    def coordenadas(self):
+        """Coordenadas 1D de columnas y filas (las de np.linspace)"""
+        x = np.linspace(-self.rango, self.rango, self.resolucion)
+        return x, x.copy()
+
+    def submuestrear(self, max_lado=1000, componente='E'):
+        """
+        Vista reducida para previsualizar: una de cada 'paso' filas y columnas.
+
+        Retorna:
+        --------
+        x, y, valores : arrays de numpy (en memoria)
+        """
+        datos = getattr(self, componente)
+        if datos is None:
+            raise ValueError(f"El campo no tiene la malla '{componente}'")
+        paso = max(1, -(-self.resolucion // max_lado))
+        x, y = self.coordenadas()
+        return x[::paso], y[::paso], np.array(datos[::paso, ::paso])
+
+
+class CampoEnDisco(CampoEnMalla):
+    """Campo (Ex, Ey, |E|) guardado como archivos .npy mapeados en memoria"""
+
+    def __init__(self, directorio, modo='r'):
+        """
+        Abre un campo calculado con calcular_en_disco.
+
+        Parámetros:
+        -----------
+        directorio : str
+            Carpeta con metadatos.json y los archivos .npy
+        modo : str
+            Modo de np.memmap: 'r' (solo lectura) o 'r+' (lectura y escritura)
+        """
+        self.directorio = directorio
+        with open(os.path.join(directorio, METADATOS), encoding='utf-8') as archivo:
+            metadatos = json.load(archivo)
+        super().__init__(metadatos['rango'], metadatos['resolucion'], metadatos['k'],
+                         metadatos['cargas'])
+
+        for nombre in COMPONENTES:
+            ruta = os.path.join(directorio, nombre + '.npy')
+            setattr(self, nombre, np.load(ruta, mmap_mode=modo))
+
+# ============================================================================
+# CÁLCULO POR TESELAS
+# ============================================================================
+
+def _filas_por_tesela(resolucion, puntos_por_tesela):
+    """Número de filas de la malla que caben en una tesela"""
+    return max(1, min(resolucion, puntos_por_tesela // resolucion))
+
+
+def calcular_en_disco(directorio, cargas, k=1.0, rango=5, resolucion=20000,
+                      dtype=np.float32, puntos_por_tesela=PUNTOS_POR_TESELA,
+                      workers=1, informar=True):
+    """
+    Calcula Ex, Ey y |E| sobre una malla enorme escribiendo en disco.
+
+    La malla es la de np.meshgrid(linspace(-rango, rango, resolucion), ...)
+    pero nunca se construye completa: cada tesela de filas genera sus
+    coordenadas, se evalúa con motor_campo y se escribe en los memmaps.
+
+    Parámetros:
+    -----------
+    directorio : str
+        Carpeta de salida (se crea si no existe)
+    cargas : lista de tuplas o array de numpy (N, 3)
+        Cada fila contiene (carga, pos_x, pos_y)
+    k : float
+        Constante de Coulomb
+    rango, resolucion : float, int
+        Parámetros de np.linspace de la malla
+    dtype : np.float32 o np.float64
+        Tipo de los archivos y del cálculo
+    puntos_por_tesela : int
+        Puntos evaluados a la vez (acota la memoria usada)
+    workers : int o None
+        Workers de motor_campo dentro de cada tesela
+    informar : bool
+        Si es True se imprime el progreso
+
+    Retorna:
+    --------
+    CampoEnDisco
+        El campo recién calculado, abierto en solo lectura
+    """
+    os.makedirs(directorio, exist_ok=True)
+    cargas = motor_campo.preparar_cargas(cargas)
+    dtype = np.dtype(dtype)
+
+    metadatos = {
+        'rango': float(rango),
+        'resolucion': int(resolucion),
+        'k': float(k),
+        'dtype': dtype.name,
+        'cargas': cargas.tolist(),
+    }
+    with open(os.path.join(directorio, METADATOS), 'w', encoding='utf-8') as archivo:
+        json.dump(metadatos, archivo, indent=2)
+
+    forma = (resolucion, resolucion)
+    Ex, Ey, E = (np.lib.format.open_memmap(os.path.join(directorio, nombre + '.npy'),
+                                           mode='w+', dtype=dtype, shape=forma)
+                 for nombre in COMPONENTES)
+
+    x = np.linspace(-rango, rango, resolucion)
+    filas = _filas_por_tesela(resolucion, puntos_por_tesela)
+    inicio = time.perf_counter()
+
+    for a in range(0, resolucion, filas):
+        b = min(a + filas, resolucion)
+
+        # Coordenadas solo de esta tesela (misma fórmula que np.linspace)
+        X, Y = np.meshgrid(x, x[a:b])
+        motor_campo.campo_electrico(X, Y, cargas, k, out=(Ex[a:b], Ey[a:b]),
+                                    workers=workers, dtype=dtype)
+        np.hypot(Ex[a:b], Ey[a:b], out=E[a:b])
+
+        if informar:
+            transcurrido = time.perf_counter() - inicio
+            print(f"  filas {b}/{resolucion}  ({b * resolucion / transcurrido / 1e6:.1f} Mpuntos/s)")
+
+    for arr in (Ex, Ey, E):
+        arr.flush()
+    del Ex, Ey, E
+    return CampoEnDisco(directorio)
+
+# ============================================================================
+# EXPORTACIÓN A PNG CON MEMORIA ACOTADA
+# ============================================================================
+
+def _bloque_png(tipo, datos):
+    """Bloque PNG: longitud, tipo, datos y CRC"""
+    return (struct.pack('>I', len(datos)) + tipo + datos +
+            struct.pack('>I', zlib.crc32(tipo + datos) & 0xffffffff))
+
+
+def exportar_png(campo, ruta, componente='E', cmap='hot', vmin=MAGNITUD_MIN,
+                 vmax=MAGNITUD_MAX, escala='log', filas_por_bloque=256):
+    """
+    Escribe la malla completa como PNG RGB, un bloque de filas a la vez.
+
+    El PNG se comprime en flujo con zlib, de modo que nunca hay en memoria
+    más que 'filas_por_bloque' filas de la imagen.
+
+    Parámetros:
+    -----------
+    campo : CampoEnMalla
+        Campo con la malla 'componente', por ejemplo un CampoEnDisco o un
+        formato_campo.CampoGuardado
+    ruta : str
+        Archivo PNG de salida
+    componente : str
+        'E', 'Ex' o 'Ey'
+    cmap : str
+        Nombre del mapa de colores de matplotlib
+    vmin, vmax : float
+        Valores que corresponden a los extremos del mapa de colores
+    escala : str
+        'log' o 'lineal'
+    filas_por_bloque : int
+        Filas de la imagen procesadas a la vez
+    """
+    import matplotlib
+    from matplotlib.colors import LogNorm, Normalize
+
+    datos = getattr(campo, componente)
+    alto, ancho = datos.shape
+    mapa = matplotlib.colormaps[cmap]
+    norma = (LogNorm if escala == 'log' else Normalize)(vmin=vmin, vmax=vmax, clip=True)
+
+    compresor = zlib.compressobj(6)
+    with open(ruta, 'wb') as archivo:
+        archivo.write(b'\x89PNG\r\n\x1a\n')
+        archivo.write(_bloque_png(b'IHDR', struct.pack('>IIBBBBB', ancho, alto, 8, 2, 0, 0, 0)))
+
+        # La primera fila del PNG es la de y máxima: se recorre de arriba abajo
+        for b in range(alto, 0, -filas_por_bloque):
+            a = max(0, b - filas_por_bloque)
+            rgb = mapa(norma(np.asarray(datos[a:b][::-1])), bytes=True)[..., :3]
+
+            # Cada fila del PNG empieza con el byte de filtro (0 = ninguno)
+            filas = np.zeros((b - a, 1 + 3 * ancho), dtype=np.uint8)
+            filas[:, 1:] = rgb.reshape(b - a, -1)
+            comprimido = compresor.compress(filas.tobytes())
+            if comprimido:
+                archivo.write(_bloque_png(b'IDAT', comprimido))
+
+        archivo.write(_bloque_png(b'IDAT', compresor.flush()))
+        archivo.write(_bloque_png(b'IEND', b''))
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Campo del dipolo en disco para mallas enormes")
+    parser.add_argument('--salida', default='campo_disco', help="carpeta de salida")
+    parser.add_argument('--resolucion', type=int, default=20000)
+    parser.add_argument('--rango', type=float, default=5)
+    parser.add_argument('--x1', type=float, default=-1.0)
+    parser.add_argument('--y1', type=float, default=0.0)
+    parser.add_argument('--x2', type=float, default=1.0)
+    parser.add_argument('--y2', type=float, default=0.0)
+    parser.add_argument('--q', type=float, default=1.0)
+    parser.add_argument('--float64', action='store_true', help="calcular en doble precisión")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--png', help="exportar además |E| a este PNG")
+    args = parser.parse_args()
+
+    cargas = [(args.q, args.x1, args.y1), (-args.q, args.x2, args.y2)]
+    print(f"💾 Calculando {args.resolucion}×{args.resolucion} en {args.salida}/")
+    campo = calcular_en_disco(args.salida, cargas, rango=args.rango,
+                              resolucion=args.resolucion, workers=args.workers,
+                              dtype=np.float64 if args.float64 else np.float32)
+    if args.png:
+        print(f"🖼️  Exportando {args.png}")
+        exportar_png(campo, args.png)
+    print("✅ Listo")
@@ -0,0 +1,178 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Actualización incremental del campo eléctrico
+
+Descripción: Cuando el usuario arrastra un slider solo se mueve una carga,
+pero recalcular todo el campo cuesta lo mismo que si se hubieran movido
+todas. Este módulo guarda la contribución (Ex, Ey) de cada carga sobre la
+malla; al moverse una carga se resta su contribución anterior y se suma la
+nueva, de modo que el costo de cada actualización es proporcional al número
+de cargas que cambiaron.
+
+Como las restas y sumas repetidas acumulan error de redondeo, cada cierto
+número de actualizaciones se vuelve a sumar el campo completo a partir de
+las contribuciones guardadas.
+
+También se mantiene el potencial V, que sale del mismo recorrido que el
+campo (motor_campo.campo_y_potencial).
+
+Memoria: se guardan 3·N arrays del tamaño de la malla (N = número de cargas).
+"""
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Actualizaciones incrementales antes de volver a sumar el campo completo
+RECALCULO_CADA = 200
+
+# ============================================================================
+# CLASE DEL CAMPO INCREMENTAL
+# ============================================================================
+
+class CampoIncremental:
+    """Campo eléctrico sobre una malla fija que se actualiza carga por carga"""
+
+    def __init__(self, x, y, cargas, k=1.0, recalculo_cada=RECALCULO_CADA,
+                 workers=1, backend='hilos'):
+        """
+        Calcula el campo inicial y las contribuciones de cada carga.
+
+        Parámetros:
+        -----------
+        x, y : arrays de numpy
+            Coordenadas de la malla (fija durante toda la vida del objeto)
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Cada fila contiene (carga, pos_x, pos_y)
+        k : float
+            Constante de Coulomb
+        recalculo_cada : int
+            Actualizaciones incrementales entre dos sumas completas
+        workers : int o None
+            Workers con que motor_campo evalúa cada contribución (None =
+            todos los núcleos)
+        backend : str
+            'hilos' o 'procesos' (ver motor_campo.campo_electrico)
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.k = k
+        self.recalculo_cada = max(1, int(recalculo_cada))
+        self.workers = workers
+        self.backend = backend
+
+        self.V = np.zeros(self.x.shape)
+        self.Ex = np.zeros(self.x.shape)
+        self.Ey = np.zeros(self.y.shape)
+        self.cargas = np.zeros((0, 3))
+        self.contribuciones = np.zeros((0, 3) + self.x.shape)
+        self.actualizaciones = 0
+
+        self.recalcular(cargas)
+
+    def _contribucion(self, carga, out):
+        """Escribe en out = (Ex_i, Ey_i, V_i) el campo y potencial de una carga"""
+        motor_campo.campo_y_potencial(self.x, self.y, carga[None, :], self.k,
+                                      out=(out[2], out[0], out[1]),
+                                      workers=self.workers, backend=self.backend)
+
+    def recalcular(self, cargas=None):
+        """
+        Recalcula desde cero todas las contribuciones y el campo total.
+
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3), opcional
+            Nuevas cargas; si se omite se usan las actuales
+
+        Retorna:
+        --------
+        Ex, Ey : arrays de numpy (solo lectura)
+        """
+        if cargas is not None:
+            self.cargas = motor_campo.preparar_cargas(cargas).copy()
+
+        n = len(self.cargas)
+        if self.contribuciones.shape[0] != n:
+            self.contribuciones = np.empty((n, 3) + self.x.shape)
+        for i in range(n):
+            self._contribucion(self.cargas[i], self.contribuciones[i])
+
+        self._sumar_contribuciones()
+        return self.campo()
+
+    def _sumar_contribuciones(self):
+        """Suma exacta del campo total a partir de las contribuciones guardadas"""
+        if len(self.cargas) == 0:
+            self.Ex[...] = 0.0
+            self.Ey[...] = 0.0
+            self.V[...] = 0.0
+        else:
+            np.sum(self.contribuciones[:, 0], axis=0, out=self.Ex)
+            np.sum(self.contribuciones[:, 1], axis=0, out=self.Ey)
+            np.sum(self.contribuciones[:, 2], axis=0, out=self.V)
+        self.actualizaciones = 0
+
+    def actualizar(self, cargas):
+        """
+        Actualiza el campo con una nueva configuración de cargas.
+
+        Solo se recalculan las cargas cuya fila cambió. Si cambia el número
+        de cargas se recalcula todo.
+
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Configuración completa de cargas
+
+        Retorna:
+        --------
+        Ex, Ey : arrays de numpy (solo lectura)
+        """
+        cargas = motor_campo.preparar_cargas(cargas)
+        if cargas.shape != self.cargas.shape:
+            return self.recalcular(cargas)
+
+        cambiadas = np.flatnonzero(np.any(cargas != self.cargas, axis=1))
+        if len(cambiadas) == 0:
+            return self.campo()
+
+        nueva = np.empty((3,) + self.x.shape)
+        for i in cambiadas:
+            self._contribucion(cargas[i], nueva)
+            anterior = self.contribuciones[i]
+
+            # Restar la contribución anterior y sumar la nueva
+            self.Ex -= anterior[0]
+            self.Ex += nueva[0]
+            self.Ey -= anterior[1]
+            self.Ey += nueva[1]
+            self.V -= anterior[2]
+            self.V += nueva[2]
+            anterior[...] = nueva
+            self.cargas[i] = cargas[i]
+
+        # Suma completa periódica para acotar la deriva de redondeo
+        self.actualizaciones += 1
+        if self.actualizaciones >= self.recalculo_cada:
+            self._sumar_contribuciones()
+
+        return self.campo()
+
+    def campo(self):
+        """Devuelve (Ex, Ey) como vistas de solo lectura del campo actual"""
+        return _solo_lectura(self.Ex), _solo_lectura(self.Ey)
+
+    def potencial(self):
+        """Devuelve el potencial actual como vista de solo lectura"""
+        return _solo_lectura(self.V)
+
+
+def _solo_lectura(arr):
+    """Vista de arr que no permite escribir"""
+    vista = arr.view()
+    vista.flags.writeable = False
+    return vista
@@ -14,17 +14,36 @@ eléctrico (dos cargas de igual magnitud y signo opuesto). Permite modificar
 interactivamente la posición y separación de las cargas usando una interfaz
 gráfica moderna con CustomTkinter.
 
+La escena no se limita al dipolo: se pueden agregar, quitar y arrastrar con
+el ratón cualquier número de cargas de magnitud arbitraria, o abrir una
+escena desde un archivo CSV/JSON (ver escena.py). Las cargas con altura z
+se dibujan proyectadas sobre el plano; el visor de cortes 3D usa su z.
+
 
 """
+import argparse
+import time
 import tkinter as tk
+from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.colors import LogNorm, Normalize
 import matplotlib
 matplotlib.use('TkAgg')
 
+import motor_campo
+from cache_campo import CacheCampo, PASO_CUANTIZACION
+from campo_incremental import CampoIncremental
+from escena import EscenaCargas
+from formato_campo import abrir_campo, guardar_campo
+from lineas_campo import LINEAS_POR_CARGA, trazar_lineas
+from muestreo_adaptativo import MuestreoAdaptativo
+from perfilado import PerfilCuadros
+from visor_cortes import VisorCortes
+
 # ============================================================================
 # CONFIGURACIÓN INICIAL DEL TEMA
 # ============================================================================
@@ -32,6 +51,128 @@ matplotlib.use('TkAgg')
 ctk.set_appearance_mode("dark")  # Modo oscuro por defecto
 ctk.set_default_color_theme("blue")  # Tema azul
 
+# ============================================================================
+# MODOS DEL MAPA DE COLORES
+# ============================================================================
+
+MAPA_CONTORNOS = "Contornos"
+MAPA_IMAGEN = "Imagen"
+MAPA_IMAGEN_LOG = "Imagen (log)"
+MAPA_FINO = "Imagen (fina)"
+
+# Resolución del modo fino: |E| se muestrea con el árbol adaptativo de
+# muestreo_adaptativo (hojas de al menos un píxel) y se remuestrea a esta malla
+RESOLUCION_FINA = 400
+
+# Máximo de flechas por lado del gráfico (en mallas más finas se submuestrea)
+FLECHAS_POR_LADO = 25
+
+# Niveles de las curvas equipotenciales, en unidades de k·q (V = k·q/r)
+NIVELES_EQUIPOTENCIALES = np.array([-2, -1, -0.5, -0.25, -0.1, 0,
+                                    0.1, 0.25, 0.5, 1, 2])
+
+# Límites fijos de la escala logarítmica (N/C), para no renormalizar cada cuadro
+MAGNITUD_LOG_MIN = 1e-2
+MAGNITUD_LOG_MAX = 1e2
+
+# ============================================================================
+# CARGAS DE LA ESCENA
+# ============================================================================
+
+# Radio de los círculos que dibujan las cargas
+RADIO_CARGA = 0.2
+
+# Distancia máxima (m) de un clic a una carga para seleccionarla
+RADIO_SELECCION = 0.4
+
+# Límite de las posiciones (el de los sliders)
+POSICION_MAXIMA = 4.5
+
+# Mayor resolución con que se muestra un campo guardado (.npz); los campos
+# más grandes se muestran submuestreados a esta resolución
+RESOLUCION_MAXIMA_GUARDADA = 1000
+
+# Mallas hasta esta resolución usan un campo incremental (3 mallas por
+# carga); en las más grandes, las de un .npz abierto, el campo se calcula
+# completo cuando cambian las cargas
+RESOLUCION_INCREMENTAL = 200
+
+# Total aproximado de líneas de campo: con muchas cargas se trazan menos
+# líneas por carga para que el costo no crezca con N
+LINEAS_TOTALES = 160
+
+
+def al_paso(valor):
+    """Redondea al paso de los sliders (el mismo float venga del slider o del ratón)"""
+    return round(float(valor) / PASO_CUANTIZACION) * PASO_CUANTIZACION
+
+# ============================================================================
+# PLANIFICADOR DE REDIBUJADO
+# ============================================================================
+
+class PlanificadorRedibujado:
+    """Agrupa los eventos de los sliders y limita la frecuencia de redibujado"""
+    
+    def __init__(self, widget, dibujar, fps_max=30, espera_refinado_ms=150):
+        """
+        Parámetros:
+        -----------
+        widget : widget de Tk
+            Widget cuyo bucle de eventos se usa para programar (after)
+        dibujar : función
+            Se llama como dibujar(preliminar=True/False)
+        fps_max : float
+            Máximo de cuadros preliminares por segundo durante el arrastre
+        espera_refinado_ms : int
+            Tiempo sin eventos tras el cual se dibuja en calidad completa
+        """
+        self.widget = widget
+        self.dibujar = dibujar
+        self.intervalo_ms = 1000.0 / fps_max
+        self.espera_refinado_ms = espera_refinado_ms
+        
+        self.pendiente = False
+        self.id_cuadro = None
+        self.id_refinado = None
+        self.ultimo_cuadro = 0.0
+    
+    def solicitar(self):
+        """Registra un cambio; el dibujo real se hace después, una sola vez"""
+        self.pendiente = True
+        
+        # Programar el siguiente cuadro preliminar respetando fps_max
+        if self.id_cuadro is None:
+            transcurrido = (time.perf_counter() - self.ultimo_cuadro) * 1000
+            espera = int(max(0, self.intervalo_ms - transcurrido))
+            if espera == 0:
+                self.id_cuadro = self.widget.after_idle(self._cuadro_preliminar)
+            else:
+                self.id_cuadro = self.widget.after(espera, self._cuadro_preliminar)
+        
+        # Reiniciar el temporizador de refinado: se dispara cuando el
+        # slider deja de moverse
+        if self.id_refinado is not None:
+            self.widget.after_cancel(self.id_refinado)
+        self.id_refinado = self.widget.after(self.espera_refinado_ms, self._refinar)
+    
+    def _cuadro_preliminar(self):
+        """Dibuja el último estado en baja resolución"""
+        self.id_cuadro = None
+        if not self.pendiente:
+            return
+        self.pendiente = False
+        self.ultimo_cuadro = time.perf_counter()
+        self.dibujar(preliminar=True)
+    
+    def _refinar(self):
+        """Dibuja el estado final en calidad completa"""
+        self.id_refinado = None
+        if self.id_cuadro is not None:
+            self.widget.after_cancel(self.id_cuadro)
+            self.id_cuadro = None
+        self.pendiente = False
+        self.dibujar(preliminar=False)
+
 # ============================================================================
 # CLASE PRINCIPAL DEL SIMULADOR
 # ============================================================================
@@ -39,8 +180,23 @@ ctk.set_default_color_theme("blue")  # Tema azul
 class SimuladorCampoElectrico:
     """Clase principal que maneja toda la interfaz y lógica del simulador"""
     
-    def __init__(self, ventana_principal):
-        """Constructor que inicializa la ventana principal y todos los componentes"""
+    def __init__(self, ventana_principal, archivo_perfil=None, escena=None,
+                 campo_guardado=None):
+        """
+        Constructor que inicializa la ventana principal y todos los componentes
+        
+        Parámetros:
+        -----------
+        ventana_principal : ctk.CTk
+            Ventana de la aplicación
+        archivo_perfil : str, opcional
+            Archivo JSON donde guardar los tiempos por cuadro al cerrar
+        escena : EscenaCargas, opcional
+            Cargas iniciales (por defecto, el dipolo)
+        campo_guardado : formato_campo.CampoGuardado, opcional
+            Campo leído de un .npz con las mismas cargas que 'escena'; el
+            primer cuadro lo dibuja sin recalcular
+        """
         
         self.ventana_principal = ventana_principal
         self.ventana_principal.title("SIMULADOR DE CAMPO ELÉCTRICO - DIPOLO")
@@ -56,38 +212,149 @@ class SimuladorCampoElectrico:
         # Constante de Coulomb (usamos k = 1 para simplificar)
         self.k = 1.0
         
-        # Magnitud de las cargas
+        # Magnitud de las cargas (la del dipolo inicial y la de las nuevas)
         self.q = 1.0
         
-        # Posiciones iniciales de las cargas (variables de Tkinter)
-        self.x1 = tk.DoubleVar(value=-1.0)
-        self.y1 = tk.DoubleVar(value=0.0)
-        self.x2 = tk.DoubleVar(value=1.0)
-        self.y2 = tk.DoubleVar(value=0.0)
+        # Todas las cargas en un solo array (N, 3); al inicio, el dipolo
+        # +q en (-1, 0) y −q en (1, 0)
+        self.escena = escena if escena is not None else EscenaCargas.dipolo(self.q)
+        
+        # Carga seleccionada: la que controlan los sliders y se arrastra
+        self.seleccion = 0
+        self.arrastrando = False
+        
+        # Controles de la carga seleccionada (variables de Tkinter)
+        self.x_sel = tk.DoubleVar(value=0.0)
+        self.y_sel = tk.DoubleVar(value=0.0)
+        self.q_sel = tk.DoubleVar(value=self.q)
         
         # Parámetros de visualización
         self.rango = 5
         self.resolucion = 20
         
-        # Crear malla de puntos
-        x = np.linspace(-self.rango, self.rango, self.resolucion)
-        y = np.linspace(-self.rango, self.rango, self.resolucion)
-        self.X, self.Y = np.meshgrid(x, y)
+        # Forma de dibujar la magnitud del campo
+        self.modo_mapa = tk.StringVar(value=MAPA_CONTORNOS)
+        
+        # Líneas de campo trazadas sobre el mapa (desactivadas por defecto)
+        self.mostrar_lineas = tk.BooleanVar(value=False)
+        
+        # Curvas equipotenciales (desactivadas por defecto)
+        self.mostrar_equipotenciales = tk.BooleanVar(value=False)
+        
+        # Núcleos usados para calcular el campo (None = todos). En mallas
+        # pequeñas el motor calcula en un solo núcleo automáticamente.
+        self.workers = None
+        
+        # Mallas de puntos (completa y de vista previa)
+        self.crear_mallas(self.resolucion)
+        
+        # Campos ya calculados, por posiciones exactas de las cargas y malla.
+        # Los sliders y el ratón dejan las cargas en múltiplos exactos de
+        # PASO_CUANTIZACION (ver al_paso), así que volver a una posición no
+        # recalcula nada; y una escena leída de un archivo, con posiciones
+        # fuera de ese paso, nunca recibe el campo de otra escena cercana.
+        # El modo fino tiene su propio caché, que guarda solo |E|.
+        self.cache = CacheCampo(paso=None)
+        self.cache_fino = CacheCampo(max_entradas=32, paso=None)
+        
+        # Último estado dibujado (cargas, malla) para no repetir cuadros
+        self.ultimo_dibujo = None
+        
+        # Tiempos por etapa de cada cuadro (se muestran con el switch de
+        # rendimiento y se exportan al cerrar si se pidió un archivo)
+        self.perfil = PerfilCuadros()
+        self.archivo_perfil = archivo_perfil
+        self.mostrar_rendimiento = tk.BooleanVar(value=False)
+        self.id_rendimiento = None
+        self.ventana_principal.protocol("WM_DELETE_WINDOW", self.al_cerrar)
+        
+        # Ventana de cortes 3D (se abre con su botón)
+        self.visor_cortes = None
         
         # Crear la interfaz gráfica
         self.crear_interfaz_usuario()
+        self.sincronizar_controles()
+        
+        # Planificador que agrupa los eventos de los sliders
+        self.planificador = PlanificadorRedibujado(
+            self.ventana_principal, self.actualizar_simulacion
+        )
         
         # Actualizar la primera visualización
+        if campo_guardado is not None:
+            self.usar_campo_guardado(campo_guardado)
         self.actualizar_simulacion()
     
     # ============================================================================
     # FUNCIONES PARA CALCULAR EL CAMPO ELÉCTRICO
     # ============================================================================
     
+    def crear_mallas(self, resolucion):
+        """
+        Crea la malla completa y la de vista previa.
+        
+        Parámetros:
+        -----------
+        resolucion : int
+            Puntos por lado de la malla completa
+        """
+        self.resolucion = resolucion
+        
+        # Resolución de la vista previa mientras se arrastra un slider
+        self.resolucion_preliminar = min(self.resolucion, 40)
+        
+        # Crear malla de puntos
+        x = np.linspace(-self.rango, self.rango, self.resolucion)
+        y = np.linspace(-self.rango, self.rango, self.resolucion)
+        self.X, self.Y = np.meshgrid(x, y)
+        
+        # Malla reducida para la vista previa durante el arrastre
+        x_pre = np.linspace(-self.rango, self.rango, self.resolucion_preliminar)
+        y_pre = np.linspace(-self.rango, self.rango, self.resolucion_preliminar)
+        self.X_pre, self.Y_pre = np.meshgrid(x_pre, y_pre)
+        
+        # Campos incrementales de cada malla, por forma; se crean la primera
+        # vez que hace falta calcular (un campo guardado se dibuja sin ellos)
+        self.campos_incrementales = {}
+    
+    def calcular_campo(self, X, Y, cargas):
+        """
+        Calcula (Ex, Ey, |E|, V) sobre la malla X, Y.
+        
+        Hasta RESOLUCION_INCREMENTAL se usa un campo incremental: solo se
+        recalculan las cargas que cambiaron desde la última llamada. En
+        mallas más grandes guardar la contribución de cada carga ocuparía
+        demasiada memoria y el campo se calcula completo.
+        """
+        if X.shape[0] > RESOLUCION_INCREMENTAL:
+            V, Ex, Ey = motor_campo.campo_y_potencial(X, Y, cargas, self.k,
+                                                      workers=self.workers)
+            return Ex, Ey, np.sqrt(Ex**2 + Ey**2), V
+        
+        campo = self.campos_incrementales.get(X.shape)
+        if campo is None:
+            campo = CampoIncremental(X, Y, [], self.k, workers=self.workers)
+            self.campos_incrementales[X.shape] = campo
+        Ex, Ey = campo.actualizar(cargas)
+        return Ex, Ey, np.sqrt(Ex**2 + Ey**2), campo.potencial()
+    
+    def magnitud_fina(self, cargas):
+        """
+        |E| del modo fino sobre una malla RESOLUCION_FINA × RESOLUCION_FINA.
+
+        El árbol adaptativo evalúa el campo solo donde varía (junto a las
+        cargas, con hojas de hasta un píxel) y lo interpola en el resto.
+        """
+        muestreo = MuestreoAdaptativo(cargas, self.k, self.rango, resolucion=RESOLUCION_FINA)
+        return muestreo.remuestrear()
+    
     def campo_electrico(self, x, y, cargas):
         """
         Calcula el campo eléctrico en los puntos (x, y) debido a un conjunto de cargas.
         
+        El cálculo se delega al módulo motor_campo, que no depende de la
+        interfaz gráfica y puede usarse por separado.
+        
         Parámetros:
         -----------
         x, y : arrays de numpy
@@ -100,19 +367,8 @@ class SimuladorCampoElectrico:
         Ex, Ey : arrays de numpy
             Componentes x e y del campo eléctrico
         """
-        Ex = np.zeros_like(x)
-        Ey = np.zeros_like(y)
-        
-        for q_i, x_i, y_i in cargas:
-            dx = x - x_i
-            dy = y - y_i
-            r_cuadrado = dx**2 + dy**2 + 1e-10
-            r = np.sqrt(r_cuadrado)
-            
-            Ex += self.k * q_i * dx / (r_cuadrado * r)
-            Ey += self.k * q_i * dy / (r_cuadrado * r)
-        
-        return Ex, Ey
+        return motor_campo.campo_electrico(x, y, cargas, self.k,
+                                           workers=self.workers)
     
     # ============================================================================
     # CREAR INTERFAZ DE USUARIO
@@ -189,186 +445,170 @@ class SimuladorCampoElectrico:
         titulo_panel.pack(pady=15, padx=10)
         
         # ============================================================================
-        # SECCIÓN: CARGA POSITIVA
+        # SECCIÓN: CARGAS DE LA ESCENA
         # ============================================================================
         
         separador1 = ctk.CTkFrame(panel_control, height=2, fg_color=("#a0aec0", "#34495e"))
         separador1.pack(fill=tk.X, pady=10, padx=15)
         
-        label_carga_pos = ctk.CTkLabel(
+        label_cargas = ctk.CTkLabel(
             panel_control,
-            text="🔴 Carga Positiva (+q)",
+            text="⚡ Cargas de la Escena",
             font=("Roboto", 14, "bold"),
-            text_color=("#c0392b", "#e74c3c")
-        )
-        label_carga_pos.pack(pady=(10, 5), padx=10)
-        
-        # Slider X1
-        label_x1 = ctk.CTkLabel(
-            panel_control,
-            text="Posición X₁:",
-            font=("Roboto", 12),
-            text_color=("#2c3e50", "#e0e0e0")
+            text_color=("#8e44ad", "#9b59b6")
         )
-        label_x1.pack(pady=(10, 2), padx=10)
-        
-        marco_slider_x1 = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
-        marco_slider_x1.pack(fill=tk.X, padx=15, pady=5)
+        label_cargas.pack(pady=(10, 5), padx=10)
         
-        self.slider_x1 = ctk.CTkSlider(
-            marco_slider_x1,
-            from_=-4.5,
-            to=4.5,
-            variable=self.x1,
-            orientation="horizontal",
-            command=lambda x: self.actualizar_simulacion(),
-            button_color=("#e74c3c", "#c0392b"),
-            button_hover_color=("#ff6b6b", "#e74c3c"),
-            progress_color=("#ff8a80", "#c0392b"),
-            fg_color=("#b8c5d6", "#2c3e50"),
-            width=200
-        )
-        self.slider_x1.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
+        # Carga seleccionada, con botones para pasar a la anterior/siguiente
+        marco_seleccion = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
+        marco_seleccion.pack(fill=tk.X, padx=15, pady=5)
         
-        self.etiqueta_x1 = ctk.CTkLabel(
-            marco_slider_x1,
-            text="-1.0",
-            font=("Roboto", 13, "bold"),
-            width=60,
-            fg_color=("#e74c3c", "#c0392b"),
-            corner_radius=6,
-            text_color=("#ffffff", "#ffffff")
-        )
-        self.etiqueta_x1.pack(side=tk.LEFT, padx=5)
+        ctk.CTkButton(
+            marco_seleccion, text="◀", width=36, height=30, corner_radius=8,
+            command=lambda: self.seleccionar(self.seleccion - 1)
+        ).pack(side=tk.LEFT, padx=5)
         
-        # Slider Y1
-        label_y1 = ctk.CTkLabel(
-            panel_control,
-            text="Posición Y₁:",
-            font=("Roboto", 12),
+        self.info_seleccion = ctk.CTkLabel(
+            marco_seleccion,
+            text="",
+            font=("Roboto", 12, "bold"),
             text_color=("#2c3e50", "#e0e0e0")
         )
-        label_y1.pack(pady=(10, 2), padx=10)
+        self.info_seleccion.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        marco_slider_y1 = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
-        marco_slider_y1.pack(fill=tk.X, padx=15, pady=5)
+        ctk.CTkButton(
+            marco_seleccion, text="▶", width=36, height=30, corner_radius=8,
+            command=lambda: self.seleccionar(self.seleccion + 1)
+        ).pack(side=tk.LEFT, padx=5)
         
-        self.slider_y1 = ctk.CTkSlider(
-            marco_slider_y1,
-            from_=-4.5,
-            to=4.5,
-            variable=self.y1,
-            orientation="horizontal",
-            command=lambda x: self.actualizar_simulacion(),
-            button_color=("#e74c3c", "#c0392b"),
-            button_hover_color=("#ff6b6b", "#e74c3c"),
-            progress_color=("#ff8a80", "#c0392b"),
-            fg_color=("#b8c5d6", "#2c3e50"),
-            width=200
+        # Sliders de la carga seleccionada: los mismos para cualquier N
+        self.slider_x, self.etiqueta_x = self.crear_slider(
+            panel_control, "Posición X:", self.x_sel,
+            -POSICION_MAXIMA, POSICION_MAXIMA, 90, 'x'
+        )
+        self.slider_y, self.etiqueta_y = self.crear_slider(
+            panel_control, "Posición Y:", self.y_sel,
+            -POSICION_MAXIMA, POSICION_MAXIMA, 90, 'y'
+        )
+        self.slider_q, self.etiqueta_q = self.crear_slider(
+            panel_control, "Carga q (C):", self.q_sel, -5.0, 5.0, 20, 'q'
         )
-        self.slider_y1.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
         
-        self.etiqueta_y1 = ctk.CTkLabel(
-            marco_slider_y1,
-            text="0.0",
-            font=("Roboto", 13, "bold"),
-            width=60,
-            fg_color=("#e74c3c", "#c0392b"),
-            corner_radius=6,
-            text_color=("#ffffff", "#ffffff")
+        # Agregar y quitar cargas
+        marco_botones = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
+        marco_botones.pack(fill=tk.X, padx=15, pady=(10, 5))
+        
+        ctk.CTkButton(
+            marco_botones, text="➕ +q", width=90, height=32, corner_radius=8,
+            fg_color=("#e74c3c", "#c0392b"), hover_color=("#ff6b6b", "#e74c3c"),
+            command=lambda: self.agregar_carga(self.q)
+        ).pack(side=tk.LEFT, expand=True, padx=3)
+        
+        ctk.CTkButton(
+            marco_botones, text="➕ −q", width=90, height=32, corner_radius=8,
+            fg_color=("#3498db", "#2980b9"), hover_color=("#5dade2", "#3498db"),
+            command=lambda: self.agregar_carga(-self.q)
+        ).pack(side=tk.LEFT, expand=True, padx=3)
+        
+        ctk.CTkButton(
+            marco_botones, text="🗑️ Quitar", width=90, height=32, corner_radius=8,
+            fg_color=("#7f8c8d", "#4a5568"), hover_color=("#95a5a6", "#718096"),
+            command=self.eliminar_carga
+        ).pack(side=tk.LEFT, expand=True, padx=3)
+        
+        # Abrir y guardar escenas (CSV o JSON)
+        marco_archivos = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
+        marco_archivos.pack(fill=tk.X, padx=15, pady=5)
+        
+        ctk.CTkButton(
+            marco_archivos, text="📂 Abrir escena", width=140, height=32,
+            corner_radius=8, command=self.abrir_escena
+        ).pack(side=tk.LEFT, expand=True, padx=3)
+        
+        ctk.CTkButton(
+            marco_archivos, text="💾 Guardar escena", width=140, height=32,
+            corner_radius=8, command=self.guardar_escena
+        ).pack(side=tk.LEFT, expand=True, padx=3)
+        
+        label_ayuda = ctk.CTkLabel(
+            panel_control,
+            text="🖱️ Clic en una carga para seleccionarla;\n    arrástrala para moverla",
+            font=("Roboto", 10),
+            text_color=("#34495e", "#bdc3c7"),
+            justify=tk.LEFT
         )
-        self.etiqueta_y1.pack(side=tk.LEFT, padx=5)
+        label_ayuda.pack(pady=5, padx=10)
         
         # ============================================================================
-        # SECCIÓN: CARGA NEGATIVA
+        # SECCIÓN: VISUALIZACIÓN
         # ============================================================================
         
-        separador2 = ctk.CTkFrame(panel_control, height=2, fg_color=("#a0aec0", "#34495e"))
-        separador2.pack(fill=tk.X, pady=15, padx=15)
+        separador_vis = ctk.CTkFrame(panel_control, height=2, fg_color=("#a0aec0", "#34495e"))
+        separador_vis.pack(fill=tk.X, pady=15, padx=15)
         
-        label_carga_neg = ctk.CTkLabel(
+        label_visualizacion = ctk.CTkLabel(
             panel_control,
-            text="🔵 Carga Negativa (−q)",
+            text="🎨 Visualización",
             font=("Roboto", 14, "bold"),
-            text_color=("#2980b9", "#3498db")
+            text_color=("#d35400", "#e67e22")
         )
-        label_carga_neg.pack(pady=(10, 5), padx=10)
+        label_visualizacion.pack(pady=(10, 5), padx=10)
         
-        # Slider X2
-        label_x2 = ctk.CTkLabel(
+        # Mapa de colores: contornos (contourf) o imagen rasterizada (imshow),
+        # mucho más rápida en mallas grandes
+        label_mapa = ctk.CTkLabel(
             panel_control,
-            text="Posición X₂:",
+            text="Mapa de magnitud:",
             font=("Roboto", 12),
             text_color=("#2c3e50", "#e0e0e0")
         )
-        label_x2.pack(pady=(10, 2), padx=10)
-        
-        marco_slider_x2 = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
-        marco_slider_x2.pack(fill=tk.X, padx=15, pady=5)
+        label_mapa.pack(pady=(10, 2), padx=10)
         
-        self.slider_x2 = ctk.CTkSlider(
-            marco_slider_x2,
-            from_=-4.5,
-            to=4.5,
-            variable=self.x2,
-            orientation="horizontal",
-            command=lambda x: self.actualizar_simulacion(),
-            button_color=("#3498db", "#2980b9"),
-            button_hover_color=("#5dade2", "#3498db"),
-            progress_color=("#85c1e9", "#2980b9"),
-            fg_color=("#b8c5d6", "#2c3e50"),
-            width=200
-        )
-        self.slider_x2.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
-        
-        self.etiqueta_x2 = ctk.CTkLabel(
-            marco_slider_x2,
-            text="1.0",
-            font=("Roboto", 13, "bold"),
-            width=60,
-            fg_color=("#3498db", "#2980b9"),
-            corner_radius=6,
-            text_color=("#ffffff", "#ffffff")
+        self.selector_mapa = ctk.CTkSegmentedButton(
+            panel_control,
+            values=[MAPA_CONTORNOS, MAPA_IMAGEN, MAPA_IMAGEN_LOG, MAPA_FINO],
+            variable=self.modo_mapa,
+            command=lambda valor: self.actualizar_simulacion(),
+            font=("Roboto", 11)
         )
-        self.etiqueta_x2.pack(side=tk.LEFT, padx=5)
+        self.selector_mapa.pack(fill=tk.X, padx=15, pady=5)
         
-        # Slider Y2
-        label_y2 = ctk.CTkLabel(
+        # Líneas de campo trazadas con el campo analítico (no interpolado)
+        self.switch_lineas = ctk.CTkSwitch(
             panel_control,
-            text="Posición Y₂:",
+            text="Mostrar líneas de campo",
+            variable=self.mostrar_lineas,
+            command=self.actualizar_simulacion,
             font=("Roboto", 12),
-            text_color=("#2c3e50", "#e0e0e0")
+            text_color=("#2c3e50", "#e0e0e0"),
+            progress_color=("#e67e22", "#d35400")
         )
-        label_y2.pack(pady=(10, 2), padx=10)
-        
-        marco_slider_y2 = ctk.CTkFrame(panel_control, fg_color=("#D1DBE6", "#16213e"))
-        marco_slider_y2.pack(fill=tk.X, padx=15, pady=5)
+        self.switch_lineas.pack(pady=(10, 5), padx=15)
         
-        self.slider_y2 = ctk.CTkSlider(
-            marco_slider_y2,
-            from_=-4.5,
-            to=4.5,
-            variable=self.y2,
-            orientation="horizontal",
-            command=lambda x: self.actualizar_simulacion(),
-            button_color=("#3498db", "#2980b9"),
-            button_hover_color=("#5dade2", "#3498db"),
-            progress_color=("#85c1e9", "#2980b9"),
-            fg_color=("#b8c5d6", "#2c3e50"),
-            width=200
+        # Curvas equipotenciales (el potencial sale del mismo cálculo del campo)
+        self.switch_equipotenciales = ctk.CTkSwitch(
+            panel_control,
+            text="Mostrar equipotenciales",
+            variable=self.mostrar_equipotenciales,
+            command=self.actualizar_simulacion,
+            font=("Roboto", 12),
+            text_color=("#2c3e50", "#e0e0e0"),
+            progress_color=("#e67e22", "#d35400")
         )
-        self.slider_y2.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
+        self.switch_equipotenciales.pack(pady=5, padx=15)
         
-        self.etiqueta_y2 = ctk.CTkLabel(
-            marco_slider_y2,
-            text="0.0",
-            font=("Roboto", 13, "bold"),
-            width=60,
-            fg_color=("#3498db", "#2980b9"),
-            corner_radius=6,
-            text_color=("#ffffff", "#ffffff")
+        # Cortes del campo en 3D: solo se calcula el plano que se muestra
+        self.boton_cortes = ctk.CTkButton(
+            panel_control,
+            text="🧊 Cortes 3D",
+            height=32,
+            corner_radius=8,
+            font=("Roboto", 12, "bold"),
+            fg_color=("#e67e22", "#d35400"),
+            hover_color=("#f39c12", "#e67e22"),
+            command=self.abrir_visor_cortes
         )
-        self.etiqueta_y2.pack(side=tk.LEFT, padx=5)
+        self.boton_cortes.pack(pady=(10, 5), padx=15)
         
         # ============================================================================
         # SECCIÓN: INFORMACIÓN
@@ -410,6 +650,26 @@ class SimuladorCampoElectrico:
         )
         self.info_constante.pack(pady=3, padx=10)
         
+        # Rendimiento: FPS y percentiles del tiempo por cuadro y por etapa
+        self.switch_rendimiento = ctk.CTkSwitch(
+            panel_control,
+            text="Mostrar rendimiento",
+            variable=self.mostrar_rendimiento,
+            command=self.actualizar_rendimiento,
+            font=("Roboto", 11),
+            progress_color=("#16a085", "#1abc9c")
+        )
+        self.switch_rendimiento.pack(pady=5, padx=15)
+        
+        self.info_rendimiento = ctk.CTkLabel(
+            panel_control,
+            text="",
+            font=("Courier", 10),
+            text_color=("#34495e", "#bdc3c7"),
+            justify=tk.LEFT
+        )
+        self.info_rendimiento.pack(pady=3, padx=10)
+        
         # Información física
         marco_info = ctk.CTkFrame(
             panel_control,
@@ -453,6 +713,384 @@ class SimuladorCampoElectrico:
         # Integrar matplotlib en tkinter
         self.canvas_mpl = FigureCanvasTkAgg(self.fig, master=marco_canvas)
         self.canvas_mpl.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Artistas permanentes del gráfico
+        self.crear_grafico()
+    
+    def crear_slider(self, panel, texto, variable, desde, hasta, pasos, control):
+        """
+        Crea un slider con su título y la etiqueta que muestra el valor.
+        
+        'control' ('x', 'y' o 'q') es lo que el slider cambia de la carga
+        seleccionada (ver al_mover_slider).
+        
+        Retorna:
+        --------
+        slider, etiqueta : widgets de CustomTkinter
+        """
+        label = ctk.CTkLabel(
+            panel,
+            text=texto,
+            font=("Roboto", 12),
+            text_color=("#2c3e50", "#e0e0e0")
+        )
+        label.pack(pady=(10, 2), padx=10)
+        
+        marco_slider = ctk.CTkFrame(panel, fg_color=("#D1DBE6", "#16213e"))
+        marco_slider.pack(fill=tk.X, padx=15, pady=5)
+        
+        slider = ctk.CTkSlider(
+            marco_slider,
+            from_=desde,
+            to=hasta,
+            number_of_steps=pasos,
+            variable=variable,
+            orientation="horizontal",
+            command=lambda valor: self.al_mover_slider(control),
+            button_color=("#9b59b6", "#8e44ad"),
+            button_hover_color=("#bb8fce", "#9b59b6"),
+            progress_color=("#d2b4de", "#8e44ad"),
+            fg_color=("#b8c5d6", "#2c3e50"),
+            width=200
+        )
+        slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
+        
+        etiqueta = ctk.CTkLabel(
+            marco_slider,
+            text="0.0",
+            font=("Roboto", 13, "bold"),
+            width=60,
+            fg_color=("#9b59b6", "#8e44ad"),
+            corner_radius=6,
+            text_color=("#ffffff", "#ffffff")
+        )
+        etiqueta.pack(side=tk.LEFT, padx=5)
+        return slider, etiqueta
+    
+    # ============================================================================
+    # ARTISTAS PERMANENTES DEL GRÁFICO
+    # ============================================================================
+    
+    def crear_grafico(self):
+        """
+        Configura una sola vez los ejes y los artistas que se reutilizan.
+        
+        Las partes estáticas (ejes, etiquetas, rejilla) se dibujan una vez y
+        se guardan como fondo; en cada cuadro solo se redibujan los artistas
+        animados (mapa de colores, flechas y cargas) encima de ese fondo.
+        Las cargas se dibujan con colecciones, no con un parche por carga.
+        """
+        # Configuración del gráfico
+        self.ax.set_xlim(-self.rango, self.rango)
+        self.ax.set_ylim(-self.rango, self.rango)
+        self.ax.set_xlabel('x (m)', fontsize=12, color='white')
+        self.ax.set_ylabel('y (m)', fontsize=12, color='white')
+        self.ax.set_title('Campo Eléctrico del Dipolo', 
+                         fontsize=14, weight='bold', color='white', pad=20)
+        self.ax.set_aspect('equal')
+        self.ax.grid(True, alpha=0.3, color='white')
+        self.ax.tick_params(colors='white')
+        
+        # Mapa de colores y flechas: se crean en el primer cuadro
+        self.contorno = None
+        self.imagen = None
+        self.flechas = None
+        self.equipotenciales = None
+        
+        # Líneas de campo: una sola colección cuyos segmentos se reemplazan
+        self.lineas = LineCollection([], colors='white', linewidths=1.0,
+                                     alpha=0.8, zorder=4, animated=True)
+        self.ax.add_collection(self.lineas)
+        
+        # Cargas: una sola colección de círculos (radio en unidades de datos)
+        # y dos de signos, cuyos puntos se reemplazan en cada cuadro; el
+        # costo de dibujo casi no depende del número de cargas
+        self.circulos = EllipseCollection(2 * RADIO_CARGA, 2 * RADIO_CARGA, 0,
+                                          units='xy', offsets=np.zeros((0, 2)),
+                                          offset_transform=self.ax.transData,
+                                          linewidths=2, zorder=5, animated=True)
+        self.ax.add_collection(self.circulos)
+        self.signos_pos = self.ax.scatter([], [], s=160, marker='+', color='white',
+                                          linewidths=2.5, zorder=6, animated=True)
+        self.signos_neg = self.ax.scatter([], [], s=160, marker='_', color='white',
+                                          linewidths=2.5, zorder=6, animated=True)
+        
+        # Fondo estático para el blitting (se captura en cada dibujo completo)
+        self.fondo = None
+        self.canvas_mpl.mpl_connect('draw_event', self.al_dibujar_canvas)
+        
+        # Seleccionar y arrastrar cargas con el ratón
+        self.canvas_mpl.mpl_connect('button_press_event', self.al_presionar)
+        self.canvas_mpl.mpl_connect('motion_notify_event', self.al_arrastrar)
+        self.canvas_mpl.mpl_connect('button_release_event', self.al_soltar)
+    
+    def dibujar_magnitud(self, X, Y, E_magnitud):
+        """
+        Actualiza el mapa de colores de la magnitud del campo.
+        
+        En modo contornos se reconstruye el contourf (no admite actualizarse).
+        En modo imagen se reutiliza un único AxesImage y solo se cambian sus
+        datos con set_data, lo que evita generar contornos en cada cuadro.
+        En modo fino E_magnitud puede tener otra resolución que X, Y.
+        """
+        modo = self.modo_mapa.get()
+        
+        if modo == MAPA_CONTORNOS:
+            if self.imagen is not None:
+                self.imagen.remove()
+                self.imagen = None
+            if self.contorno is not None:
+                self.contorno.remove()
+            self.contorno = self.ax.contourf(X, Y, E_magnitud, levels=20,
+                                             cmap='viridis', alpha=0.7, animated=True)
+            return
+        
+        if self.contorno is not None:
+            self.contorno.remove()
+            self.contorno = None
+        
+        # Extensión de la imagen: cada píxel centrado en un punto de la malla
+        paso = 2 * self.rango / (E_magnitud.shape[1] - 1)
+        extension = (-self.rango - paso / 2, self.rango + paso / 2,
+                     -self.rango - paso / 2, self.rango + paso / 2)
+        
+        if modo in (MAPA_IMAGEN_LOG, MAPA_FINO):
+            norma = LogNorm(vmin=MAGNITUD_LOG_MIN, vmax=MAGNITUD_LOG_MAX, clip=True)
+        else:
+            norma = Normalize()
+        
+        if self.imagen is None or type(self.imagen.norm) is not type(norma):
+            if self.imagen is not None:
+                self.imagen.remove()
+            self.imagen = self.ax.imshow(E_magnitud, origin='lower', extent=extension,
+                                         cmap='viridis', norm=norma, alpha=0.7,
+                                         interpolation='bilinear', animated=True)
+        else:
+            self.imagen.set_data(E_magnitud)
+            self.imagen.set_extent(extension)
+        
+        # La escala lineal se ajusta a cada cuadro; la logarítmica es fija
+        if modo == MAPA_IMAGEN:
+            self.imagen.autoscale()
+    
+    def artistas_animados(self):
+        """Artistas que cambian en cada cuadro, en orden de dibujo"""
+        artistas = [self.contorno, self.imagen, self.equipotenciales,
+                    self.flechas, self.lineas,
+                    self.circulos, self.signos_pos, self.signos_neg]
+        return [a for a in artistas if a is not None]
+    
+    def al_dibujar_canvas(self, evento):
+        """Tras un dibujo completo (inicio, cambio de tamaño) guarda el fondo"""
+        self.fondo = self.canvas_mpl.copy_from_bbox(self.fig.bbox)
+        self.dibujar_animados()
+    
+    def dibujar_animados(self):
+        """Dibuja los artistas animados sobre el fondo guardado (blitting)"""
+        if self.fondo is None:
+            with self.perfil.etapa('dibujo completo'):
+                self.canvas_mpl.draw()
+            return
+        self.canvas_mpl.restore_region(self.fondo)
+        for artista in self.artistas_animados():
+            self.ax.draw_artist(artista)
+        
+        # La rejilla queda encima del mapa de colores, como en el dibujo completo
+        for linea in self.ax.get_xgridlines() + self.ax.get_ygridlines():
+            self.ax.draw_artist(linea)
+        
+        self.canvas_mpl.blit(self.fig.bbox)
+    
+    # ============================================================================
+    # RENDIMIENTO Y CIERRE
+    # ============================================================================
+    
+    def actualizar_rendimiento(self):
+        """Refresca el texto de rendimiento (a lo más 4 veces por segundo)"""
+        self.id_rendimiento = None
+        if self.mostrar_rendimiento.get():
+            self.info_rendimiento.configure(text=self.perfil.texto_resumen())
+        else:
+            self.info_rendimiento.configure(text="")
+    
+    def programar_rendimiento(self):
+        """Programa un refresco del texto de rendimiento si está visible"""
+        if self.mostrar_rendimiento.get() and self.id_rendimiento is None:
+            self.id_rendimiento = self.ventana_principal.after(250, self.actualizar_rendimiento)
+    
+    def al_cerrar(self):
+        """Exporta los tiempos medidos (si se pidió) y cierra la ventana"""
+        if self.archivo_perfil and self.perfil.muestras:
+            self.perfil.exportar(self.archivo_perfil)
+            print(f"⏱️  Tiempos por cuadro guardados en {self.archivo_perfil}")
+        self.ventana_principal.destroy()
+    
+    # ============================================================================
+    # EDICIÓN DE LA ESCENA
+    # ============================================================================
+    
+    def sincronizar_controles(self):
+        """Pone los sliders y etiquetas en los valores de la carga seleccionada"""
+        n = len(self.escena)
+        if n == 0:
+            self.info_seleccion.configure(text="Sin cargas")
+            return
+        self.seleccion = min(max(self.seleccion, 0), n - 1)
+        q, x, y = self.escena.cargas[self.seleccion]
+        self.x_sel.set(x)
+        self.y_sel.set(y)
+        self.q_sel.set(q)
+        self.etiqueta_x.configure(text=f"{x:.1f}")
+        self.etiqueta_y.configure(text=f"{y:.1f}")
+        self.etiqueta_q.configure(text=f"{q:+.1f}")
+        self.info_seleccion.configure(text=f"Carga {self.seleccion + 1} de {n}")
+    
+    def seleccionar(self, indice):
+        """Selecciona la carga 'indice' (los índices dan la vuelta)"""
+        if len(self.escena) == 0:
+            return
+        self.seleccion = indice % len(self.escena)
+        self.sincronizar_controles()
+        self.actualizar_simulacion()
+    
+    def al_mover_slider(self, control):
+        """
+        Aplica el slider 'control' ('x', 'y' o 'q') a la carga seleccionada.
+        
+        Solo cambia lo que controla ese slider: mover X no redondea la Y ni
+        la carga de una carga leída de un archivo. La posición se lleva al
+        paso de los sliders; la carga se toma tal cual del slider.
+        """
+        if len(self.escena) == 0:
+            return
+        q, x, y = self.escena.cargas[self.seleccion]
+        if control == 'x':
+            self.escena.mover(self.seleccion, al_paso(self.x_sel.get()), y)
+        elif control == 'y':
+            self.escena.mover(self.seleccion, x, al_paso(self.y_sel.get()))
+        else:
+            self.escena.cambiar_carga(self.seleccion, float(self.q_sel.get()))
+        self.sincronizar_controles()
+        self.planificador.solicitar()
+    
+    def agregar_carga(self, q):
+        """Agrega una carga en el origen y la selecciona"""
+        self.seleccionar(self.escena.agregar(q, 0.0, 0.0))
+    
+    def eliminar_carga(self):
+        """Quita la carga seleccionada"""
+        if len(self.escena) == 0:
+            return
+        self.escena.eliminar(self.seleccion)
+        self.sincronizar_controles()
+        self.actualizar_simulacion()
+    
+    def abrir_escena(self):
+        """Reemplaza la escena por una leída de un archivo CSV, JSON o .npz"""
+        ruta = filedialog.askopenfilename(
+            title="Abrir escena",
+            filetypes=[("Escenas", "*.csv *.json *.npz"), ("Todos", "*.*")]
+        )
+        if not ruta:
+            return
+        try:
+            if ruta.lower().endswith('.npz'):
+                guardado = abrir_campo(ruta)
+                self.escena = EscenaCargas(guardado.cargas_3d)
+                self.usar_campo_guardado(guardado)
+            else:
+                self.escena = EscenaCargas.cargar(ruta)
+        except (OSError, ValueError, KeyError) as error:
+            messagebox.showerror("Abrir escena", f"No se pudo leer {ruta}:\n{error}")
+            return
+        self.seleccion = 0
+        self.sincronizar_controles()
+        self.actualizar_simulacion()
+    
+    def guardar_escena(self):
+        """
+        Guarda la escena actual en un archivo CSV o JSON, o en .npz junto
+        con el campo de la malla completa (Ex, Ey, |E| y V).
+        """
+        ruta = filedialog.asksaveasfilename(
+            title="Guardar escena",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON", "*.json"),
+                       ("Escena y campo (.npz)", "*.npz")]
+        )
+        if not ruta:
+            return
+        if not ruta.lower().endswith('.npz'):
+            self.escena.guardar(ruta)
+            return
+        
+        # El campo de la escena actual casi siempre ya está en el caché
+        cargas = self.escena.cargas.copy()
+        Ex, Ey, E_magnitud, V = self.cache.obtener(
+            cargas, self.rango, self.resolucion, self.k,
+            lambda c: self.calcular_campo(self.X, self.Y, c)
+        )
+        guardar_campo(ruta, self.escena.cargas_3d, self.k, self.rango, self.resolucion,
+                      Ex=Ex, Ey=Ey, E=E_magnitud, V=V)
+    
+    def usar_campo_guardado(self, guardado):
+        """
+        Pone en el caché el campo leído de un .npz para dibujarlo sin
+        recalcular y pasa a la resolución de su malla.
+        
+        Las mallas mapeadas del archivo se guardan en el caché sin copiarlas.
+        Si la malla supera RESOLUCION_MAXIMA_GUARDADA se muestra
+        submuestreada: en cada punto de una malla de esa resolución se toma
+        el punto guardado más cercano (a menos de media celda del archivo),
+        leyendo del disco solo esos puntos.
+        """
+        if not guardado.tiene_campo() or guardado.V is None:
+            return
+        if guardado.rango != self.rango or guardado.k != self.k:
+            return
+        
+        mallas = (guardado.Ex, guardado.Ey, guardado.E, guardado.V)
+        resolucion = guardado.resolucion
+        if resolucion > RESOLUCION_MAXIMA_GUARDADA:
+            resolucion = RESOLUCION_MAXIMA_GUARDADA
+            indices = np.round(np.linspace(0, guardado.resolucion - 1, resolucion)).astype(int)
+            mallas = tuple(m[np.ix_(indices, indices)] for m in mallas)
+        
+        if resolucion != self.resolucion:
+            self.crear_mallas(resolucion)
+        clave = self.cache.clave(guardado.cargas, self.rango, resolucion, self.k)
+        self.cache.guardar(clave, mallas, copiar=False)
+    
+    def al_presionar(self, evento):
+        """Clic en el gráfico: selecciona la carga más cercana (si hay una)"""
+        if evento.inaxes is not self.ax or evento.button != 1:
+            return
+        indice = self.escena.mas_cercana(evento.xdata, evento.ydata, RADIO_SELECCION)
+        if indice is not None:
+            self.arrastrando = True
+            self.seleccionar(indice)
+    
+    def al_arrastrar(self, evento):
+        """Mueve la carga seleccionada con el ratón (al paso de los sliders)"""
+        if not self.arrastrando or evento.inaxes is not self.ax:
+            return
+        x = al_paso(np.clip(evento.xdata, -POSICION_MAXIMA, POSICION_MAXIMA))
+        y = al_paso(np.clip(evento.ydata, -POSICION_MAXIMA, POSICION_MAXIMA))
+        self.escena.mover(self.seleccion, x, y)
+        self.sincronizar_controles()
+        self.planificador.solicitar()
+    
+    def al_soltar(self, evento):
+        """Termina el arrastre"""
+        self.arrastrando = False
+    
+    def abrir_visor_cortes(self):
+        """Abre (o trae al frente) la ventana de cortes 3D de la escena"""
+        if self.visor_cortes is not None and not self.visor_cortes.cerrado:
+            self.visor_cortes.ventana.focus()
+            return
+        self.visor_cortes = VisorCortes(ctk.CTkToplevel(self.ventana_principal),
+                                        lambda: self.escena.cargas_3d, self.k, self.rango)
     
     # ============================================================================
     # FUNCIÓN PARA CAMBIAR TEMA
@@ -472,73 +1110,130 @@ class SimuladorCampoElectrico:
     # FUNCIÓN PARA ACTUALIZAR LA SIMULACIÓN
     # ============================================================================
     
-    def actualizar_simulacion(self):
-        """Recalcula y redibuja el campo eléctrico"""
-        
-        # Obtener valores actuales
-        x1_val = self.x1.get()
-        y1_val = self.y1.get()
-        x2_val = self.x2.get()
-        y2_val = self.y2.get()
-        
-        # Actualizar etiquetas
-        self.etiqueta_x1.configure(text=f"{x1_val:.1f}")
-        self.etiqueta_y1.configure(text=f"{y1_val:.1f}")
-        self.etiqueta_x2.configure(text=f"{x2_val:.1f}")
-        self.etiqueta_y2.configure(text=f"{y2_val:.1f}")
-        
-        # Calcular separación
-        separacion = np.sqrt((x2_val - x1_val)**2 + (y2_val - y1_val)**2)
-        self.info_separacion.configure(text=f"Separación: {separacion:.2f} m")
-        
-        # Definir cargas
-        cargas = [
-            (self.q, x1_val, y1_val),
-            (-self.q, x2_val, y2_val)
-        ]
-        
-        # Calcular campo eléctrico
-        Ex, Ey = self.campo_electrico(self.X, self.Y, cargas)
-        E_magnitud = np.sqrt(Ex**2 + Ey**2)
-        
-        # Limpiar el gráfico anterior
-        self.ax.clear()
-        
-        # Mapa de colores
-        contour = self.ax.contourf(self.X, self.Y, E_magnitud, levels=20, 
-                                    cmap='viridis', alpha=0.7)
-        
-        # Líneas de campo (flechas)
-        E_norm = np.sqrt(Ex**2 + Ey**2 + 1e-10)
-        self.ax.quiver(self.X, self.Y, Ex/E_norm, Ey/E_norm, E_magnitud,
-                      cmap='plasma', alpha=0.8, scale=25, width=0.004)
-        
-        # Dibujar cargas
-        circulo_pos = Circle((x1_val, y1_val), 0.2, color='red', 
-                            ec='white', linewidth=2, zorder=5)
-        self.ax.add_patch(circulo_pos)
-        self.ax.text(x1_val, y1_val, '+', fontsize=24, color='white',
-                    ha='center', va='center', weight='bold', zorder=6)
-        
-        circulo_neg = Circle((x2_val, y2_val), 0.2, color='blue',
-                            ec='white', linewidth=2, zorder=5)
-        self.ax.add_patch(circulo_neg)
-        self.ax.text(x2_val, y2_val, '−', fontsize=28, color='white',
-                    ha='center', va='center', weight='bold', zorder=6)
+    def actualizar_simulacion(self, preliminar=False):
+        """
+        Recalcula y redibuja el campo eléctrico
         
-        # Configuración del gráfico
-        self.ax.set_xlim(-self.rango, self.rango)
-        self.ax.set_ylim(-self.rango, self.rango)
-        self.ax.set_xlabel('x (m)', fontsize=12, color='white')
-        self.ax.set_ylabel('y (m)', fontsize=12, color='white')
-        self.ax.set_title('Campo Eléctrico del Dipolo', 
-                         fontsize=14, weight='bold', color='white', pad=20)
-        self.ax.set_aspect('equal')
-        self.ax.grid(True, alpha=0.3, color='white')
-        self.ax.tick_params(colors='white')
+        Parámetros:
+        -----------
+        preliminar : bool
+            Si es True se usa la malla reducida (vista previa durante el
+            arrastre de un slider); si es False, la malla completa
+        """
+        
+        # Copia de las cargas actuales (la escena se sigue editando mientras
+        # el campo incremental y el caché guardan esta configuración)
+        cargas = self.escena.cargas.copy()
+        n = len(cargas)
         
-        # Redibujar canvas
-        self.canvas_mpl.draw()
+        # Información de la escena: la separación solo tiene sentido con dos
+        # cargas; con más se muestran el número y la carga total de cada signo
+        if n == 2:
+            separacion = np.hypot(*(cargas[1, 1:] - cargas[0, 1:]))
+            self.info_separacion.configure(text=f"Separación: {separacion:.2f} m")
+        else:
+            self.info_separacion.configure(text=f"Cargas en la escena: {n}")
+        positivas = cargas[cargas[:, 0] > 0, 0].sum()
+        negativas = -cargas[cargas[:, 0] < 0, 0].sum()
+        self.info_cargas.configure(text=f"Σq₊ = +{positivas:.2f} C\nΣq₋ = −{negativas:.2f} C")
+        
+        # Elegir la malla: la reducida solo si de verdad es más pequeña
+        if preliminar and self.resolucion_preliminar < self.resolucion:
+            X, Y = self.X_pre, self.Y_pre
+        else:
+            X, Y = self.X, self.Y
+        
+        # No repetir un cuadro idéntico al que ya está en pantalla
+        estado = (cargas.tobytes(), self.seleccion, X.shape, self.modo_mapa.get(),
+                  self.mostrar_lineas.get(), self.mostrar_equipotenciales.get())
+        if estado == self.ultimo_dibujo:
+            return
+        self.ultimo_dibujo = estado
+        inicio_cuadro = self.perfil.iniciar_cuadro()
+        
+        # Calcular campo eléctrico: primero se busca en el caché; si no
+        # está, solo se recalcula la carga que se movió
+        with self.perfil.etapa('campo'):
+            Ex, Ey, E_magnitud, V = self.cache.obtener(
+                cargas, self.rango, X.shape[0], self.k,
+                lambda c: self.calcular_campo(X, Y, c)
+            )
+        
+        # Mapa de colores. En modo fino el cuadro final usa |E| del muestreo
+        # adaptativo en la malla de pantalla (guardado en su propio caché);
+        # la vista previa usa la malla de cálculo.
+        with self.perfil.etapa('mapa'):
+            if (self.modo_mapa.get() == MAPA_FINO and not preliminar
+                    and X.shape[0] < RESOLUCION_FINA):
+                E_fino, = self.cache_fino.obtener(
+                    cargas, self.rango, RESOLUCION_FINA, self.k,
+                    lambda c: (self.magnitud_fina(c),)
+                )
+                self.dibujar_magnitud(X, Y, E_fino)
+            else:
+                self.dibujar_magnitud(X, Y, E_magnitud)
+        
+        # Líneas de campo (flechas): se actualizan con set_UVC mientras la
+        # malla no cambie de tamaño. En mallas finas se toma una de cada
+        # 'paso' filas/columnas para no dibujar miles de flechas ilegibles.
+        with self.perfil.etapa('flechas'):
+            paso = max(1, -(-X.shape[0] // FLECHAS_POR_LADO))
+            Xf, Yf = X[::paso, ::paso], Y[::paso, ::paso]
+            Exf, Eyf, Ef = Ex[::paso, ::paso], Ey[::paso, ::paso], E_magnitud[::paso, ::paso]
+            E_norm = np.sqrt(Exf**2 + Eyf**2 + 1e-10)
+            if self.flechas is not None and self.flechas.N == Xf.size:
+                self.flechas.set_UVC(Exf/E_norm, Eyf/E_norm, Ef)
+                self.flechas.autoscale()
+            else:
+                if self.flechas is not None:
+                    self.flechas.remove()
+                self.flechas = self.ax.quiver(Xf, Yf, Exf/E_norm, Eyf/E_norm, Ef,
+                                              cmap='plasma', alpha=0.8, scale=25,
+                                              width=0.004, animated=True)
+        
+        # Equipotenciales: contornos del potencial V = Σ k·q / r
+        if self.equipotenciales is not None:
+            self.equipotenciales.remove()
+            self.equipotenciales = None
+        if self.mostrar_equipotenciales.get() and n > 0:
+            with self.perfil.etapa('equipotenciales'):
+                niveles = self.k * np.abs(cargas[:, 0]).max() * NIVELES_EQUIPOTENCIALES
+                self.equipotenciales = self.ax.contour(X, Y, V, levels=niveles,
+                                                       colors='white', linewidths=0.8,
+                                                       linestyles='dashed', alpha=0.7,
+                                                       animated=True)
+        
+        # Líneas de campo: de (+) a (−), integradas con el campo exacto. Con
+        # muchas fuentes se siembran menos líneas por carga.
+        if self.mostrar_lineas.get():
+            with self.perfil.etapa('lineas'):
+                fuentes = max(1, np.count_nonzero(cargas[:, 0] > 0))
+                lineas_por_carga = max(2, min(LINEAS_POR_CARGA, LINEAS_TOTALES // fuentes))
+                self.lineas.set_segments(trazar_lineas(cargas, self.k, self.rango,
+                                                       lineas_por_carga))
+        else:
+            self.lineas.set_segments([])
+        
+        # Mover las cargas: rojo (+), azul (−) y borde amarillo en la seleccionada
+        positiva = cargas[:, 0] > 0
+        bordes = np.full(n, 'white', dtype=object)
+        bordes[self.seleccion:self.seleccion + 1] = '#f1c40f'
+        self.circulos.set_offsets(cargas[:, 1:])
+        self.circulos.set_facecolor(np.where(positiva, 'red', 'blue'))
+        self.circulos.set_edgecolor(list(bordes))
+        self.signos_pos.set_offsets(cargas[positiva, 1:])
+        self.signos_neg.set_offsets(cargas[~positiva, 1:])
+        
+        # Redibujar solo los artistas que cambiaron
+        with self.perfil.etapa('dibujo'):
+            self.dibujar_animados()
+        
+        self.perfil.terminar_cuadro(inicio_cuadro)
+        self.programar_rendimiento()
+        
+        # El visor de cortes sigue los cambios de la escena
+        if self.visor_cortes is not None:
+            self.visor_cortes.solicitar()
 
 
 # ============================================================================
@@ -546,6 +1241,22 @@ class SimuladorCampoElectrico:
 # ============================================================================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulador de campo eléctrico - dipolo")
+    parser.add_argument('--perfil', metavar='ARCHIVO',
+                        help="guardar los tiempos por cuadro en este JSON al cerrar")
+    parser.add_argument('--escena', metavar='ARCHIVO',
+                        help="abrir una escena de cargas (CSV, JSON o .npz) en lugar del dipolo")
+    args = parser.parse_args()
+    
+    # Un .npz con el campo ya calculado se dibuja sin recalcular
+    escena = guardado = None
+    if args.escena and args.escena.lower().endswith('.npz'):
+        guardado = abrir_campo(args.escena)
+        escena = EscenaCargas(guardado.cargas_3d)
+    elif args.escena:
+        escena = EscenaCargas.cargar(args.escena)
+    
     ventana = ctk.CTk()
-    app = SimuladorCampoElectrico(ventana)
+    app = SimuladorCampoElectrico(ventana, archivo_perfil=args.perfil, escena=escena,
+                                  campo_guardado=guardado)
     ventana.mainloop()
@@ -0,0 +1,148 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Escena de N cargas puntuales
+
+Descripción: Guarda las cargas de una escena en un único array de NumPy de
+forma (N, 4) con columnas (carga, pos_x, pos_y, pos_z). La vista 'cargas'
+da las tres primeras columnas, el formato (N, 3) que usa motor_campo, y
+'cargas_3d' las cuatro, el de campo_3d. Agregar, quitar y mover cargas
+modifica ese array sin crear variables ni widgets por carga, así que la
+interfaz escala a cientos de cargas.
+
+Las escenas se leen y escriben como CSV con encabezado (q, x, y), como
+JSON con una lista de objetos {"q": ..., "x": ..., "y": ...} o en el
+formato binario .npz de formato_campo (que puede traer además el campo):
+
+    q,x,y
+    1.0,-1.0,0.0
+    -1.0,1.0,0.0
+
+La altura z es opcional en los tres formatos (columna o clave "z"); si
+falta vale 0, y al guardar solo se escribe si alguna carga está fuera del
+plano. El simulador 2D dibuja la escena proyectada sobre el plano z = 0;
+el visor de cortes 3D usa la z de cada carga.
+"""
+import csv
+import json
+
+import numpy as np
+
+import formato_campo
+from campo_3d import preparar_cargas_3d
+
+# ============================================================================
+# CLASE DE LA ESCENA
+# ============================================================================
+
+class EscenaCargas:
+    """Conjunto de cargas puntuales guardado en un array (N, 4)"""
+
+    def __init__(self, cargas=None, capacidad=16):
+        """
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3) o (N, 4), opcional
+            Cargas iniciales (carga, pos_x, pos_y[, pos_z])
+        capacidad : int
+            Filas reservadas al inicio (el array crece al doble si hace falta)
+        """
+        cargas = preparar_cargas_3d([] if cargas is None else cargas)
+        self._datos = np.zeros((max(capacidad, len(cargas)), 4))
+        self._datos[:len(cargas)] = cargas
+        self.n = len(cargas)
+
+    @classmethod
+    def dipolo(cls, q=1.0, x1=-1.0, y1=0.0, x2=1.0, y2=0.0):
+        """Escena inicial del simulador: +q en (x1, y1) y −q en (x2, y2)"""
+        return cls([(q, x1, y1), (-q, x2, y2)])
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def cargas(self):
+        """Vista (N, 3) de las cargas actuales: (carga, pos_x, pos_y)"""
+        return self._datos[:self.n, :3]
+
+    @property
+    def cargas_3d(self):
+        """Vista (N, 4) de las cargas actuales: (carga, pos_x, pos_y, pos_z)"""
+        return self._datos[:self.n]
+
+    def es_3d(self):
+        """True si alguna carga está fuera del plano z = 0"""
+        return bool(np.any(self._datos[:self.n, 3] != 0))
+
+    def agregar(self, q, x, y, z=0.0):
+        """Agrega una carga y devuelve su índice"""
+        if self.n == len(self._datos):
+            nuevos = np.zeros((2 * len(self._datos), 4))
+            nuevos[:self.n] = self._datos
+            self._datos = nuevos
+        self._datos[self.n] = (q, x, y, z)
+        self.n += 1
+        return self.n - 1
+
+    def eliminar(self, indice):
+        """Quita la carga 'indice' (las siguientes se recorren un lugar)"""
+        self._datos[indice:self.n - 1] = self._datos[indice + 1:self.n]
+        self.n -= 1
+
+    def mover(self, indice, x, y):
+        """Cambia la posición de una carga"""
+        self._datos[indice, 1] = x
+        self._datos[indice, 2] = y
+
+    def cambiar_carga(self, indice, q):
+        """Cambia el valor de una carga"""
+        self._datos[indice, 0] = q
+
+    def mas_cercana(self, x, y, radio=None):
+        """
+        Índice de la carga más cercana a (x, y), o None.
+
+        Si se da 'radio', solo se consideran cargas a menos de esa distancia.
+        """
+        if self.n == 0:
+            return None
+        d2 = (self.cargas[:, 1] - x)**2 + (self.cargas[:, 2] - y)**2
+        indice = int(np.argmin(d2))
+        if radio is not None and d2[indice] > radio**2:
+            return None
+        return indice
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Lee una escena de un archivo CSV, JSON o .npz"""
+        if ruta.lower().endswith('.npz'):
+            return cls(formato_campo.abrir_campo(ruta).cargas_3d)
+        if ruta.lower().endswith('.json'):
+            with open(ruta, encoding='utf-8') as archivo:
+                filas = json.load(archivo)
+        else:
+            with open(ruta, encoding='utf-8', newline='') as archivo:
+                filas = list(csv.DictReader(archivo))
+        return cls([(float(f['q']), float(f['x']), float(f['y']), _altura(f))
+                    for f in filas])
+
+    def guardar(self, ruta):
+        """Escribe la escena en un archivo CSV, JSON o .npz (según la extensión)"""
+        if ruta.lower().endswith('.npz'):
+            formato_campo.guardar_campo(ruta, self.cargas_3d)
+            return
+        columnas = ['q', 'x', 'y', 'z'] if self.es_3d() else ['q', 'x', 'y']
+        filas = [{c: float(v) for c, v in zip(columnas, fila)} for fila in self.cargas_3d]
+        if ruta.lower().endswith('.json'):
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                json.dump(filas, archivo, indent=2)
+        else:
+            with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+                escritor = csv.DictWriter(archivo, fieldnames=columnas)
+                escritor.writeheader()
+                escritor.writerows(filas)
+
+
+def _altura(fila):
+    """Columna z opcional de una fila de CSV o JSON (vacía o ausente = 0)"""
+    z = fila.get('z')
+    return 0.0 if z is None or z == '' else float(z)
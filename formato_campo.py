@@ -0,0 +1,219 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Formato compacto para guardar escenas y campos calculados
+
+Descripción: Un solo archivo .npz guarda la escena (las cargas), los
+parámetros de la malla (rango, resolucion, k) y, si se calcularon, las
+mallas Ex, Ey, |E| y V. El .npz se escribe sin comprimir, así que cada
+malla queda como un .npy contiguo dentro del archivo: abrir_campo busca
+dónde empieza cada una y la mapea con np.memmap. Un campo de varios GB se
+abre al instante, sin copiar nada a memoria, y se dibuja sin recalcular
+(por ejemplo con campo_disco.exportar_png, que lo lee por bloques).
+
+El archivo es un .npz normal: np.load lo lee también sin este módulo.
+
+Contenido del archivo:
+
+    metadatos       texto JSON: formato, rango, resolucion, k, dtype
+    cargas          (N, 3) con (carga, pos_x, pos_y)
+    z               (N,) altura de cada carga, opcional (solo si alguna
+                    está fuera del plano z = 0)
+    Ex, Ey, E, V    (resolucion × resolucion), opcionales
+
+Uso:
+
+    python formato_campo.py --resolucion 4000 --salida dipolo.npz
+    python formato_campo.py --abrir dipolo.npz --png dipolo.png
+"""
+import argparse
+import json
+import struct
+import time
+import zipfile
+
+import numpy as np
+
+import motor_campo
+from campo_3d import preparar_cargas_3d
+from campo_disco import CampoEnMalla, exportar_png
+
+# ============================================================================
+# PARÁMETROS DEL FORMATO
+# ============================================================================
+
+# Versión del formato (se guarda en los metadatos)
+FORMATO = 1
+
+# Mallas que puede contener un archivo
+MALLAS = ('Ex', 'Ey', 'E', 'V')
+
+# Lectores de la cabecera .npy según su versión
+_LEER_CABECERA = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+# ============================================================================
+# GUARDAR
+# ============================================================================
+
+def guardar_campo(ruta, cargas, k=1.0, rango=None, resolucion=None, **mallas):
+    """
+    Guarda una escena y, opcionalmente, su campo calculado en un .npz.
+
+    Las mallas se escriben por bloques (np.savez no las copia enteras), así
+    que también sirven los memmaps de campo_disco.CampoEnDisco.
+
+    Parámetros:
+    -----------
+    ruta : str
+        Archivo de salida (np.savez agrega '.npz' si falta)
+    cargas : lista de tuplas o array de numpy (N, 3) o (N, 4)
+        Cada fila contiene (carga, pos_x, pos_y[, pos_z])
+    k : float
+        Constante de Coulomb
+    rango, resolucion : float, int
+        Malla np.meshgrid(linspace(-rango, rango, resolucion), ...); pueden
+        omitirse si solo se guarda la escena
+    **mallas : arrays de numpy (resolucion, resolucion)
+        Cualquiera de Ex, Ey, E, V
+    """
+    for nombre, malla in mallas.items():
+        if nombre not in MALLAS:
+            raise ValueError(f"Malla desconocida '{nombre}' (se esperaba una de {MALLAS})")
+        if resolucion is None or malla.shape != (resolucion, resolucion):
+            raise ValueError(f"La malla '{nombre}' tiene forma {malla.shape}, "
+                             f"se esperaba ({resolucion}, {resolucion})")
+
+    tipos = {np.dtype(m.dtype).name for m in mallas.values()}
+    metadatos = {
+        'formato': FORMATO,
+        'rango': None if rango is None else float(rango),
+        'resolucion': None if resolucion is None else int(resolucion),
+        'k': float(k),
+        'dtype': tipos.pop() if len(tipos) == 1 else None,
+    }
+    cargas = preparar_cargas_3d(cargas)
+    alturas = {'z': cargas[:, 3]} if np.any(cargas[:, 3] != 0) else {}
+    np.savez(ruta, metadatos=np.array(json.dumps(metadatos)),
+             cargas=cargas[:, :3], **alturas, **mallas)
+
+# ============================================================================
+# ABRIR SIN COPIAS
+# ============================================================================
+
+def _mapear_miembro(ruta, archivo, info):
+    """Mapea con np.memmap el .npy guardado sin comprimir en el miembro 'info'"""
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"{ruta}: '{info.filename}' está comprimido y no se puede mapear")
+
+    # Cabecera local del zip: 30 bytes fijos, luego el nombre y el campo extra
+    archivo.seek(info.header_offset)
+    largo_nombre, largo_extra = struct.unpack('<HH', archivo.read(30)[26:30])
+    archivo.seek(info.header_offset + 30 + largo_nombre + largo_extra)
+
+    version = np.lib.format.read_magic(archivo)
+    if version not in _LEER_CABECERA:
+        raise ValueError(f"{ruta}: versión .npy {version} no soportada")
+    forma, fortran, dtype = _LEER_CABECERA[version](archivo)
+    if dtype.hasobject:
+        raise ValueError(f"{ruta}: '{info.filename}' contiene objetos de Python")
+
+    return np.memmap(ruta, dtype=dtype, mode='r', offset=archivo.tell(),
+                     shape=forma, order='F' if fortran else 'C')
+
+
+class CampoGuardado(CampoEnMalla):
+    """
+    Escena y campo leídos de un archivo de guardar_campo.
+
+    Como campo_disco.CampoEnDisco, hereda de CampoEnMalla (rango,
+    resolucion, k, cargas, coordenadas, submuestrear) y agrega Ex, Ey, E y
+    V, así que sirve para submuestrear y exportar_png. Las
+    mallas que no estén en el archivo valen None. 'cargas' es (N, 3) y
+    'cargas_3d' agrega la altura z guardada (0 si el archivo no la trae).
+    """
+
+    def __init__(self, ruta, mmap=True):
+        """
+        Parámetros:
+        -----------
+        ruta : str
+            Archivo .npz escrito por guardar_campo
+        mmap : bool
+            Si es True las mallas se mapean en solo lectura (sin copias); si
+            es False se leen a memoria
+        """
+        self.ruta = ruta
+        with np.load(ruta) as npz:
+            metadatos = json.loads(str(npz['metadatos']))
+            cargas = npz['cargas']
+            self.z = npz['z'] if 'z' in npz.files else np.zeros(len(cargas))
+            nombres = [n for n in MALLAS if n in npz.files]
+            if not mmap:
+                for nombre in nombres:
+                    setattr(self, nombre, npz[nombre])
+
+        if metadatos.get('formato', FORMATO) > FORMATO:
+            raise ValueError(f"{ruta}: formato {metadatos['formato']} más nuevo que {FORMATO}")
+        super().__init__(metadatos['rango'], metadatos['resolucion'], metadatos['k'], cargas)
+
+        if mmap and nombres:
+            with zipfile.ZipFile(ruta) as zf, open(ruta, 'rb') as archivo:
+                for nombre in nombres:
+                    setattr(self, nombre, _mapear_miembro(ruta, archivo, zf.getinfo(nombre + '.npy')))
+
+        for nombre in MALLAS:
+            if nombre not in nombres:
+                setattr(self, nombre, None)
+
+    @property
+    def cargas_3d(self):
+        """Cargas (N, 4) con (carga, pos_x, pos_y, pos_z)"""
+        return np.column_stack([self.cargas, self.z])
+
+    def tiene_campo(self):
+        """True si el archivo trae Ex, Ey y |E|"""
+        return self.Ex is not None and self.Ey is not None and self.E is not None
+
+
+def abrir_campo(ruta, mmap=True):
+    """Atajo: CampoGuardado(ruta, mmap)"""
+    return CampoGuardado(ruta, mmap)
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Guardar y abrir campos del dipolo (.npz)")
+    parser.add_argument('--salida', help="calcular el campo y guardarlo en este .npz")
+    parser.add_argument('--abrir', help="abrir un .npz guardado (sin recalcular)")
+    parser.add_argument('--resolucion', type=int, default=2000)
+    parser.add_argument('--rango', type=float, default=5)
+    parser.add_argument('--float64', action='store_true', help="guardar en doble precisión")
+    parser.add_argument('--png', help="exportar |E| del archivo abierto a este PNG")
+    args = parser.parse_args()
+
+    if args.salida:
+        cargas = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+        dtype = np.float64 if args.float64 else np.float32
+        x = np.linspace(-args.rango, args.rango, args.resolucion)
+        X, Y = np.meshgrid(x, x)
+        inicio = time.perf_counter()
+        V, Ex, Ey = motor_campo.campo_y_potencial(X.astype(dtype), Y.astype(dtype),
+                                                  cargas, workers=None, dtype=dtype)
+        guardar_campo(args.salida, cargas, rango=args.rango, resolucion=args.resolucion,
+                      Ex=Ex, Ey=Ey, E=np.hypot(Ex, Ey), V=V)
+        print(f"💾 {args.salida}: {args.resolucion}×{args.resolucion} "
+              f"en {time.perf_counter() - inicio:.2f} s")
+
+    if args.abrir:
+        inicio = time.perf_counter()
+        campo = abrir_campo(args.abrir)
+        print(f"📂 {args.abrir}: {len(campo.cargas)} cargas, malla "
+              f"{campo.resolucion}×{campo.resolucion}, abierto en "
+              f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+        if args.png and campo.tiene_campo():
+            exportar_png(campo, args.png)
+            print(f"🖼️  {args.png}")
@@ -0,0 +1,264 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Trazado de líneas de campo eléctrico
+
+Descripción: Las líneas de campo son curvas tangentes al campo en cada punto.
+Aquí se siembran alrededor de cada carga positiva y se integran todas a la
+vez con un método Runge–Kutta adaptativo (Dormand–Prince 5(4)) sobre la
+dirección del campo E/|E|. Cada línea tiene su propio tamaño de paso y se
+detiene al llegar a una carga negativa o al salir del dominio [-rango, rango]².
+
+El campo puede evaluarse de forma analítica (Ley de Coulomb con todas las
+cargas, vía motor_campo) o interpolando bilinealmente una malla ya calculada.
+
+Uso básico:
+
+    from lineas_campo import trazar_lineas
+    lineas = trazar_lineas([(1, -1, 0), (-1, 1, 0)], rango=5)
+    # lineas es una lista de arrays (n_i, 2) con los puntos de cada línea
+"""
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Líneas sembradas alrededor de la carga de mayor magnitud (las demás,
+# en proporción a su carga)
+LINEAS_POR_CARGA = 16
+
+# Distancia a la carga donde se siembran las líneas y donde se detienen
+RADIO_SIEMBRA = 0.2
+RADIO_PARADA = 0.2
+
+# Control del paso adaptativo (longitud de arco)
+TOLERANCIA = 1e-3
+PASO_MINIMO = 1e-3
+PASO_MAXIMO = 0.15
+PASOS_MAXIMOS = 1000
+
+# Coeficientes de Dormand–Prince 5(4) (el campo no depende del parámetro,
+# así que los nodos c_i no se usan)
+_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+_B5 = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+_B4 = np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+# ============================================================================
+# EVALUADORES DEL CAMPO
+# ============================================================================
+
+class CampoAnalitico:
+    """Evalúa el campo exacto de las cargas en puntos arbitrarios"""
+
+    def __init__(self, cargas, k=1.0):
+        self.cargas = motor_campo.preparar_cargas(cargas)
+        self.k = k
+
+    def __call__(self, x, y):
+        return motor_campo.campo_electrico(x, y, self.cargas, self.k)
+
+
+class CampoInterpolado:
+    """Evalúa el campo por interpolación bilineal de una malla regular"""
+
+    def __init__(self, x, y, Ex, Ey):
+        """
+        Parámetros:
+        -----------
+        x, y : arrays de numpy 1D
+            Coordenadas (crecientes y equiespaciadas) de columnas y filas
+        Ex, Ey : arrays de numpy (len(y), len(x))
+            Campo sobre la malla, como lo devuelve np.meshgrid(x, y)
+        """
+        self.x0 = x[0]
+        self.y0 = y[0]
+        self.dx = x[1] - x[0]
+        self.dy = y[1] - y[0]
+        self.nx = len(x)
+        self.ny = len(y)
+        self.Ex = np.asarray(Ex, dtype=float)
+        self.Ey = np.asarray(Ey, dtype=float)
+
+    def __call__(self, x, y):
+        fx = np.clip((x - self.x0) / self.dx, 0, self.nx - 1.000001)
+        fy = np.clip((y - self.y0) / self.dy, 0, self.ny - 1.000001)
+        i = fx.astype(int)
+        j = fy.astype(int)
+        tx = fx - i
+        ty = fy - j
+
+        def interpolar(F):
+            return ((1 - tx) * (1 - ty) * F[j, i] + tx * (1 - ty) * F[j, i + 1] +
+                    (1 - tx) * ty * F[j + 1, i] + tx * ty * F[j + 1, i + 1])
+
+        return interpolar(self.Ex), interpolar(self.Ey)
+
+# ============================================================================
+# SIEMBRA E INTEGRACIÓN
+# ============================================================================
+
+def sembrar(cargas, lineas_por_carga=LINEAS_POR_CARGA, radio=RADIO_SIEMBRA):
+    """
+    Genera los puntos iniciales de las líneas alrededor de las cargas fuente.
+
+    Las fuentes son las cargas positivas; si no hay ninguna, se siembra
+    alrededor de las negativas y las líneas se integran en sentido contrario.
+
+    Retorna:
+    --------
+    x0, y0 : arrays de numpy
+        Puntos iniciales
+    sentido : float
+        +1 para seguir el campo, -1 para seguirlo en sentido contrario
+    """
+    cargas = motor_campo.preparar_cargas(cargas)
+    sentido = 1.0
+    fuentes = cargas[cargas[:, 0] > 0]
+    if len(fuentes) == 0:
+        fuentes = cargas[cargas[:, 0] < 0]
+        sentido = -1.0
+    if len(fuentes) == 0:
+        return np.zeros(0), np.zeros(0), sentido
+
+    q_max = np.abs(fuentes[:, 0]).max()
+    xs, ys = [], []
+    for q, cx, cy in fuentes:
+        n = max(1, int(round(lineas_por_carga * abs(q) / q_max)))
+        angulos = 2 * np.pi * (np.arange(n) + 0.5) / n
+        xs.append(cx + radio * np.cos(angulos))
+        ys.append(cy + radio * np.sin(angulos))
+    return np.concatenate(xs), np.concatenate(ys), sentido
+
+
+def trazar_lineas(cargas, k=1.0, rango=5, lineas_por_carga=LINEAS_POR_CARGA,
+                  campo=None, tolerancia=TOLERANCIA, pasos_maximos=PASOS_MAXIMOS,
+                  radio_siembra=RADIO_SIEMBRA, radio_parada=RADIO_PARADA):
+    """
+    Traza las líneas de campo de un conjunto de cargas.
+
+    Todas las líneas avanzan juntas: cada iteración evalúa el campo en los
+    puntos de todas las líneas activas a la vez y cada línea acepta o
+    rechaza su paso según su propio error estimado.
+
+    Parámetros:
+    -----------
+    cargas : lista de tuplas o array de numpy (N, 3)
+        Cada fila contiene (carga, pos_x, pos_y)
+    k : float
+        Constante de Coulomb
+    rango : float
+        Las líneas se detienen al salir de [-rango, rango]²
+    lineas_por_carga : int
+        Líneas sembradas alrededor de la carga fuente de mayor magnitud
+    campo : función (x, y) -> (Ex, Ey), opcional
+        Evaluador del campo; por defecto CampoAnalitico(cargas, k)
+    tolerancia : float
+        Error local máximo por paso (en unidades de longitud)
+    pasos_maximos : int
+        Número máximo de puntos por línea
+    radio_siembra, radio_parada : float
+        Distancia a la carga donde empiezan y donde terminan las líneas
+
+    Retorna:
+    --------
+    lista de arrays de numpy (n_i, 2)
+        Puntos de cada línea de campo
+    """
+    cargas = motor_campo.preparar_cargas(cargas)
+    if campo is None:
+        campo = CampoAnalitico(cargas, k)
+
+    x, y, sentido = sembrar(cargas, lineas_por_carga, radio_siembra)
+    n = len(x)
+    if n == 0:
+        return []
+
+    # Las líneas terminan en las cargas de signo contrario al de las fuentes
+    sumideros = cargas[sentido * cargas[:, 0] < 0]
+
+    def direccion(px, py):
+        """Dirección unitaria del campo (con el sentido de integración)"""
+        Ex, Ey = campo(px, py)
+        norma = np.sqrt(Ex * Ex + Ey * Ey) + 1e-300
+        return sentido * Ex / norma, sentido * Ey / norma
+
+    # Puntos de todas las líneas (se rellena solo hasta 'cuenta' en cada una)
+    puntos = np.full((pasos_maximos, n, 2), np.nan)
+    puntos[0, :, 0] = x
+    puntos[0, :, 1] = y
+    cuenta = np.ones(n, dtype=int)
+
+    activas = np.arange(n)
+    h = np.full(n, 0.05)
+    kx = np.empty((7, n))
+    ky = np.empty((7, n))
+
+    # Dirección en el último punto de cada línea (para detectar estancamiento)
+    previa = np.zeros((n, 2))
+
+    while len(activas) > 0:
+        px = x[activas]
+        py = y[activas]
+        ha = h[activas]
+        m = len(activas)
+
+        # Etapas de Dormand–Prince evaluadas para todas las líneas activas
+        for etapa in range(7):
+            sx = px.copy()
+            sy = py.copy()
+            for j, a in enumerate(_A[etapa]):
+                if a != 0:
+                    sx += ha * a * kx[j, :m]
+                    sy += ha * a * ky[j, :m]
+            kx[etapa, :m], ky[etapa, :m] = direccion(sx, sy)
+
+        x5 = px + ha * (_B5 @ kx[:, :m])
+        y5 = py + ha * (_B5 @ ky[:, :m])
+        x4 = px + ha * (_B4 @ kx[:, :m])
+        y4 = py + ha * (_B4 @ ky[:, :m])
+        error = np.hypot(x5 - x4, y5 - y4)
+
+        # Una línea cuya dirección se invierte de un punto al siguiente quedó
+        # atrapada en un punto donde el campo se anula (frecuente con muchas
+        # cargas): se detiene ahí en lugar de oscilar hasta pasos_maximos
+        estancada = kx[0, :m] * previa[activas, 0] + ky[0, :m] * previa[activas, 1] < -0.5
+        previa[activas, 0] = kx[0, :m]
+        previa[activas, 1] = ky[0, :m]
+
+        # Aceptar los pasos con error suficientemente pequeño
+        acepta = (error <= tolerancia) | (ha <= PASO_MINIMO)
+        idx = activas[acepta]
+        x[idx] = x5[acepta]
+        y[idx] = y5[acepta]
+        puntos[cuenta[idx], idx, 0] = x[idx]
+        puntos[cuenta[idx], idx, 1] = y[idx]
+        cuenta[idx] += 1
+
+        # Nuevo tamaño de paso para cada línea
+        factor = 0.9 * (tolerancia / np.maximum(error, 1e-16)) ** 0.2
+        h[activas] = np.clip(ha * np.clip(factor, 0.2, 5.0), PASO_MINIMO, PASO_MAXIMO)
+
+        # Criterios de parada: fuera del dominio, sobre un sumidero o sin espacio
+        fin = (np.abs(x[idx]) > rango) | (np.abs(y[idx]) > rango)
+        fin |= cuenta[idx] >= pasos_maximos
+        if len(sumideros) > 0:
+            d2 = ((x[idx, None] - sumideros[:, 1])**2 +
+                  (y[idx, None] - sumideros[:, 2])**2)
+            fin |= (d2 < radio_parada**2).any(axis=1)
+
+        terminadas = np.zeros(n, dtype=bool)
+        terminadas[idx[fin]] = True
+        terminadas[activas[estancada]] = True
+        activas = activas[~terminadas[activas]]
+
+    return [puntos[:cuenta[i], i] for i in range(n)]
@@ -0,0 +1,407 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Motor de cálculo del campo eléctrico (sin interfaz gráfica)
+
+Descripción: Este módulo contiene únicamente el núcleo numérico de la Ley de
+Coulomb y el principio de superposición. Solo depende de NumPy, de modo que
+puede importarse en procesos sin pantalla (cálculos por lotes, servidores,
+notebooks) sin cargar tkinter, customtkinter ni matplotlib.
+
+Uso básico:
+
+    from motor_campo import campo_electrico
+    Ex, Ey = campo_electrico(X, Y, [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)], k=1.0)
+
+Precisión simple (dtype=np.float32):
+
+    El resultado solo alimenta un mapa de colores y flechas unitarias, así
+    que puede calcularse en float32: la mitad de memoria y de ancho de banda
+    y el doble de elementos por instrucción SIMD. Las restas punto − carga
+    se hacen en float64 (con las coordenadas tal como llegan) y se redondean
+    a float32 una sola vez, de modo que cerca de una carga, incluso donde
+    domina el suavizado EPSILON, el error relativo de cada término no crece.
+    El resto del cálculo y la suma sobre las cargas se hacen en float32.
+
+    Cota de error respecto a float64, por componente y en cada punto:
+
+        |E32 − E64| ≤ (N + 8) · u · Σᵢ |k·qᵢ| / (rᵢ² + EPSILON)
+
+    con N el número de cargas y u = 2⁻²⁴ ≈ 6·10⁻⁸. Para V vale lo mismo con
+    Σᵢ |k·qᵢ| / rᵢ. Es una cota relativa a la suma de magnitudes de las
+    contribuciones: donde estas se cancelan (lejos de un dipolo, o justo
+    entre dos cargas iguales) el error relativo a |E| puede ser mayor.
+    benchmarks.py precision mide el error y la cota en mallas grandes.
+"""
+import atexit
+import os
+
+import numpy as np
+
+# ============================================================================
+# CONSTANTES DEL MOTOR
+# ============================================================================
+
+# Suavizado para evitar la división por cero justo sobre una carga
+EPSILON = 1e-10
+
+# Número máximo de pares (punto, carga) que se evalúan a la vez. Con float64
+# cada buffer de trabajo ocupa 8 MB (4 MB con float32), y se usan cuatro.
+TAM_BLOQUE = 1 << 20
+
+# Tipos de dato admitidos para el cálculo
+PRECISIONES = (np.dtype(np.float64), np.dtype(np.float32))
+
+# ============================================================================
+# FUNCIONES PARA CALCULAR EL CAMPO ELÉCTRICO
+# ============================================================================
+
+def preparar_cargas(cargas):
+    """
+    Convierte una colección de cargas a un array de NumPy de forma (N, 3).
+
+    Parámetros:
+    -----------
+    cargas : lista de tuplas o array de numpy
+        Cada fila contiene (carga, pos_x, pos_y)
+
+    Retorna:
+    --------
+    array de numpy (N, 3)
+        Columnas: carga, pos_x, pos_y
+    """
+    cargas = np.asarray(cargas, dtype=float)
+    if cargas.size == 0:
+        return np.zeros((0, 3))
+    cargas = np.atleast_2d(cargas)
+    if cargas.ndim != 2 or cargas.shape[1] != 3:
+        raise ValueError("cargas debe tener forma (N, 3): (carga, pos_x, pos_y)")
+    return cargas
+
+
+def bloques(total, tam):
+    """Genera los intervalos [inicio, fin) que parten 'total' en bloques de 'tam'"""
+    for inicio in range(0, total, tam):
+        yield inicio, min(inicio + tam, total)
+
+
+def campo_electrico(x, y, cargas, k=1.0, out=None, tam_bloque=TAM_BLOQUE,
+                    workers=1, backend='hilos', dtype=np.float64):
+    """
+    Calcula el campo eléctrico en los puntos (x, y) debido a un conjunto de cargas.
+
+    El cálculo está vectorizado: los puntos y las cargas se recorren en
+    bloques de a lo más 'tam_bloque' pares (punto, carga), evaluados con
+    broadcasting sobre buffers reservados una sola vez. Así la memoria
+    auxiliar queda acotada sin importar cuántas cargas haya.
+
+    Con workers > 1 los puntos se reparten en teselas que se evalúan en
+    paralelo (ver la sección de ejecución paralela más abajo).
+
+    Parámetros:
+    -----------
+    x, y : arrays de numpy
+        Coordenadas de los puntos donde calcular el campo (malla o nube de
+        puntos, cualquier forma siempre que ambas coincidan)
+    cargas : lista de tuplas o array de numpy (N, 3)
+        Cada fila contiene (carga, pos_x, pos_y)
+    k : float
+        Constante de Coulomb
+    out : tupla (Ex, Ey), opcional
+        Arrays contiguos con la forma de x donde escribir el resultado
+    tam_bloque : int
+        Número máximo de pares (punto, carga) evaluados a la vez por worker
+    workers : int o None
+        Número de workers en paralelo (None = todos los núcleos)
+    backend : str
+        'hilos' (ThreadPoolExecutor) o 'procesos' (ProcessPoolExecutor)
+    dtype : np.float64 o np.float32
+        Precisión del cálculo y de los resultados (ver la cota de error de
+        float32 en la descripción del módulo)
+
+    Retorna:
+    --------
+    Ex, Ey : arrays de numpy
+        Componentes x e y del campo eléctrico, con la forma de x
+    """
+    return _evaluar(x, y, cargas, k, out, tam_bloque, workers, backend, dtype,
+                    con_potencial=False)
+
+
+def campo_y_potencial(x, y, cargas, k=1.0, out=None, tam_bloque=TAM_BLOQUE,
+                      workers=1, backend='hilos', dtype=np.float64):
+    """
+    Calcula en un solo recorrido el potencial y el campo eléctrico.
+
+    El potencial V = Σ k·q / r comparte con el campo el cálculo de las
+    distancias: en cada bloque se obtiene k·q / r, se suma para V y se
+    divide entre r² para obtener k·q / r³, el factor del campo. Así V, Ex
+    y Ey salen de una sola pasada por memoria.
+
+    Parámetros:
+    -----------
+    x, y, cargas, k, tam_bloque, workers, backend, dtype :
+        Igual que en campo_electrico
+    out : tupla (V, Ex, Ey), opcional
+        Arrays contiguos con la forma de x donde escribir el resultado
+
+    Retorna:
+    --------
+    V, Ex, Ey : arrays de numpy
+        Potencial y componentes del campo, con la forma de x
+    """
+    # El núcleo acumula en el orden (Ex, Ey, V); _evaluar rechaza otro largo
+    if out is not None and len(out) == 3:
+        out = (out[1], out[2], out[0])
+    Ex, Ey, V = _evaluar(x, y, cargas, k, out, tam_bloque, workers, backend, dtype,
+                         con_potencial=True)
+    return V, Ex, Ey
+
+
+def _evaluar(x, y, cargas, k, out, tam_bloque, workers, backend, dtype, con_potencial):
+    """
+    Prepara entradas y salidas y reparte el trabajo (serie o paralelo).
+
+    Retorna (Ex, Ey) o, con con_potencial, (Ex, Ey, V).
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in PRECISIONES:
+        raise ValueError("dtype debe ser np.float64 o np.float32")
+
+    # Las coordenadas en float32 se aceptan sin copiarlas a float64
+    x = np.asarray(x)
+    y = np.asarray(y)
+    x = x.astype(np.result_type(x.dtype, dtype), copy=False)
+    y = y.astype(np.result_type(y.dtype, dtype), copy=False)
+    if x.shape != y.shape:
+        raise ValueError("x e y deben tener la misma forma")
+    cargas = preparar_cargas(cargas)
+
+    n_salidas = 3 if con_potencial else 2
+    if out is None:
+        resultado = tuple(np.zeros(x.shape, dtype=dtype) for _ in range(n_salidas))
+    else:
+        resultado = tuple(out)
+        validar_salidas(resultado, n_salidas, x.shape, dtype)
+        for arr in resultado:
+            arr[...] = 0.0
+
+    if x.size == 0 or len(cargas) == 0:
+        return resultado
+
+    px = x.reshape(-1)
+    py = y.reshape(-1)
+    salidas = tuple(arr.reshape(-1) for arr in resultado)
+
+    workers = _numero_workers(workers)
+    if workers > 1 and x.size >= MIN_PUNTOS_PARALELO:
+        _acumular_en_paralelo(px, py, cargas, k, salidas, tam_bloque, workers, backend,
+                              dtype)
+    else:
+        acumular_campo((px, py), cargas, k, salidas, tam_bloque, dtype)
+
+    return resultado
+
+
+def validar_salidas(salidas, n_salidas, forma, dtype):
+    """
+    Comprueba los arrays 'out' dados por quien llama.
+
+    El núcleo escribe sobre salida.reshape(-1): con un array no contiguo
+    eso sería una copia y el resultado se perdería sin aviso, así que se
+    exige la forma, el tipo y la contigüidad exactos.
+    """
+    if len(salidas) != n_salidas:
+        raise ValueError(f"out debe tener {n_salidas} arrays, tiene {len(salidas)}")
+    for arr in salidas:
+        if not isinstance(arr, np.ndarray):
+            raise ValueError("out debe contener arrays de numpy")
+        if arr.shape != forma:
+            raise ValueError(f"out tiene forma {arr.shape}, se esperaba {forma}")
+        if arr.dtype != dtype:
+            raise ValueError(f"out tiene dtype {arr.dtype}, se esperaba {dtype}")
+        if not arr.flags.c_contiguous or not arr.flags.writeable:
+            raise ValueError("out debe contener arrays contiguos (orden C) y escribibles")
+
+
+def acumular_campo(puntos, cargas, k, salidas, tam_bloque=TAM_BLOQUE,
+                   dtype=np.float64):
+    """
+    Suma el campo de las cargas en los puntos sobre las salidas.
+
+    Es el núcleo de Coulomb de campo_electrico y de campo_3d, y sirve en
+    cualquier dimensión D: puntos = (px, py) o (px, py, pz) y cada fila de
+    cargas es (carga, pos_x, pos_y[, pos_z]). Todos los arrays son
+    unidimensionales; las salidas (una por eje y, si hay una más, el
+    potencial) se modifican en su lugar. 'dtype' es el tipo de los buffers
+    de trabajo.
+    """
+    dimension = len(puntos)
+    salida_v = salidas[dimension] if len(salidas) > dimension else None
+    n_puntos = len(puntos[0])
+    n_cargas = len(cargas)
+
+    # Tamaño de los bloques: primero tantas cargas como quepan, luego puntos
+    bloque_cargas = max(1, min(n_cargas, tam_bloque))
+    bloque_puntos = max(1, min(n_puntos, tam_bloque // bloque_cargas))
+    tam = bloque_puntos * bloque_cargas
+
+    # Buffers de trabajo reservados una sola vez: una diferencia por eje
+    buf_d = [np.empty(tam, dtype=dtype) for _ in range(dimension)]
+    buf_r2 = np.empty(tam, dtype=dtype)
+    buf_w = np.empty(tam, dtype=dtype)
+    parcial = np.empty(bloque_puntos, dtype=dtype)
+
+    # Las posiciones de las cargas quedan en float64: la resta punto − carga
+    # se hace con toda la precisión y se redondea una vez al guardarla en d
+    kq = (k * cargas[:, 0]).astype(dtype)
+    posiciones = [cargas[:, 1 + eje] for eje in range(dimension)]
+
+    for c0, c1 in bloques(n_cargas, bloque_cargas):
+        nc = c1 - c0
+        for p0, p1 in bloques(n_puntos, bloque_puntos):
+            n_p = p1 - p0
+            forma = (n_p, nc)
+            d = [b[:n_p * nc].reshape(forma) for b in buf_d]
+            r2 = buf_r2[:n_p * nc].reshape(forma)
+            w = buf_w[:n_p * nc].reshape(forma)
+            s = parcial[:n_p]
+
+            # Vectores desde cada carga hasta cada punto
+            for eje in range(dimension):
+                np.subtract(puntos[eje][p0:p1, None], posiciones[eje][c0:c1], out=d[eje])
+
+            # r² = |d|² + epsilon
+            np.multiply(d[0], d[0], out=r2)
+            for eje in range(1, dimension):
+                np.multiply(d[eje], d[eje], out=w)
+                np.add(r2, w, out=r2)
+            r2 += EPSILON
+
+            # w = k·q / r: contribución de cada carga al potencial
+            np.sqrt(r2, out=w)
+            np.divide(kq[c0:c1], w, out=w)
+            if salida_v is not None:
+                np.sum(w, axis=1, out=s)
+                salida_v[p0:p1] += s
+
+            # w = k·q / r³, calculado una sola vez para todas las componentes
+            np.divide(w, r2, out=w)
+
+            # Ley de Coulomb con superposición: suma sobre las cargas
+            for eje in range(dimension):
+                np.einsum('pc,pc->p', d[eje], w, out=s)
+                salidas[eje][p0:p1] += s
+
+# ============================================================================
+# EJECUCIÓN PARALELA POR TESELAS
+# ============================================================================
+
+# Por debajo de este número de puntos el costo de repartir el trabajo supera
+# la ganancia, y se calcula en un solo núcleo aunque se pidan más workers
+MIN_PUNTOS_PARALELO = 16384
+
+# Teselas por worker: más de una para equilibrar la carga entre núcleos
+TESELAS_POR_WORKER = 4
+
+# Pools reutilizados entre llamadas, indexados por (backend, workers)
+_pools = {}
+
+
+def _numero_workers(workers):
+    """Normaliza el parámetro workers (None = todos los núcleos disponibles)"""
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def _obtener_pool(backend, workers):
+    """Devuelve (creando si hace falta) el pool del backend pedido"""
+    # Los pools se importan aquí y no al inicio del módulo: el camino serie
+    # (workers=1, el valor por defecto) no los necesita y así no paga su importación
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    clave = (backend, workers)
+    if clave not in _pools:
+        if backend == 'hilos':
+            _pools[clave] = ThreadPoolExecutor(max_workers=workers)
+        elif backend == 'procesos':
+            _pools[clave] = ProcessPoolExecutor(max_workers=workers)
+        else:
+            raise ValueError("backend debe ser 'hilos' o 'procesos'")
+    return _pools[clave]
+
+
+def cerrar_pools():
+    """Libera los pools de hilos y procesos creados por campo_electrico"""
+    for pool in _pools.values():
+        pool.shutdown(wait=True)
+    _pools.clear()
+
+
+atexit.register(cerrar_pools)
+
+
+def _teselas(n_puntos, workers):
+    """Parte el rango de puntos en intervalos contiguos, uno por tesela"""
+    n_teselas = min(n_puntos, workers * TESELAS_POR_WORKER)
+    limites = np.linspace(0, n_puntos, n_teselas + 1).astype(int)
+    return list(zip(limites[:-1], limites[1:]))
+
+
+def _acumular_en_paralelo(px, py, cargas, k, salidas, tam_bloque, workers, backend,
+                          dtype=np.float64):
+    """Reparte acumular_campo en teselas sobre un pool de hilos o procesos"""
+    pool = _obtener_pool(backend, workers)
+    teselas = _teselas(len(px), workers)
+
+    if backend == 'hilos':
+        # NumPy libera el GIL en los ufuncs: cada hilo escribe directamente
+        # en su porción de los arrays de salida, sin copias intermedias
+        futuros = [pool.submit(acumular_campo, (px[a:b], py[a:b]), cargas, k,
+                               tuple(salida[a:b] for salida in salidas), tam_bloque,
+                               dtype)
+                   for a, b in teselas]
+        for futuro in futuros:
+            futuro.result()
+        return
+
+    # Con procesos, entradas y salidas viven en memoria compartida: cada
+    # proceso lee sus coordenadas y escribe su tesela en el mismo bloque.
+    # El bloque es float64 para no redondear las coordenadas; 'dtype' solo
+    # decide el tipo de los buffers de trabajo de cada proceso.
+    from multiprocessing import shared_memory
+
+    n = len(px)
+    filas = 2 + len(salidas)
+    memoria = shared_memory.SharedMemory(create=True, size=filas * n * 8)
+    try:
+        compartido = np.ndarray((filas, n), dtype=float, buffer=memoria.buf)
+        compartido[0] = px
+        compartido[1] = py
+        compartido[2:] = 0.0
+        futuros = [pool.submit(_tesela_compartida, memoria.name, filas, n, a, b,
+                               cargas, k, tam_bloque, dtype)
+                   for a, b in teselas]
+        for futuro in futuros:
+            futuro.result()
+        for i, salida in enumerate(salidas):
+            salida += compartido[2 + i]
+        del compartido
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def _tesela_compartida(nombre, filas, n, a, b, cargas, k, tam_bloque, dtype=np.float64):
+    """Evalúa una tesela dentro de un proceso worker (memoria compartida)"""
+    from multiprocessing import shared_memory
+
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        compartido = np.ndarray((filas, n), dtype=float, buffer=memoria.buf)
+        acumular_campo((compartido[0, a:b], compartido[1, a:b]), cargas, k,
+                        tuple(compartido[i, a:b] for i in range(2, filas)), tam_bloque,
+                        dtype)
+        del compartido
+    finally:
+        memoria.close()
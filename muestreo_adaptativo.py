@@ -0,0 +1,266 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Muestreo adaptativo del campo eléctrico (árbol de cuadrantes)
+
+Descripción: En una malla uniforme la mayoría de los puntos caen lejos de
+las cargas, donde el campo varía suavemente, mientras que alrededor de cada
+carga (donde |E| crece como 1/r²) faltan puntos. Aquí el dominio se parte
+en celdas cuadradas que se subdividen solo donde hace falta:
+
+    - la celda está a menos de 'radio_carga' de una carga, o
+    - ln|E| varía más que 'tolerancia' entre sus esquinas y su centro.
+
+El campo se evalúa solo en las esquinas de las celdas (cada punto una sola
+vez) y luego se remuestrea a la malla de pantalla interpolando ln|E|
+bilinealmente dentro de cada hoja.
+
+El nivel más fino se deduce de la malla de pantalla: las hojas más chicas
+miden al menos un píxel (celdas_base·2^nivel_maximo ≤ resolucion − 1), ya
+que subdividir por debajo del píxel evalúa puntos que la pantalla no
+muestra. Así el árbol nunca evalúa más puntos que píxeles tiene la malla,
+y donde el campo es suave (la mayor parte del dominio) evalúa muchos menos.
+El modo "Imagen (fina)" del simulador lo usa así (benchmarks.py lo compara
+con la evaluación directa de la malla de pantalla).
+
+Uso básico:
+
+    from muestreo_adaptativo import MuestreoAdaptativo
+    muestreo = MuestreoAdaptativo([(1, -1, 0), (-1, 1, 0)], rango=5, resolucion=400)
+    E = muestreo.remuestrear()        # |E| sobre una malla 400×400
+    print(muestreo.evaluaciones)
+"""
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Celdas por lado del nivel 0 y niveles de subdivisión cuando no se da la
+# malla de pantalla (con ella, ver nivel_para_resolucion)
+CELDAS_BASE = 16
+NIVEL_MAXIMO = 6
+
+# Variación máxima de ln|E| dentro de una hoja (0.2 ≈ 20 % de cambio)
+TOLERANCIA = 0.2
+
+# Las celdas a menos de esta distancia de una carga se subdividen siempre
+# (el radio de los círculos que dibujan las cargas)
+RADIO_CARGA = 0.2
+
+# ============================================================================
+# CLASE DEL MUESTREO ADAPTATIVO
+# ============================================================================
+
+def nivel_para_resolucion(resolucion, celdas_base=CELDAS_BASE):
+    """
+    Nivel de subdivisión más profundo cuyas hojas miden al menos un píxel.
+
+    Los píxeles de np.linspace(-rango, rango, resolucion) están separados
+    2·rango/(resolucion − 1); las hojas del nivel L miden 2·rango/(celdas_base·2^L).
+
+    Retorna:
+    --------
+    int
+        El mayor L ≥ 0 con celdas_base·2^L ≤ resolucion − 1
+    """
+    nivel = 0
+    while celdas_base * 2**(nivel + 1) <= resolucion - 1:
+        nivel += 1
+    return nivel
+
+
+class MuestreoAdaptativo:
+    """Árbol de cuadrantes con ln|E| en las esquinas de cada hoja"""
+
+    def __init__(self, cargas, k=1.0, rango=5, resolucion=None, celdas_base=CELDAS_BASE,
+                 nivel_maximo=None, tolerancia=TOLERANCIA, radio_carga=RADIO_CARGA):
+        """
+        Construye el árbol evaluando el campo nivel por nivel.
+
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Cada fila contiene (carga, pos_x, pos_y)
+        k : float
+            Constante de Coulomb
+        rango : float
+            El dominio es [-rango, rango]²
+        resolucion : int, opcional
+            Puntos por lado de la malla de pantalla; limita nivel_maximo a
+            nivel_para_resolucion(resolucion, celdas_base)
+        celdas_base : int
+            Celdas por lado del nivel 0
+        nivel_maximo : int, opcional
+            Niveles de subdivisión como máximo (NIVEL_MAXIMO si no se dan
+            ni este ni 'resolucion')
+        tolerancia : float
+            Variación máxima de ln|E| en una hoja
+        radio_carga : float
+            Distancia a una carga por debajo de la cual se subdivide siempre
+        """
+        self.cargas = motor_campo.preparar_cargas(cargas)
+        self.k = k
+        self.rango = rango
+        self.resolucion = resolucion
+        self.celdas_base = celdas_base
+        if resolucion is not None:
+            limite = nivel_para_resolucion(resolucion, celdas_base)
+            nivel_maximo = limite if nivel_maximo is None else min(nivel_maximo, limite)
+        self.nivel_maximo = NIVEL_MAXIMO if nivel_maximo is None else nivel_maximo
+        self.tolerancia = tolerancia
+        self.radio_carga = radio_carga
+
+        # Retícula más fina: las esquinas de todas las celdas son enteros
+        # (ix, iy) en 0..n_fino, con separación h_fino
+        self.n_fino = celdas_base * 2**nivel_maximo
+        self.h_fino = 2 * rango / self.n_fino
+
+        # Puntos ya evaluados: claves iy·(n_fino+1)+ix ordenadas y ln|E|
+        self._claves = np.zeros(0, dtype=np.int64)
+        self._valores = np.zeros(0)
+        self.evaluaciones = 0
+
+        self._construir()
+
+    def _ln_magnitud(self, ix, iy):
+        """ln|E| en los puntos enteros (ix, iy); cada punto se evalúa una vez"""
+        claves = iy.astype(np.int64) * (self.n_fino + 1) + ix
+        nuevas = np.unique(claves)
+        nuevas = nuevas[~np.isin(nuevas, self._claves, assume_unique=True)]
+
+        if len(nuevas) > 0:
+            px = -self.rango + (nuevas % (self.n_fino + 1)) * self.h_fino
+            py = -self.rango + (nuevas // (self.n_fino + 1)) * self.h_fino
+            Ex, Ey = motor_campo.campo_electrico(px, py, self.cargas, self.k)
+            valores = np.log(np.hypot(Ex, Ey) + 1e-300)
+            self.evaluaciones += len(nuevas)
+
+            claves_todas = np.concatenate([self._claves, nuevas])
+            orden = np.argsort(claves_todas, kind='stable')
+            self._claves = claves_todas[orden]
+            self._valores = np.concatenate([self._valores, valores])[orden]
+
+        return self._valores[np.searchsorted(self._claves, claves)]
+
+    def _cerca_de_carga(self, i, j, lado):
+        """Celdas (i, j) de 'lado' unidades finas a menos de radio_carga de una carga"""
+        n = self.n_fino // lado
+        ancho = lado * self.h_fino
+        r = self.radio_carga
+        bordes = -self.rango + np.arange(n) * ancho
+
+        # Tabla de celdas cercanas: cada carga marca solo las celdas de su
+        # caja [q - r, q + r]², así el costo no es (celdas × cargas)
+        cerca = np.zeros((n, n), dtype=bool)
+        for _, qx, qy in self.cargas:
+            i0 = max(int(np.floor((qx - r + self.rango) / ancho)), 0)
+            i1 = min(int(np.floor((qx + r + self.rango) / ancho)), n - 1)
+            j0 = max(int(np.floor((qy - r + self.rango) / ancho)), 0)
+            j1 = min(int(np.floor((qy + r + self.rango) / ancho)), n - 1)
+            if i0 > i1 or j0 > j1:
+                continue
+
+            # Distancia de la carga al rectángulo de cada celda de la caja
+            x0 = bordes[i0:i1 + 1]
+            y0 = bordes[j0:j1 + 1]
+            dx = np.maximum(np.maximum(x0 - qx, qx - (x0 + ancho)), 0)
+            dy = np.maximum(np.maximum(y0 - qy, qy - (y0 + ancho)), 0)
+            cerca[j0:j1 + 1, i0:i1 + 1] |= dy[:, None]**2 + dx**2 < r**2
+        return cerca[j, i]
+
+    def _construir(self):
+        """Subdivide nivel por nivel y guarda las hojas de cada nivel"""
+        # Por nivel: índices (i, j) de las hojas y ln|E| en sus cuatro esquinas
+        self.hojas = []
+
+        b = self.celdas_base
+        j, i = np.divmod(np.arange(b * b), b)
+        for nivel in range(self.nivel_maximo + 1):
+            lado = 2**(self.nivel_maximo - nivel)
+            x0, y0 = i * lado, j * lado
+            medio = lado // 2
+
+            # Esquinas y centro de todas las celdas del nivel en una sola
+            # evaluación (columnas: 4 esquinas y centro)
+            px = np.stack([x0, x0 + lado, x0, x0 + lado, x0 + medio], axis=1)
+            py = np.stack([y0, y0, y0 + lado, y0 + lado, y0 + medio], axis=1)
+            if nivel == self.nivel_maximo:
+                px, py = px[:, :4], py[:, :4]
+            muestras = self._ln_magnitud(px.ravel(), py.ravel()).reshape(px.shape)
+            esquinas = muestras[:, :4]
+
+            if nivel == self.nivel_maximo:
+                subdividir = np.zeros(len(i), dtype=bool)
+            else:
+                variacion = muestras.max(axis=1) - muestras.min(axis=1)
+                subdividir = (variacion > self.tolerancia) | self._cerca_de_carga(i, j, lado)
+
+            hoja = ~subdividir
+            self.hojas.append((i[hoja], j[hoja], esquinas[hoja]))
+
+            # Cuatro hijas por cada celda subdividida
+            i = np.repeat(2 * i[subdividir], 4) + np.tile([0, 1, 0, 1], subdividir.sum())
+            j = np.repeat(2 * j[subdividir], 4) + np.tile([0, 0, 1, 1], subdividir.sum())
+            if len(i) == 0:
+                break
+
+    def numero_hojas(self):
+        """Total de hojas del árbol"""
+        return sum(len(i) for i, _, _ in self.hojas)
+
+    def remuestrear(self, resolucion=None):
+        """
+        |E| sobre la malla np.meshgrid(linspace(-rango, rango, resolucion), ...).
+
+        Cada punto se interpola bilinealmente (en ln|E|) dentro de su hoja.
+        Por defecto se usa la resolución dada al construir el árbol.
+
+        Retorna:
+        --------
+        array de numpy (resolucion, resolucion)
+        """
+        if resolucion is None:
+            resolucion = self.resolucion
+        x = np.linspace(-self.rango, self.rango, resolucion)
+        u = (x + self.rango) / self.h_fino
+        celda = np.minimum(u.astype(int), self.n_fino - 1)
+        U, V = np.meshgrid(u, u)
+        CX, CY = np.meshgrid(celda, celda)
+
+        resultado = np.empty(U.shape)
+        for nivel, (i, j, esquinas) in enumerate(self.hojas):
+            if len(i) == 0:
+                continue
+            lado = 2**(self.nivel_maximo - nivel)
+            n = self.celdas_base * 2**nivel
+
+            # Tabla densa de este nivel: índice de hoja o -1
+            tabla = np.full((n, n), -1, dtype=np.int64)
+            tabla[j, i] = np.arange(len(i))
+            ids = tabla[CY // lado, CX // lado]
+            dentro = ids >= 0
+            ids = ids[dentro]
+
+            tx = U[dentro] / lado - i[ids]
+            ty = V[dentro] / lado - j[ids]
+            e = esquinas[ids]
+            resultado[dentro] = ((1 - tx) * (1 - ty) * e[:, 0] + tx * (1 - ty) * e[:, 1] +
+                                 (1 - tx) * ty * e[:, 2] + tx * ty * e[:, 3])
+
+        return np.exp(resultado)
+
+
+def magnitud_adaptativa(cargas, k=1.0, rango=5, resolucion=400, **opciones):
+    """
+    Atajo: construye el árbol para la malla de pantalla y remuestrea |E|.
+
+    Retorna:
+    --------
+    E : array de numpy (resolucion, resolucion)
+    evaluaciones : int
+        Puntos donde se evaluó el campo
+    """
+    muestreo = MuestreoAdaptativo(cargas, k, rango, resolucion, **opciones)
+    return muestreo.remuestrear(), muestreo.evaluaciones
@@ -0,0 +1,272 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Partículas de prueba moviéndose en el campo de las cargas
+
+Descripción: Suelta muchas partículas de prueba (cargas pequeñas que no
+modifican el campo) y las mueve con la fuerza F = q·E. Todas las partículas
+avanzan a la vez con el método de Verlet en velocidades (leapfrog):
+
+    v ← v + (dt/2)·a
+    x ← x + dt·v
+    a ← (q/m)·E(x)          (Ley de Coulomb, vía motor_campo)
+    v ← v + (dt/2)·a
+
+El estado se guarda como estructura de arrays (x, y, vx, vy, ax, ay, q/m,
+estado), un array por magnitud, y en cada paso solo se evalúan las
+partículas que siguen activas. Una partícula se detiene al chocar con una
+carga (a menos de 'radio' de su centro, el radio de los círculos del
+simulador) o al salir del dominio [-rango, rango]².
+
+Uso:
+
+    python particulas.py --particulas 100000 --pasos 500 --png trayectorias.png
+"""
+import argparse
+import time
+
+import numpy as np
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+K = 1.0
+RANGO = 5
+DT = 0.01
+
+# Radio de las cargas (el de los círculos que las dibujan)
+RADIO_CARGA = 0.2
+
+# Estados de una partícula
+ACTIVA = 0
+COLISION = 1
+ESCAPE = 2
+
+# ============================================================================
+# ESTADO DE LAS PARTÍCULAS (ESTRUCTURA DE ARRAYS)
+# ============================================================================
+
+class Particulas:
+    """Posiciones, velocidades, aceleraciones y estado de n partículas"""
+
+    def __init__(self, x, y, vx=None, vy=None, q_m=1.0):
+        """
+        Parámetros:
+        -----------
+        x, y : arrays de numpy (n,)
+            Posiciones iniciales
+        vx, vy : arrays de numpy (n,), opcional
+            Velocidades iniciales (por defecto, en reposo)
+        q_m : float o array de numpy (n,)
+            Relación carga/masa de cada partícula
+        """
+        self.x = np.array(x, dtype=float)
+        self.y = np.array(y, dtype=float)
+        n = len(self.x)
+        self.vx = np.zeros(n) if vx is None else np.array(vx, dtype=float)
+        self.vy = np.zeros(n) if vy is None else np.array(vy, dtype=float)
+        self.ax = np.zeros(n)
+        self.ay = np.zeros(n)
+        self.q_m = np.broadcast_to(np.asarray(q_m, dtype=float), (n,)).copy()
+        self.estado = np.full(n, ACTIVA, dtype=np.int8)
+
+        # Paso en que cada partícula dejó de estar activa (-1 = sigue activa)
+        self.paso_final = np.full(n, -1, dtype=np.int64)
+
+        # True cuando IntegradorParticulas.iniciar ya calculó ax, ay en las
+        # posiciones actuales (hasta entonces valen cero; paso y simular
+        # lo llaman si hace falta)
+        self.iniciadas = False
+
+    def __len__(self):
+        return len(self.x)
+
+    def activas(self):
+        """Índices de las partículas que siguen en movimiento"""
+        return np.flatnonzero(self.estado == ACTIVA)
+
+    def resumen(self):
+        """Número de partículas activas, que chocaron y que escaparon"""
+        return {
+            'activas': int(np.count_nonzero(self.estado == ACTIVA)),
+            'colisiones': int(np.count_nonzero(self.estado == COLISION)),
+            'escapes': int(np.count_nonzero(self.estado == ESCAPE)),
+        }
+
+
+def soltar_particulas(n, rango=RANGO, q_m=1.0, semilla=0):
+    """n partículas en reposo repartidas uniformemente en [-rango, rango]²"""
+    rng = np.random.default_rng(semilla)
+    return Particulas(rng.uniform(-rango, rango, n), rng.uniform(-rango, rango, n), q_m=q_m)
+
+# ============================================================================
+# INTEGRADOR DE VERLET EN VELOCIDADES
+# ============================================================================
+
+class IntegradorParticulas:
+    """Avanza partículas de prueba en el campo de un conjunto de cargas"""
+
+    def __init__(self, cargas, k=K, rango=RANGO, radio=RADIO_CARGA, dt=DT):
+        """
+        Parámetros:
+        -----------
+        cargas : lista de tuplas o array de numpy (N, 3)
+            Cada fila contiene (carga, pos_x, pos_y)
+        k : float
+            Constante de Coulomb
+        rango : float
+            Las partículas escapan al salir de [-rango, rango]²
+        radio : float
+            Radio de choque de las cargas
+        dt : float
+            Paso de tiempo
+        """
+        self.cargas = motor_campo.preparar_cargas(cargas)
+        self.k = k
+        self.rango = rango
+        self.radio = radio
+        self.dt = dt
+        self.pasos = 0
+
+    def _aceleracion(self, particulas, idx):
+        """Calcula a = (q/m)·E en las partículas idx"""
+        Ex, Ey = motor_campo.campo_electrico(particulas.x[idx], particulas.y[idx],
+                                             self.cargas, self.k)
+        particulas.ax[idx] = particulas.q_m[idx] * Ex
+        particulas.ay[idx] = particulas.q_m[idx] * Ey
+
+    def _detener(self, particulas, idx):
+        """Marca las partículas idx que chocaron o escaparon"""
+        x = particulas.x[idx]
+        y = particulas.y[idx]
+
+        choque = np.zeros(len(idx), dtype=bool)
+        for _, cx, cy in self.cargas:
+            choque |= (x - cx)**2 + (y - cy)**2 < self.radio**2
+        escape = ~choque & ((np.abs(x) > self.rango) | (np.abs(y) > self.rango))
+
+        particulas.estado[idx[choque]] = COLISION
+        particulas.estado[idx[escape]] = ESCAPE
+        particulas.paso_final[idx[choque | escape]] = self.pasos
+
+    def iniciar(self, particulas):
+        """Detiene las partículas que ya empiezan dentro de una carga o fuera
+        del dominio y calcula la aceleración inicial de las demás"""
+        self._detener(particulas, particulas.activas())
+        self._aceleracion(particulas, particulas.activas())
+        particulas.iniciadas = True
+
+    def paso(self, particulas):
+        """
+        Avanza un paso dt todas las partículas activas.
+
+        Si las partículas aún no se iniciaron (ver iniciar), se inician
+        antes, de modo que el primer medio impulso use la aceleración en las
+        posiciones iniciales y no cero.
+        """
+        if not particulas.iniciadas:
+            self.iniciar(particulas)
+        idx = particulas.activas()
+        medio_dt = 0.5 * self.dt
+
+        # Medio impulso, deriva y nueva aceleración
+        particulas.vx[idx] += medio_dt * particulas.ax[idx]
+        particulas.vy[idx] += medio_dt * particulas.ay[idx]
+        particulas.x[idx] += self.dt * particulas.vx[idx]
+        particulas.y[idx] += self.dt * particulas.vy[idx]
+        self.pasos += 1
+
+        self._detener(particulas, idx)
+        idx = idx[particulas.estado[idx] == ACTIVA]
+
+        # Segundo medio impulso con la aceleración en la nueva posición
+        self._aceleracion(particulas, idx)
+        particulas.vx[idx] += medio_dt * particulas.ax[idx]
+        particulas.vy[idx] += medio_dt * particulas.ay[idx]
+        return len(idx)
+
+    def simular(self, particulas, pasos, seguir=None, guardar_cada=1):
+        """
+        Avanza varios pasos y guarda las trayectorias de algunas partículas.
+
+        Parámetros:
+        -----------
+        particulas : Particulas
+            Estado a avanzar (se modifica en su lugar)
+        pasos : int
+            Número de pasos
+        seguir : array de índices, opcional
+            Partículas cuya trayectoria se guarda (por defecto, ninguna)
+        guardar_cada : int
+            Cada cuántos pasos se guarda una posición
+
+        Retorna:
+        --------
+        array de numpy (pasos // guardar_cada + 1, len(seguir), 2)
+            Posiciones guardadas (NaN después de detenerse)
+        """
+        seguir = np.zeros(0, dtype=int) if seguir is None else np.asarray(seguir)
+        trayectorias = np.full((pasos // guardar_cada + 1, len(seguir), 2), np.nan)
+
+        def guardar(fila):
+            vivas = particulas.estado[seguir] == ACTIVA
+            trayectorias[fila, vivas, 0] = particulas.x[seguir[vivas]]
+            trayectorias[fila, vivas, 1] = particulas.y[seguir[vivas]]
+
+        if not particulas.iniciadas:
+            self.iniciar(particulas)
+        guardar(0)
+        for i in range(1, pasos + 1):
+            if self.paso(particulas) == 0:
+                break
+            if i % guardar_cada == 0:
+                guardar(i // guardar_cada)
+        return trayectorias
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Partículas de prueba en el campo del dipolo")
+    parser.add_argument('--particulas', type=int, default=100000)
+    parser.add_argument('--pasos', type=int, default=500)
+    parser.add_argument('--dt', type=float, default=DT)
+    parser.add_argument('--q-m', type=float, default=1.0, help="relación carga/masa")
+    parser.add_argument('--png', help="dibujar las trayectorias de algunas partículas")
+    parser.add_argument('--dibujar', type=int, default=300,
+                        help="partículas dibujadas en el PNG")
+    args = parser.parse_args()
+
+    cargas = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+    particulas = soltar_particulas(args.particulas, q_m=args.q_m)
+    integrador = IntegradorParticulas(cargas, dt=args.dt)
+    seguir = np.arange(min(args.dibujar, args.particulas)) if args.png else None
+
+    inicio = time.perf_counter()
+    trayectorias = integrador.simular(particulas, args.pasos, seguir)
+    transcurrido = time.perf_counter() - inicio
+    print(f"⚛️  {args.particulas} partículas, {integrador.pasos} pasos en {transcurrido:.2f} s "
+          f"({integrador.pasos / transcurrido:.1f} pasos/s)")
+    print(f"   {particulas.resumen()}")
+
+    if args.png:
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Circle
+
+        fig = Figure(figsize=(8, 8))
+        ax = fig.add_subplot()
+        for i in range(trayectorias.shape[1]):
+            ax.plot(trayectorias[:, i, 0], trayectorias[:, i, 1], lw=0.6, alpha=0.7)
+        for q, cx, cy in cargas:
+            ax.add_patch(Circle((cx, cy), RADIO_CARGA, color='red' if q > 0 else 'blue', zorder=5))
+        ax.set_xlim(-RANGO, RANGO)
+        ax.set_ylim(-RANGO, RANGO)
+        ax.set_aspect('equal')
+        ax.set_title('Trayectorias de partículas de prueba')
+        fig.savefig(args.png, dpi=100)
+        print(f"🖼️  {args.png}")
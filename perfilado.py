@@ -0,0 +1,129 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Perfilado por cuadro del simulador
+
+Descripción: Temporizadores de bajo costo para las etapas de cada cuadro
+(cálculo del campo, mapa de colores, flechas, dibujo...). De cada etapa se
+guardan las últimas muestras (ventana móvil, para los percentiles que se
+muestran en pantalla) y un histograma acumulado con cubetas logarítmicas
+de 0.01 ms a 10 s, que se puede exportar a JSON al cerrar la aplicación.
+
+Uso básico:
+
+    perfil = PerfilCuadros()
+    inicio = perfil.iniciar_cuadro()
+    with perfil.etapa('campo'):
+        ...
+    perfil.terminar_cuadro(inicio)
+    print(perfil.texto_resumen())
+"""
+import json
+import time
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO
+# ============================================================================
+
+# Muestras recientes que se guardan por etapa
+VENTANA = 300
+
+# Bordes (ms) de las cubetas del histograma: 10 por década
+BORDES_MS = [float(b) for b in np.logspace(-2, 4, 61)]
+
+# Nombre de la etapa que mide el cuadro completo
+CUADRO = 'cuadro'
+
+# ============================================================================
+# CLASE DEL PERFIL
+# ============================================================================
+
+class PerfilCuadros:
+    """Tiempos por etapa de cada cuadro, con percentiles y cuadros por segundo"""
+
+    def __init__(self, ventana=VENTANA):
+        self.ventana = ventana
+        self.muestras = {}
+        self.histogramas = {}
+        self.totales = {}
+        self.fin_cuadros = deque(maxlen=ventana)
+
+    def registrar(self, nombre, ms):
+        """Agrega una muestra (en milisegundos) a la etapa 'nombre'"""
+        if nombre not in self.muestras:
+            self.muestras[nombre] = deque(maxlen=self.ventana)
+            self.histogramas[nombre] = [0] * (len(BORDES_MS) + 1)
+            self.totales[nombre] = 0.0
+        self.muestras[nombre].append(ms)
+        self.histogramas[nombre][bisect_right(BORDES_MS, ms)] += 1
+        self.totales[nombre] += ms
+
+    @contextmanager
+    def etapa(self, nombre):
+        """Mide el bloque 'with' como una muestra de la etapa 'nombre'"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(nombre, (time.perf_counter() - inicio) * 1000)
+
+    def iniciar_cuadro(self):
+        """Marca el inicio de un cuadro; devuelve el instante para terminar_cuadro"""
+        return time.perf_counter()
+
+    def terminar_cuadro(self, inicio):
+        """Registra la duración del cuadro completo"""
+        fin = time.perf_counter()
+        self.registrar(CUADRO, (fin - inicio) * 1000)
+        self.fin_cuadros.append(fin)
+
+    def fps(self, segundos=1.0):
+        """Cuadros terminados durante el último 'segundos' (por segundo)"""
+        limite = time.perf_counter() - segundos
+        return sum(1 for t in self.fin_cuadros if t >= limite) / segundos
+
+    def percentiles(self, nombre, p=(50, 99)):
+        """Percentiles (ms) de las muestras recientes de una etapa"""
+        muestras = self.muestras.get(nombre)
+        if not muestras:
+            return tuple(float('nan') for _ in p)
+        return tuple(float(v) for v in np.percentile(np.fromiter(muestras, float), p))
+
+    def texto_resumen(self):
+        """Texto corto para mostrar en pantalla: FPS, p50/p99 del cuadro y etapas"""
+        if CUADRO not in self.muestras:
+            return "Sin cuadros medidos"
+        p50, p99 = self.percentiles(CUADRO)
+        lineas = [f"FPS: {self.fps():.1f}",
+                  f"Cuadro p50 {p50:.1f} ms · p99 {p99:.1f} ms"]
+        for nombre in self.muestras:
+            if nombre != CUADRO:
+                e50, e99 = self.percentiles(nombre)
+                lineas.append(f"{nombre}: {e50:.1f} / {e99:.1f} ms")
+        return "\n".join(lineas)
+
+    def resumen(self):
+        """Diccionario por etapa con muestras, media, percentiles e histograma"""
+        resultado = {}
+        for nombre, histograma in self.histogramas.items():
+            n = sum(histograma)
+            p50, p90, p99 = self.percentiles(nombre, (50, 90, 99))
+            resultado[nombre] = {
+                'muestras': n,
+                'media_ms': self.totales[nombre] / n,
+                'p50_ms_recientes': p50,
+                'p90_ms_recientes': p90,
+                'p99_ms_recientes': p99,
+                'histograma': histograma,
+            }
+        return resultado
+
+    def exportar(self, ruta):
+        """Guarda el resumen y los bordes del histograma en un archivo JSON"""
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump({'bordes_ms': BORDES_MS, 'etapas': self.resumen()},
+                      archivo, indent=2, ensure_ascii=False)
@@ -0,0 +1,283 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Renderizado por lotes de configuraciones del dipolo (sin ventana)
+
+Descripción: Genera las figuras estáticas del notebook (celda de
+"configuraciones") para miles de configuraciones. Las configuraciones se
+leen de un archivo CSV o JSON, se reparten entre varios procesos y cada
+proceso reutiliza una sola figura de matplotlib (backend Agg). Cada PNG se
+escribe a disco en cuanto está listo, así que la memoria no crece con el
+número de figuras.
+
+Formato de entrada (CSV con encabezado, o JSON con una lista de objetos):
+
+    x1,y1,x2,y2,titulo
+    -1.0,0.0,1.0,0.0,Figura 1: Dipolo Horizontal (2.0 m)
+
+Columnas opcionales: q (magnitud de las cargas) y nombre (archivo de salida,
+solo el nombre: se escribe siempre dentro de la carpeta de salida).
+
+Uso:
+
+    python render_lotes.py configuraciones.csv --salida figuras --procesos 4
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from multiprocessing import Pool
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+
+import motor_campo
+
+# ============================================================================
+# PARÁMETROS POR DEFECTO (los mismos del notebook)
+# ============================================================================
+
+K = 1.0
+Q = 1.0
+RANGO = 5
+RESOLUCION = 20
+DPI = 100
+
+# ============================================================================
+# LECTURA DE CONFIGURACIONES
+# ============================================================================
+
+def validar_nombre(nombre):
+    """
+    Devuelve 'nombre' si es solo un nombre de archivo.
+
+    Un nombre vacío, con carpetas ('/', '\\') o igual a '.' o '..'
+    escribiría fuera de la carpeta de salida: lanza ValueError.
+    """
+    if (not nombre or nombre in ('.', '..') or '/' in nombre or '\\' in nombre
+            or os.path.basename(nombre) != nombre):
+        raise ValueError(f"Nombre de archivo no válido: {nombre!r} "
+                         "(debe ser solo un nombre, sin carpetas)")
+    return nombre
+
+
+def leer_configuraciones(ruta):
+    """
+    Lee la lista de configuraciones de un archivo CSV o JSON.
+
+    Retorna:
+    --------
+    lista de diccionarios con las claves x1, y1, x2, y2, titulo, q, nombre
+    """
+    if ruta.lower().endswith('.json'):
+        with open(ruta, encoding='utf-8') as archivo:
+            filas = json.load(archivo)
+    else:
+        with open(ruta, encoding='utf-8', newline='') as archivo:
+            filas = list(csv.DictReader(archivo))
+
+    configuraciones = []
+    for i, fila in enumerate(filas, 1):
+        # q es opcional (celda vacía o clave ausente = Q), pero q = 0 es válida
+        q = fila.get('q')
+        configuraciones.append({
+            'x1': float(fila['x1']),
+            'y1': float(fila['y1']),
+            'x2': float(fila['x2']),
+            'y2': float(fila['y2']),
+            'q': Q if q is None or q == '' else float(q),
+            'titulo': fila.get('titulo') or f"Configuración {i}",
+            'nombre': validar_nombre(fila.get('nombre') or f"figura_{i:05d}.png"),
+        })
+    return configuraciones
+
+# ============================================================================
+# RENDERIZADOR (UNA FIGURA REUTILIZADA)
+# ============================================================================
+
+class RenderizadorFiguras:
+    """Dibuja configuraciones del dipolo sobre una única figura Agg"""
+
+    def __init__(self, k=K, rango=RANGO, resolucion=RESOLUCION, dpi=DPI):
+        self.k = k
+        self.rango = rango
+        self.dpi = dpi
+
+        # Malla de puntos (la misma para todas las figuras)
+        x = np.linspace(-rango, rango, resolucion)
+        y = np.linspace(-rango, rango, resolucion)
+        self.X, self.Y = np.meshgrid(x, y)
+
+        # Figura, ejes y barra de color creados una sola vez
+        self.fig = Figure(figsize=(10, 9), facecolor='white')
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes([0.08, 0.14, 0.75, 0.76])
+        self.cax = self.fig.add_axes([0.86, 0.14, 0.03, 0.76])
+        self.configurar_ejes()
+
+        # Artistas que cambian en cada figura
+        self.artistas = []
+
+    def configurar_ejes(self):
+        """Estilo fijo de los ejes, igual al de visualizar_campo del notebook"""
+        ax = self.ax
+        ax.set_facecolor('white')
+        ax.set_xlim(-self.rango, self.rango)
+        ax.set_ylim(-self.rango, self.rango)
+        ax.set_xlabel('x (m)', fontsize=14, color='black', weight='bold')
+        ax.set_ylabel('y (m)', fontsize=14, color='black', weight='bold')
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.4, color='gray', linestyle='--', linewidth=0.8)
+        ax.tick_params(colors='black', labelsize=11)
+        self.titulo = ax.set_title('', fontsize=16, weight='bold', color='#1a1a2e', pad=15)
+        self.info = ax.text(0.5, -0.13, '', ha='center', transform=ax.transAxes,
+                            fontsize=11, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+    def renderizar(self, config, ruta):
+        """Dibuja una configuración y la guarda como PNG en 'ruta'"""
+        x1, y1, x2, y2, q = config['x1'], config['y1'], config['x2'], config['y2'], config['q']
+
+        # Quitar los artistas de la figura anterior
+        for artista in self.artistas:
+            artista.remove()
+        self.artistas = []
+
+        # Calcular el campo eléctrico
+        cargas = [(q, x1, y1), (-q, x2, y2)]
+        Ex, Ey = motor_campo.campo_electrico(self.X, self.Y, cargas, self.k)
+        E_magnitud = np.sqrt(Ex**2 + Ey**2)
+        separacion = np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+
+        # 1. Mapa de colores (magnitud del campo)
+        contorno = self.ax.contourf(self.X, self.Y, E_magnitud, levels=20,
+                                    cmap='hot', alpha=0.6)
+        # La barra de color se rehace en su eje fijo: con contornos nuevos
+        # cambian los niveles, y update_normal no reajusta los límites
+        self.cax.clear()
+        self.fig.colorbar(contorno, cax=self.cax, label='Magnitud del Campo Eléctrico (N/C)')
+
+        # 2. Flechas vectoriales (dirección)
+        E_norm = np.sqrt(Ex**2 + Ey**2 + 1e-10)
+        flechas = self.ax.quiver(self.X, self.Y, Ex/E_norm, Ey/E_norm, E_magnitud,
+                                 cmap='cool', alpha=0.9, scale=25, width=0.005,
+                                 edgecolor='black', linewidth=0.5)
+
+        # 3. y 4. Cargas positiva y negativa
+        circulo_pos = Circle((x1, y1), 0.2, color='red', ec='white', linewidth=3, zorder=5)
+        circulo_neg = Circle((x2, y2), 0.2, color='blue', ec='white', linewidth=3, zorder=5)
+        self.ax.add_patch(circulo_pos)
+        self.ax.add_patch(circulo_neg)
+        signo_pos = self.ax.text(x1, y1, '+', fontsize=28, color='white',
+                                 ha='center', va='center', weight='bold', zorder=6)
+        signo_neg = self.ax.text(x2, y2, '−', fontsize=32, color='white',
+                                 ha='center', va='center', weight='bold', zorder=6)
+        self.artistas = [contorno, flechas, circulo_pos, circulo_neg, signo_pos, signo_neg]
+
+        # Textos
+        self.titulo.set_text(f"{config['titulo']}\nSeparación: {separacion:.2f} m")
+        self.info.set_text(f'q₊ = +{q:.2f} C    q₋ = −{q:.2f} C    k = {self.k:.2f} N·m²/C²')
+
+        self.fig.savefig(ruta, dpi=self.dpi, facecolor='white')
+
+# ============================================================================
+# EJECUCIÓN EN PARALELO
+# ============================================================================
+
+# Renderizador propio de cada proceso worker
+_renderizador = None
+_directorio = None
+
+
+def _iniciar_worker(directorio, opciones):
+    """Crea la figura del worker una sola vez"""
+    global _renderizador, _directorio
+    _renderizador = RenderizadorFiguras(**opciones)
+    _directorio = directorio
+
+
+def _renderizar_en_worker(config):
+    """Renderiza una configuración en el worker y devuelve (ruta, segundos)"""
+    inicio = time.perf_counter()
+    ruta = os.path.join(_directorio, config['nombre'])
+    _renderizador.renderizar(config, ruta)
+    return ruta, time.perf_counter() - inicio
+
+
+def renderizar_lote(configuraciones, directorio, procesos=None, informar_cada=100, **opciones):
+    """
+    Renderiza todas las configuraciones y escribe un PNG por cada una.
+
+    Parámetros:
+    -----------
+    configuraciones : lista de diccionarios
+        Como las devuelve leer_configuraciones
+    directorio : str
+        Carpeta de salida (se crea si no existe)
+    procesos : int o None
+        Número de procesos (None = todos los núcleos, 1 = sin pool)
+    informar_cada : int
+        Cada cuántas figuras se imprime el progreso
+    **opciones
+        k, rango, resolucion, dpi para RenderizadorFiguras
+
+    Retorna:
+    --------
+    float
+        Figuras por segundo
+    """
+    for config in configuraciones:
+        validar_nombre(config['nombre'])
+    os.makedirs(directorio, exist_ok=True)
+    procesos = procesos or os.cpu_count() or 1
+    total = len(configuraciones)
+    inicio = time.perf_counter()
+
+    def informar(hechas):
+        transcurrido = time.perf_counter() - inicio
+        print(f"  {hechas}/{total} figuras  ({hechas / transcurrido:.1f} fig/s)")
+
+    if procesos == 1:
+        _iniciar_worker(directorio, opciones)
+        resultados = map(_renderizar_en_worker, configuraciones)
+        for hechas, _ in enumerate(resultados, 1):
+            if hechas % informar_cada == 0:
+                informar(hechas)
+    else:
+        with Pool(procesos, initializer=_iniciar_worker,
+                  initargs=(directorio, opciones)) as pool:
+            # imap_unordered: cada PNG se escribe en cuanto termina
+            resultados = pool.imap_unordered(_renderizar_en_worker, configuraciones,
+                                             chunksize=4)
+            for hechas, _ in enumerate(resultados, 1):
+                if hechas % informar_cada == 0:
+                    informar(hechas)
+
+    transcurrido = time.perf_counter() - inicio
+    velocidad = total / transcurrido if transcurrido > 0 else float('inf')
+    print(f"✅ {total} figuras en {transcurrido:.2f} s ({velocidad:.1f} fig/s, "
+          f"{procesos} procesos)")
+    return velocidad
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Renderizado por lotes de configuraciones del dipolo")
+    parser.add_argument('entrada', help="archivo CSV o JSON con las configuraciones")
+    parser.add_argument('--salida', default='figuras', help="carpeta de salida de los PNG")
+    parser.add_argument('--procesos', type=int, default=None,
+                        help="número de procesos (por defecto, todos los núcleos)")
+    parser.add_argument('--resolucion', type=int, default=RESOLUCION)
+    parser.add_argument('--rango', type=float, default=RANGO)
+    parser.add_argument('--dpi', type=int, default=DPI)
+    args = parser.parse_args()
+
+    configuraciones = leer_configuraciones(args.entrada)
+    print(f"📸 Renderizando {len(configuraciones)} configuraciones en {args.salida}/")
+    renderizar_lote(configuraciones, args.salida, args.procesos,
+                    resolucion=args.resolucion, rango=args.rango, dpi=args.dpi)
@@ -0,0 +1,90 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del evaluador Barnes–Hut contra la suma directa de motor_campo
+
+Uso:
+
+    python -m pytest -q test_barnes_hut.py
+"""
+import numpy as np
+import pytest
+
+import barnes_hut
+import motor_campo
+
+
+def error_relativo(cargas, x, y, **opciones):
+    """Error máximo de Barnes–Hut relativo al máximo de |E| directo"""
+    Ex, Ey = barnes_hut.campo_electrico(x, y, cargas, **opciones)
+    Dx, Dy = motor_campo.campo_electrico(x, y, cargas)
+    return np.hypot(Ex - Dx, Ey - Dy).max() / np.hypot(Dx, Dy).max()
+
+
+@pytest.fixture
+def nube():
+    """1000 cargas aleatorias en [-1, 1]² y puntos de prueba alrededor"""
+    rng = np.random.default_rng(0)
+    cargas = np.column_stack([rng.normal(size=1000),
+                              rng.uniform(-1, 1, 1000),
+                              rng.uniform(-1, 1, 1000)])
+    x = rng.uniform(-3, 3, 400)
+    y = rng.uniform(-3, 3, 400)
+    return cargas, x, y
+
+
+@pytest.mark.parametrize('theta, cota', [(0.3, 1e-4), (0.5, 1e-3), (0.8, 1e-2)])
+def test_error_acotado_segun_theta(nube, theta, cota):
+    cargas, x, y = nube
+    assert error_relativo(cargas, x, y, theta=theta) < cota
+
+
+def test_theta_cero_es_suma_directa(nube):
+    cargas, x, y = nube
+    Ex, Ey = barnes_hut.campo_electrico(x, y, cargas, theta=0.0)
+    Dx, Dy = motor_campo.campo_electrico(x, y, cargas)
+    np.testing.assert_allclose(Ex, Dx, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(Ey, Dy, rtol=1e-10, atol=1e-12)
+
+
+def test_cargas_repetidas_en_el_mismo_punto():
+    # Más cargas en un punto que tam_hoja: el árbol no puede separarlas y
+    # corta en PROFUNDIDAD_MAXIMA con todas en una sola hoja
+    cargas = [(1.0, 0.5, 0.5)] * 40 + [(-2.0, -1.0, 0.0)] * 3
+    arbol = barnes_hut.ArbolCuadrantes(cargas, tam_hoja=4)
+    assert max(len(h) for h in arbol.cargas_hoja if h is not None) == 40
+    assert len(arbol) <= 2 * barnes_hut.PROFUNDIDAD_MAXIMA
+
+    # Cada grupo repetido se aproxima como una sola carga (monopolo exacto)
+    x = np.array([2.0, -3.0, 0.0])
+    y = np.array([1.0, 2.0, -2.0])
+    Ex, Ey = arbol.campo(x, y, theta=0.3)
+    Dx, Dy = motor_campo.campo_electrico(x, y, cargas)
+    np.testing.assert_allclose(Ex, Dx, rtol=1e-8)
+    np.testing.assert_allclose(Ey, Dy, rtol=1e-8)
+
+
+def test_sin_cargas_campo_nulo():
+    arbol = barnes_hut.ArbolCuadrantes([])
+    assert len(arbol) == 0
+    x = np.linspace(-1, 1, 5)
+    Ex, Ey = barnes_hut.campo_electrico(x, x, [])
+    assert Ex.shape == x.shape and not Ex.any() and not Ey.any()
+
+
+def test_una_sola_carga_en_una_hoja():
+    carga = [(2.0, 0.3, -0.4)]
+    arbol = barnes_hut.ArbolCuadrantes(carga)
+    assert len(arbol) == 1 and arbol.hijos[0] is None
+    x = np.array([1.0, -2.0, 0.3])
+    y = np.array([0.5, 1.5, 0.6])
+    Dx, Dy = motor_campo.campo_electrico(x, y, carga)
+
+    # theta = 0: suma directa en la hoja
+    Ex, Ey = arbol.campo(x, y, theta=0.0)
+    np.testing.assert_allclose(Ex, Dx, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(Ey, Dy, rtol=1e-12, atol=1e-15)
+
+    # El monopolo en la propia carga es exacto salvo el suavizado EPSILON
+    Ex, Ey = arbol.campo(x, y)
+    np.testing.assert_allclose(Ex, Dx, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(Ey, Dy, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,114 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del caché LRU de campos
+
+Uso:
+
+    python -m pytest -q test_cache_campo.py
+"""
+import numpy as np
+
+import motor_campo
+from cache_campo import CacheCampo
+
+
+def campo_directo(cargas, rango=5, resolucion=20, k=1.0):
+    """(Ex, Ey, |E|) calculado sin caché"""
+    x = np.linspace(-rango, rango, resolucion)
+    X, Y = np.meshgrid(x, x)
+    Ex, Ey = motor_campo.campo_electrico(X, Y, cargas, k)
+    return Ex, Ey, np.hypot(Ex, Ey)
+
+
+def test_cargas_pequenas_no_se_redondean():
+    cache = CacheCampo()
+    np.testing.assert_allclose(cache.cuantizar([(0.04, 0.33, -0.07)]), [[0.04, 0.3, -0.1]])
+
+    # 0.04 y 0 (o 0.04 y 0.06) son escenas distintas, con campos distintos
+    assert cache.clave([(0.04, 1.0, 0.0)], 5, 20) != cache.clave([(0.0, 1.0, 0.0)], 5, 20)
+    assert cache.clave([(0.04, 1.0, 0.0)], 5, 20) != cache.clave([(0.06, 1.0, 0.0)], 5, 20)
+
+    Ex, Ey, E = cache.obtener([(0.04, 1.0, 0.0)], 5, 20)
+    assert E.max() > 0
+    np.testing.assert_allclose(E, campo_directo([(0.04, 1.0, 0.0)])[2])
+
+
+def test_acierto_y_fallo():
+    cache = CacheCampo()
+    dipolo = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+    primero = cache.obtener(dipolo, 5, 20)
+    assert cache.estadisticas()['fallos'] == 1 and cache.estadisticas()['aciertos'] == 0
+
+    # Posiciones que redondean al mismo paso: misma entrada, sin recalcular
+    segundo = cache.obtener([(1.0, -1.03, 0.02), (-1.0, 0.98, 0.0)], 5, 20)
+    assert all(a is b for a, b in zip(primero, segundo))
+    assert cache.estadisticas()['aciertos'] == 1
+
+    # Otra malla u otra k son otra entrada
+    cache.obtener(dipolo, 5, 21)
+    cache.obtener(dipolo, 5, 20, k=2.0)
+    assert cache.estadisticas()['fallos'] == 3 and len(cache) == 3
+
+    for a, b in zip(primero, campo_directo(dipolo)):
+        np.testing.assert_allclose(a, b)
+
+
+def test_calcular_recibe_las_posiciones_de_la_clave():
+    cache = CacheCampo()
+    recibidas = []
+
+    def calcular(cargas):
+        recibidas.append(cargas)
+        return (np.zeros(3),)
+
+    cache.obtener([(0.5, 0.33, -0.07)], 5, 20, calcular=calcular)
+    np.testing.assert_allclose(recibidas[0], [[0.5, 0.3, -0.1]])
+
+
+def test_descarta_la_menos_usada_por_entradas():
+    cache = CacheCampo(max_entradas=2)
+    uno, dos, tres = ([(1.0, x, 0.0)] for x in (1.0, 2.0, 3.0))
+    cache.obtener(uno, 5, 10)
+    cache.obtener(dos, 5, 10)
+    cache.obtener(uno, 5, 10)      # 'uno' pasa a ser la más reciente
+    cache.obtener(tres, 5, 10)     # se descarta 'dos'
+    assert len(cache) == 2
+    assert cache.buscar(cache.clave(uno, 5, 10)) is not None
+    assert cache.buscar(cache.clave(dos, 5, 10)) is None
+    assert cache.buscar(cache.clave(tres, 5, 10)) is not None
+
+
+def test_descarta_por_bytes():
+    tamano = 3 * 10 * 10 * 8       # (Ex, Ey, |E|) float64 en una malla 10×10
+    cache = CacheCampo(max_bytes=2 * tamano)
+    for x in (1.0, 2.0, 3.0):
+        cache.obtener([(1.0, x, 0.0)], 5, 10)
+    assert len(cache) == 2 and cache.bytes == 2 * tamano
+
+    # Una entrada que sola supera el límite se devuelve pero no se guarda
+    grande = cache.obtener([(1.0, 0.0, 0.0)], 5, 30)
+    assert grande[0].shape == (30, 30)
+    assert len(cache) == 2 and cache.bytes == 2 * tamano
+
+
+def test_guardados_de_solo_lectura():
+    cache = CacheCampo()
+    original = np.arange(6.0)
+    copia, = cache.guardar('copia', (original,))
+    assert not copia.flags.writeable
+    original[0] = 99.0
+    assert copia[0] == 0.0 and cache.bytes == original.nbytes
+
+    vista, = cache.guardar('vista', (original,), copiar=False)
+    assert not vista.flags.writeable and np.shares_memory(vista, original)
+    assert original.flags.writeable
+
+
+def test_memmap_no_cuenta_para_los_bytes(tmp_path):
+    ruta = tmp_path / 'malla.npy'
+    np.save(ruta, np.ones((50, 50)))
+    mapeado = np.load(ruta, mmap_mode='r')
+    cache = CacheCampo(max_bytes=1)
+    guardado, = cache.guardar('disco', (mapeado,), copiar=False)
+    assert isinstance(guardado, np.memmap) and np.shares_memory(guardado, mapeado)
+    assert len(cache) == 1 and cache.bytes == 0
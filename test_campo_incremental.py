@@ -0,0 +1,80 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del campo incremental contra el recálculo completo
+
+Uso:
+
+    python -m pytest -q test_campo_incremental.py
+"""
+import numpy as np
+import pytest
+
+import motor_campo
+from campo_incremental import CampoIncremental
+
+
+@pytest.fixture
+def malla():
+    x = np.linspace(-5, 5, 40)
+    return np.meshgrid(x, x)
+
+
+def comparar(campo, X, Y, cargas):
+    """El campo incremental coincide con campo_y_potencial calculado desde cero"""
+    V, Ex, Ey = motor_campo.campo_y_potencial(X, Y, cargas)
+    Ex_inc, Ey_inc = campo.campo()
+    np.testing.assert_allclose(Ex_inc, Ex, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(Ey_inc, Ey, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(campo.potencial(), V, rtol=1e-9, atol=1e-12)
+
+
+def test_mover_agregar_y_quitar(malla):
+    X, Y = malla
+    cargas = np.array([(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0), (2.0, 0.0, 2.5)])
+    campo = CampoIncremental(X, Y, cargas)
+    comparar(campo, X, Y, cargas)
+
+    # Mover una carga solo recalcula su contribución
+    cargas[1] = (-1.0, 1.7, -0.4)
+    campo.actualizar(cargas)
+    assert campo.actualizaciones == 1
+    comparar(campo, X, Y, cargas)
+
+    # Cambiar el valor de una carga
+    cargas[2, 0] = -0.5
+    campo.actualizar(cargas)
+    comparar(campo, X, Y, cargas)
+
+    # Agregar y quitar cargas cambia N: se recalcula todo
+    cargas = np.vstack([cargas, (0.7, 3.0, 3.0)])
+    campo.actualizar(cargas)
+    assert campo.actualizaciones == 0
+    comparar(campo, X, Y, cargas)
+
+    cargas = cargas[[0, 2, 3]]
+    campo.actualizar(cargas)
+    comparar(campo, X, Y, cargas)
+
+    campo.actualizar(np.zeros((0, 3)))
+    assert not campo.campo()[0].any() and not campo.potencial().any()
+
+
+def test_muchas_actualizaciones_sin_deriva(malla):
+    X, Y = malla
+    rng = np.random.default_rng(0)
+    cargas = np.array([(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)])
+    campo = CampoIncremental(X, Y, cargas, recalculo_cada=50)
+    for _ in range(120):
+        i = rng.integers(len(cargas))
+        cargas[i, 1:] = rng.uniform(-4, 4, 2)
+        campo.actualizar(cargas)
+    assert campo.actualizaciones == 120 % 50
+    comparar(campo, X, Y, cargas)
+
+
+def test_sin_cambios_no_actualiza(malla):
+    X, Y = malla
+    cargas = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+    campo = CampoIncremental(X, Y, cargas)
+    Ex, _ = campo.actualizar(cargas)
+    assert campo.actualizaciones == 0 and not Ex.flags.writeable
@@ -0,0 +1,58 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas de la escena de N cargas y de sus archivos
+
+Uso:
+
+    python -m pytest -q test_escena.py
+"""
+import csv
+
+import numpy as np
+import pytest
+
+from escena import EscenaCargas
+
+
+def test_agregar_eliminar_y_mover():
+    escena = EscenaCargas.dipolo()
+    for i in range(40):       # más que la capacidad inicial: el array crece
+        assert escena.agregar(0.04 * i, i / 10, -i / 10) == i + 2
+    assert len(escena) == 42 and escena.cargas.shape == (42, 3)
+
+    escena.eliminar(0)
+    np.testing.assert_array_equal(escena.cargas[0], (-1.0, 1.0, 0.0))
+    escena.mover(1, 2.5, -0.33)
+    escena.cambiar_carga(1, 0.04)
+    np.testing.assert_array_equal(escena.cargas[1], (0.04, 2.5, -0.33))
+    assert escena.mas_cercana(2.4, -0.3) == 1
+    assert escena.mas_cercana(2.4, -0.3, radio=0.01) is None
+
+
+@pytest.mark.parametrize('extension', ['csv', 'json', 'npz'])
+def test_ida_y_vuelta(tmp_path, extension):
+    cargas = [(0.04, 0.33, -0.07), (-1.5, 1.0, 2.0), (0.0, -3.0, 4.0)]
+    ruta = str(tmp_path / f'escena.{extension}')
+    EscenaCargas(cargas).guardar(ruta)
+    leida = EscenaCargas.cargar(ruta)
+    np.testing.assert_array_equal(leida.cargas, cargas)
+    assert not leida.es_3d()
+
+
+@pytest.mark.parametrize('extension', ['csv', 'json', 'npz'])
+def test_altura_z_opcional(tmp_path, extension):
+    cargas = [(1.0, -1.0, 0.0, 0.5), (-1.0, 1.0, 0.0, 0.0)]
+    ruta = str(tmp_path / f'escena.{extension}')
+    escena = EscenaCargas(cargas)
+    assert escena.es_3d()
+    escena.guardar(ruta)
+    leida = EscenaCargas.cargar(ruta)
+    np.testing.assert_array_equal(leida.cargas_3d, cargas)
+    np.testing.assert_array_equal(leida.cargas, [c[:3] for c in cargas])
+
+
+def test_csv_plano_sin_columna_z(tmp_path):
+    ruta = tmp_path / 'plano.csv'
+    EscenaCargas.dipolo().guardar(str(ruta))
+    with open(ruta, encoding='utf-8', newline='') as archivo:
+        assert csv.DictReader(archivo).fieldnames == ['q', 'x', 'y']
@@ -0,0 +1,94 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del formato .npz de escenas y campos
+
+Uso:
+
+    python -m pytest -q test_formato_campo.py
+"""
+import json
+
+import numpy as np
+import pytest
+
+import motor_campo
+from campo_disco import exportar_png
+from formato_campo import abrir_campo, guardar_campo
+
+CARGAS = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+
+
+@pytest.fixture
+def mallas():
+    x = np.linspace(-5, 5, 64)
+    X, Y = np.meshgrid(x, x)
+    V, Ex, Ey = motor_campo.campo_y_potencial(X, Y, CARGAS, dtype=np.float32)
+    return {'Ex': Ex, 'Ey': Ey, 'E': np.hypot(Ex, Ey), 'V': V}
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_ida_y_vuelta(tmp_path, mallas, mmap):
+    ruta = tmp_path / 'campo.npz'
+    guardar_campo(ruta, CARGAS, k=2.0, rango=5, resolucion=64, **mallas)
+    campo = abrir_campo(str(ruta), mmap=mmap)
+
+    assert (campo.rango, campo.resolucion, campo.k) == (5.0, 64, 2.0)
+    np.testing.assert_array_equal(campo.cargas, CARGAS)
+    assert not campo.z.any() and campo.cargas_3d.shape == (2, 4)
+    assert campo.tiene_campo()
+    for nombre, malla in mallas.items():
+        leida = getattr(campo, nombre)
+        assert isinstance(leida, np.memmap) == mmap
+        assert leida.dtype == np.float32
+        np.testing.assert_array_equal(leida, malla)
+
+
+def test_mapeo_sin_copias_y_solo_lectura(tmp_path, mallas):
+    ruta = tmp_path / 'campo.npz'
+    guardar_campo(ruta, CARGAS, rango=5, resolucion=64, **mallas)
+    campo = abrir_campo(str(ruta))
+    assert isinstance(campo.E, np.memmap) and campo.E.filename == str(ruta)
+    assert not campo.E.flags.writeable
+
+    # El archivo sigue siendo un .npz normal para np.load
+    with np.load(ruta) as npz:
+        assert json.loads(str(npz['metadatos']))['dtype'] == 'float32'
+        np.testing.assert_array_equal(npz['E'], campo.E)
+
+
+def test_solo_la_escena_con_alturas(tmp_path):
+    ruta = tmp_path / 'escena.npz'
+    guardar_campo(ruta, [(1.0, -1.0, 0.0, 0.5), (-1.0, 1.0, 0.0, 0.0)])
+    campo = abrir_campo(str(ruta))
+    assert campo.resolucion is None and not campo.tiene_campo()
+    assert campo.Ex is None and campo.V is None
+    np.testing.assert_array_equal(campo.cargas_3d[:, 3], [0.5, 0.0])
+    with pytest.raises(ValueError):
+        campo.submuestrear()
+
+
+def test_sirve_para_exportar_png_y_submuestrear(tmp_path, mallas):
+    ruta = tmp_path / 'campo.npz'
+    guardar_campo(ruta, CARGAS, rango=5, resolucion=64, **mallas)
+    campo = abrir_campo(str(ruta))
+    x, y, E = campo.submuestrear(max_lado=16)
+    assert E.shape == (16, 16) and len(x) == len(y) == 16
+    exportar_png(campo, str(tmp_path / 'campo.png'), filas_por_bloque=10)
+    assert (tmp_path / 'campo.png').read_bytes().startswith(b'\x89PNG')
+
+
+def test_mallas_invalidas(tmp_path, mallas):
+    with pytest.raises(ValueError, match='desconocida'):
+        guardar_campo(tmp_path / 'a.npz', CARGAS, rango=5, resolucion=64, B=mallas['E'])
+    with pytest.raises(ValueError, match='forma'):
+        guardar_campo(tmp_path / 'b.npz', CARGAS, rango=5, resolucion=32, E=mallas['E'])
+
+
+def test_npz_comprimido_no_se_mapea(tmp_path, mallas):
+    ruta = tmp_path / 'comprimido.npz'
+    np.savez_compressed(ruta, metadatos=np.array(json.dumps(
+        {'formato': 1, 'rango': 5, 'resolucion': 64, 'k': 1.0, 'dtype': 'float32'})),
+        cargas=np.array(CARGAS), E=mallas['E'])
+    with pytest.raises(ValueError, match='comprimido'):
+        abrir_campo(str(ruta))
+    np.testing.assert_array_equal(abrir_campo(str(ruta), mmap=False).E, mallas['E'])
@@ -0,0 +1,108 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del motor de campo: resultado, precisión simple y validación de 'out'
+
+Uso:
+
+    python -m pytest -q test_motor_campo.py
+"""
+import numpy as np
+import pytest
+
+import motor_campo
+
+CARGAS = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+
+
+def campo_referencia(x, y, cargas, k=1.0):
+    """Ley de Coulomb carga por carga, sin bloques"""
+    Ex = np.zeros_like(x)
+    Ey = np.zeros_like(y)
+    for q, qx, qy in cargas:
+        dx, dy = x - qx, y - qy
+        r3 = (dx * dx + dy * dy + motor_campo.EPSILON) ** 1.5
+        Ex += k * q * dx / r3
+        Ey += k * q * dy / r3
+    return Ex, Ey
+
+
+@pytest.fixture
+def malla():
+    x = np.linspace(-3, 3, 40)
+    return np.meshgrid(x, x)
+
+
+def test_coincide_con_la_suma_directa(malla):
+    X, Y = malla
+    Ex, Ey = motor_campo.campo_electrico(X, Y, CARGAS, tam_bloque=64)
+    Rx, Ry = campo_referencia(X, Y, CARGAS)
+    np.testing.assert_allclose(Ex, Rx, rtol=1e-12)
+    np.testing.assert_allclose(Ey, Ry, rtol=1e-12)
+
+
+
+@pytest.mark.parametrize('n_cargas', [2, 300])
+def test_float32_dentro_de_la_cota(n_cargas):
+    # |E32 − E64| ≤ (N + 8)·u·Σᵢ |k·qᵢ| / (rᵢ² + EPSILON), u = 2⁻²⁴
+    rng = np.random.default_rng(n_cargas)
+    cargas = np.column_stack([rng.normal(size=n_cargas), rng.uniform(-3, 3, n_cargas),
+                              rng.uniform(-3, 3, n_cargas)])
+    x = np.linspace(-3, 3, 60)
+    X, Y = np.meshgrid(x, x)
+    # Algunos puntos justo sobre las cargas, donde domina EPSILON
+    X.flat[:10], Y.flat[:10] = cargas[:10, 1], cargas[:10, 2]
+
+    E64 = motor_campo.campo_electrico(X, Y, cargas)
+    E32 = motor_campo.campo_electrico(X, Y, cargas, dtype=np.float32)
+    assert all(c.dtype == np.float32 for c in E32)
+
+    suma = sum(abs(q) / ((X - qx)**2 + (Y - qy)**2 + motor_campo.EPSILON)
+               for q, qx, qy in cargas)
+    cota = (n_cargas + 8) * 2.0**-24 * suma
+    for c32, c64 in zip(E32, E64):
+        assert np.all(np.abs(c32 - c64) <= cota)
+
+
+def test_out_valido_se_escribe_en_su_lugar(malla):
+    X, Y = malla
+    out = (np.full(X.shape, np.nan), np.full(X.shape, np.nan))
+    Ex, Ey = motor_campo.campo_electrico(X, Y, CARGAS, out=out)
+    assert Ex is out[0] and Ey is out[1]
+    np.testing.assert_allclose(Ex, campo_referencia(X, Y, CARGAS)[0], rtol=1e-12)
+
+
+@pytest.mark.parametrize('salida, mensaje', [
+    (lambda f: (np.zeros(f), np.zeros((f[0], f[1] - 1))), 'forma'),
+    (lambda f: (np.zeros(f), np.zeros(f, dtype=np.float32)), 'dtype'),
+    (lambda f: (np.zeros(f), np.zeros((f[1], f[0])).T), 'contiguos'),
+    (lambda f: (np.zeros(f), np.zeros((f[0], 2 * f[1]))[:, ::2]), 'contiguos'),
+    (lambda f: (np.zeros(f),), 'arrays'),
+])
+def test_out_invalido_lanza_value_error(malla, salida, mensaje):
+    X, Y = malla
+    with pytest.raises(ValueError, match=mensaje):
+        motor_campo.campo_electrico(X, Y, CARGAS, out=salida(X.shape))
+
+
+def test_out_de_solo_lectura(malla):
+    X, Y = malla
+    Ex, Ey = np.zeros(X.shape), np.zeros(X.shape)
+    Ey.flags.writeable = False
+    with pytest.raises(ValueError, match='escribibles'):
+        motor_campo.campo_electrico(X, Y, CARGAS, out=(Ex, Ey))
+
+
+def test_out_del_potencial_se_valida(malla):
+    X, Y = malla
+    with pytest.raises(ValueError, match='3 arrays'):
+        motor_campo.campo_y_potencial(X, Y, CARGAS, out=(np.zeros(X.shape),) * 2)
+
+
+def test_nucleo_3d_en_el_plano_z_cero(malla):
+    import campo_3d
+    X, Y = malla
+    Ex, Ey, Ez = campo_3d.campo_electrico_3d(X, Y, np.zeros_like(X), CARGAS)
+    Dx, Dy = motor_campo.campo_electrico(X, Y, CARGAS)
+    np.testing.assert_array_equal(Ex, Dx)
+    np.testing.assert_array_equal(Ey, Dy)
+    assert not Ez.any()
@@ -0,0 +1,56 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del muestreo adaptativo contra la evaluación directa en la pantalla
+
+Uso:
+
+    python -m pytest -q test_muestreo_adaptativo.py
+"""
+import numpy as np
+import pytest
+
+import motor_campo
+from muestreo_adaptativo import (RADIO_CARGA, MuestreoAdaptativo, magnitud_adaptativa,
+                                 nivel_para_resolucion)
+
+RESOLUCION = 400
+DIPOLO = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+CUATRO_CARGAS = [(1.0, -1.0, 0.3), (-2.0, 1.2, -0.7), (0.5, 0.1, 2.0), (1.5, -2.5, -2.0)]
+
+
+def error_ln(cargas, E, rango=5):
+    """|ln E − ln E_directo| en los píxeles fuera de los círculos de las cargas"""
+    x = np.linspace(-rango, rango, E.shape[0])
+    X, Y = np.meshgrid(x, x)
+    referencia = np.hypot(*motor_campo.campo_electrico(X, Y, cargas))
+    lejos = np.ones(X.shape, dtype=bool)
+    for _, qx, qy in cargas:
+        lejos &= np.hypot(X - qx, Y - qy) >= RADIO_CARGA
+    return np.abs(np.log(E) - np.log(referencia))[lejos]
+
+
+@pytest.mark.parametrize('resolucion, nivel', [(400, 4), (257, 4), (256, 3), (2000, 6)])
+def test_hojas_de_al_menos_un_pixel(resolucion, nivel):
+    assert nivel_para_resolucion(resolucion, 16) == nivel
+    muestreo = MuestreoAdaptativo(DIPOLO, resolucion=resolucion, nivel_maximo=8)
+    assert muestreo.nivel_maximo == nivel
+    assert muestreo.h_fino >= 2 * 5 / (resolucion - 1)
+
+
+@pytest.mark.parametrize('cargas', [DIPOLO, CUATRO_CARGAS])
+def test_menos_evaluaciones_que_pixeles_y_error_acotado(cargas):
+    E, evaluaciones = magnitud_adaptativa(cargas, resolucion=RESOLUCION)
+    assert E.shape == (RESOLUCION, RESOLUCION)
+    assert evaluaciones < RESOLUCION**2 / 4
+
+    error = error_ln(cargas, E)
+    assert np.median(error) < 1e-3
+    assert np.percentile(error, 99) < 2e-2
+
+
+def test_tolerancia_menor_evalua_mas_y_se_acerca_mas():
+    gruesa = MuestreoAdaptativo(DIPOLO, resolucion=RESOLUCION, tolerancia=0.4)
+    fina = MuestreoAdaptativo(DIPOLO, resolucion=RESOLUCION, tolerancia=0.1)
+    assert gruesa.evaluaciones < fina.evaluaciones
+    assert (np.median(error_ln(DIPOLO, fina.remuestrear())) <
+            np.median(error_ln(DIPOLO, gruesa.remuestrear())))
@@ -0,0 +1,77 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Pruebas del integrador de partículas de prueba
+
+Uso:
+
+    python -m pytest -q test_particulas.py
+"""
+import numpy as np
+
+import motor_campo
+from particulas import IntegradorParticulas, Particulas
+
+# Órbitas ligadas alrededor de una carga −1 en el origen (k = 1, q/m = 1):
+# una circular (r = 1, v = 1) y tres elípticas
+ATRACTORA = [(-1.0, 0.0, 0.0)]
+
+
+def orbitas():
+    return Particulas([1.0, 1.5, 0.0, -2.0], [0.0, 0.0, 1.2, 0.0],
+                      vx=[0.0, 0.0, -0.8, 0.0], vy=[1.0, 0.7, 0.0, -0.6])
+
+
+def energia(particulas, cargas):
+    """Energía por unidad de masa: |v|²/2 + (q/m)·V"""
+    V, _, _ = motor_campo.campo_y_potencial(particulas.x, particulas.y, cargas)
+    return 0.5 * (particulas.vx**2 + particulas.vy**2) + particulas.q_m * V
+
+
+def deriva_maxima(dt, tiempo=20.0):
+    """Máximo de |E(t) − E(0)| / |E(0)| durante 'tiempo' (varias órbitas)"""
+    particulas = orbitas()
+    integrador = IntegradorParticulas(ATRACTORA, dt=dt)
+    inicial = energia(particulas, ATRACTORA)
+    deriva = np.zeros(len(particulas))
+    for _ in range(round(tiempo / dt)):
+        assert integrador.paso(particulas) == len(particulas)
+        deriva = np.maximum(deriva, np.abs(energia(particulas, ATRACTORA) - inicial))
+    return deriva / np.abs(inicial)
+
+
+def test_primer_paso_sin_iniciar_usa_la_aceleracion_inicial():
+    # Partícula en reposo a r = 2 de una carga +1 (k = 1, q/m = 1):
+    # a(r) = 1/r², x1 = x0 + (dt²/2)·a(x0), v1 = (dt/2)·(a(x0) + a(x1)),
+    # salvo el suavizado EPSILON de motor_campo (error relativo ~1e-11)
+    dt = 0.01
+    particulas = Particulas([2.0], [0.0])
+    integrador = IntegradorParticulas([(1.0, 0.0, 0.0)], dt=dt)
+    assert integrador.paso(particulas) == 1
+
+    a0 = 1 / 2.0**2
+    x1 = 2.0 + 0.5 * dt**2 * a0
+    np.testing.assert_allclose(particulas.x, [x1], rtol=1e-14)
+    np.testing.assert_allclose(particulas.vx, [0.5 * dt * (a0 + 1 / x1**2)], rtol=1e-9)
+    np.testing.assert_allclose(particulas.y, [0.0], atol=1e-15)
+    np.testing.assert_allclose(particulas.vy, [0.0], atol=1e-15)
+
+
+def test_paso_y_simular_dan_lo_mismo():
+    cargas = [(1.0, -1.0, 0.0), (-1.0, 1.0, 0.0)]
+    a = Particulas([0.5, -2.0, 3.0], [1.0, 2.0, -1.5])
+    b = Particulas([0.5, -2.0, 3.0], [1.0, 2.0, -1.5])
+    integrador_a = IntegradorParticulas(cargas)
+    integrador_b = IntegradorParticulas(cargas)
+    for _ in range(20):
+        integrador_a.paso(a)
+    integrador_b.simular(b, 20)
+    for nombre in ('x', 'y', 'vx', 'vy'):
+        np.testing.assert_array_equal(getattr(a, nombre), getattr(b, nombre))
+
+
+def test_deriva_de_energia_acotada_y_de_segundo_orden():
+    # Verlet es simplético: en 2000 pasos la energía oscila sin crecer, con
+    # amplitud proporcional a dt²
+    deriva = deriva_maxima(0.01)
+    assert deriva.max() < 1e-4
+    assert np.all(deriva_maxima(0.02) > 3 * deriva)
@@ -0,0 +1,311 @@
+"""
+PROYECTO UNIDAD 5: ELECTROSTÁTICA
+Visor de cortes del campo eléctrico en 3D
+
+Descripción: Muestra |E| y la dirección del campo en un plano x, y o z =
+constante del espacio. Al mover el slider solo se evalúa el plano que se
+ve (campo_3d.corte_plano): un corte de 200×200 son 40 000 puntos, frente a
+los 8 millones de un volumen de 200³, así que el visor responde al
+instante sin calcular nunca el volumen completo.
+
+Las escenas pueden traer la altura z de cada carga (ver escena.py); las
+que no la traen están en el plano z = 0, donde el corte z = 0 coincide
+con la vista del simulador y los cortes x o y = constante muestran el
+campo "de perfil".
+
+Uso:
+
+    python visor_cortes.py
+    python visor_cortes.py --escena cargas.csv
+"""
+import argparse
+import time
+import tkinter as tk
+import customtkinter as ctk
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+
+from campo_3d import EJES_CORTE, corte_plano, preparar_cargas_3d
+from escena import EscenaCargas
+
+# ============================================================================
+# PARÁMETROS DEL VISOR
+# ============================================================================
+
+# Puntos por lado del plano de corte
+RESOLUCION_CORTE = 200
+
+# Flechas por lado del gráfico
+FLECHAS_POR_LADO = 25
+
+# Se dibujan las cargas a menos de esta distancia (m) del plano
+DISTANCIA_CARGAS = 0.5
+
+# Columna de cada eje en las filas (carga, pos_x, pos_y, pos_z)
+COLUMNA = {'x': 1, 'y': 2, 'z': 3}
+
+# Escala logarítmica fija del mapa de |E| (N/C)
+MAGNITUD_MIN = 1e-2
+MAGNITUD_MAX = 1e2
+
+# ============================================================================
+# CLASE DEL VISOR DE CORTES
+# ============================================================================
+
+class VisorCortes:
+    """Ventana con un corte plano del campo de las cargas en 3D"""
+
+    def __init__(self, ventana, obtener_cargas, k=1.0, rango=5,
+                 resolucion=RESOLUCION_CORTE):
+        """
+        Parámetros:
+        -----------
+        ventana : ctk.CTk o ctk.CTkToplevel
+            Ventana donde se construye el visor
+        obtener_cargas : función () -> array de numpy (N, 4) o (N, 3)
+            Devuelve las cargas actuales; se llama en cada corte, así el
+            visor sigue los cambios de la escena del simulador
+        k : float
+            Constante de Coulomb
+        rango : float
+            El plano es [-rango, rango]²
+        resolucion : int
+            Puntos por lado del plano
+        """
+        self.ventana = ventana
+        self.ventana.title("CORTES DEL CAMPO ELÉCTRICO EN 3D")
+        self.ventana.geometry("1100x800")
+        self.ventana.protocol("WM_DELETE_WINDOW", self.cerrar)
+
+        self.obtener_cargas = obtener_cargas
+        self.k = k
+        self.rango = rango
+        self.resolucion = resolucion
+
+        # Plano mostrado: eje normal y posición sobre ese eje
+        self.eje = tk.StringVar(value='z')
+        self.posicion = tk.DoubleVar(value=0.0)
+        self.mostrar_flechas = tk.BooleanVar(value=True)
+
+        # Cuadro pendiente (los eventos del slider se agrupan en uno) y
+        # último corte dibujado
+        self.id_cuadro = None
+        self.ultimo_corte = None
+        self.cerrado = False
+
+        self.crear_interfaz()
+        self.crear_grafico()
+        self.actualizar()
+
+    # ============================================================================
+    # INTERFAZ
+    # ============================================================================
+
+    def crear_interfaz(self):
+        """Panel de control a la izquierda y canvas de matplotlib a la derecha"""
+        panel = ctk.CTkFrame(self.ventana, width=280, corner_radius=12,
+                             fg_color=("#D1DBE6", "#16213e"))
+        panel.pack(side=tk.LEFT, fill=tk.Y, padx=(15, 10), pady=15)
+
+        titulo = ctk.CTkLabel(
+            panel,
+            text="🧊 Corte del Volumen",
+            font=("Roboto", 18, "bold"),
+            text_color=("#1a1a2e", "#ffffff")
+        )
+        titulo.pack(pady=15, padx=10)
+
+        label_eje = ctk.CTkLabel(
+            panel,
+            text="Plano perpendicular al eje:",
+            font=("Roboto", 12),
+            text_color=("#2c3e50", "#e0e0e0")
+        )
+        label_eje.pack(pady=(10, 2), padx=10)
+
+        self.selector_eje = ctk.CTkSegmentedButton(
+            panel,
+            values=list(EJES_CORTE),
+            variable=self.eje,
+            command=lambda valor: self.solicitar(),
+            font=("Roboto", 12)
+        )
+        self.selector_eje.pack(fill=tk.X, padx=15, pady=5)
+
+        self.label_posicion = ctk.CTkLabel(
+            panel,
+            text="Posición del plano:",
+            font=("Roboto", 12),
+            text_color=("#2c3e50", "#e0e0e0")
+        )
+        self.label_posicion.pack(pady=(10, 2), padx=10)
+
+        marco_slider = ctk.CTkFrame(panel, fg_color=("#D1DBE6", "#16213e"))
+        marco_slider.pack(fill=tk.X, padx=15, pady=5)
+
+        self.slider_posicion = ctk.CTkSlider(
+            marco_slider,
+            from_=-self.rango,
+            to=self.rango,
+            number_of_steps=100,
+            variable=self.posicion,
+            command=lambda x: self.solicitar(),
+            button_color=("#16a085", "#1abc9c"),
+            progress_color=("#76d7c4", "#16a085"),
+            width=160
+        )
+        self.slider_posicion.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
+
+        self.etiqueta_posicion = ctk.CTkLabel(
+            marco_slider,
+            text="0.0",
+            font=("Roboto", 13, "bold"),
+            width=60,
+            fg_color=("#16a085", "#1abc9c"),
+            corner_radius=6,
+            text_color=("#ffffff", "#ffffff")
+        )
+        self.etiqueta_posicion.pack(side=tk.LEFT, padx=5)
+
+        self.switch_flechas = ctk.CTkSwitch(
+            panel,
+            text="Mostrar dirección del campo",
+            variable=self.mostrar_flechas,
+            command=self.solicitar,
+            font=("Roboto", 12),
+            progress_color=("#16a085", "#1abc9c")
+        )
+        self.switch_flechas.pack(pady=10, padx=15)
+
+        self.info_corte = ctk.CTkLabel(
+            panel,
+            text="",
+            font=("Courier", 10),
+            text_color=("#34495e", "#bdc3c7"),
+            justify=tk.LEFT
+        )
+        self.info_corte.pack(pady=10, padx=10)
+
+        marco_canvas = ctk.CTkFrame(self.ventana, corner_radius=12,
+                                    fg_color=("#f7f9fc", "#0d1117"))
+        marco_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 15), pady=15)
+
+        self.fig = Figure(figsize=(7, 7), facecolor='white')
+        self.ax = self.fig.add_subplot()
+        self.canvas_mpl = FigureCanvasTkAgg(self.fig, master=marco_canvas)
+        self.canvas_mpl.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    def crear_grafico(self):
+        """Crea una sola vez la imagen, las flechas y las cargas del corte"""
+        extension = (-self.rango, self.rango, -self.rango, self.rango)
+        self.imagen = self.ax.imshow(
+            np.full((self.resolucion, self.resolucion), MAGNITUD_MIN),
+            origin='lower', extent=extension, cmap='viridis',
+            norm=LogNorm(vmin=MAGNITUD_MIN, vmax=MAGNITUD_MAX, clip=True),
+            interpolation='bilinear'
+        )
+        self.fig.colorbar(self.imagen, ax=self.ax, label='|E| (N/C)', shrink=0.8)
+
+        # Flechas submuestreadas del plano (se actualizan con set_UVC)
+        paso = max(1, -(-self.resolucion // FLECHAS_POR_LADO))
+        u = np.linspace(-self.rango, self.rango, self.resolucion)[::paso]
+        self.paso_flechas = paso
+        U, W = np.meshgrid(u, u)
+        self.flechas = self.ax.quiver(U, W, np.zeros_like(U), np.zeros_like(U),
+                                      color='white', alpha=0.8, scale=25, width=0.004)
+
+        self.cargas_pos = self.ax.scatter([], [], s=200, c='red', edgecolors='white',
+                                          linewidths=2, zorder=5)
+        self.cargas_neg = self.ax.scatter([], [], s=200, c='blue', edgecolors='white',
+                                          linewidths=2, zorder=5)
+
+        self.ax.set_xlim(-self.rango, self.rango)
+        self.ax.set_ylim(-self.rango, self.rango)
+        self.ax.set_aspect('equal')
+
+    # ============================================================================
+    # ACTUALIZACIÓN DEL CORTE
+    # ============================================================================
+
+    def solicitar(self):
+        """Pide un nuevo corte; los eventos seguidos se agrupan en uno"""
+        if self.cerrado or self.id_cuadro is not None:
+            return
+        self.id_cuadro = self.ventana.after_idle(self.actualizar)
+
+    def actualizar(self):
+        """Evalúa el campo solo en el plano mostrado y redibuja"""
+        self.id_cuadro = None
+        if self.cerrado:
+            return
+
+        eje = self.eje.get()
+        posicion = round(self.posicion.get(), 2)
+        cargas = preparar_cargas_3d(self.obtener_cargas())
+        self.etiqueta_posicion.configure(text=f"{posicion:.1f}")
+        self.label_posicion.configure(text=f"Posición del plano ({eje} = cte):")
+
+        estado = (cargas.tobytes(), eje, posicion, self.mostrar_flechas.get())
+        if estado == self.ultimo_corte:
+            return
+        self.ultimo_corte = estado
+
+        inicio = time.perf_counter()
+        U, W, Ex, Ey, Ez = corte_plano(cargas, self.k, self.rango, self.resolucion,
+                                       eje, posicion)
+        tiempo_ms = (time.perf_counter() - inicio) * 1000
+
+        # Magnitud total y componentes dentro del plano
+        componentes = {'x': (Ey, Ez), 'y': (Ex, Ez), 'z': (Ex, Ey)}[eje]
+        self.imagen.set_data(np.sqrt(Ex**2 + Ey**2 + Ez**2))
+
+        self.flechas.set_visible(self.mostrar_flechas.get())
+        if self.mostrar_flechas.get():
+            p = self.paso_flechas
+            Eu, Ew = (c[::p, ::p] for c in componentes)
+            norma = np.sqrt(Eu**2 + Ew**2 + 1e-10)
+            self.flechas.set_UVC(Eu / norma, Ew / norma)
+
+        # Cargas cercanas al plano, proyectadas sobre él
+        horizontal, vertical = EJES_CORTE[eje]
+        cerca = np.abs(cargas[:, COLUMNA[eje]] - posicion) < DISTANCIA_CARGAS
+        posiciones = cargas[:, [COLUMNA[horizontal], COLUMNA[vertical]]]
+        self.cargas_pos.set_offsets(posiciones[cerca & (cargas[:, 0] > 0)])
+        self.cargas_neg.set_offsets(posiciones[cerca & (cargas[:, 0] <= 0)])
+
+        self.ax.set_xlabel(f'{horizontal} (m)')
+        self.ax.set_ylabel(f'{vertical} (m)')
+        self.ax.set_title(f'|E| en el plano {eje} = {posicion:.2f} m', weight='bold')
+        self.canvas_mpl.draw_idle()
+
+        self.info_corte.configure(
+            text=f"Puntos evaluados: {U.size:,}\n"
+                 f"(el volumen serían {U.size * self.resolucion:,})\n"
+                 f"Corte: {tiempo_ms:.1f} ms"
+        )
+
+    def cerrar(self):
+        """Cierra la ventana del visor"""
+        self.cerrado = True
+        if self.id_cuadro is not None:
+            self.ventana.after_cancel(self.id_cuadro)
+        self.ventana.destroy()
+
+# ============================================================================
+# BLOQUE PRINCIPAL
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Visor de cortes del campo en 3D")
+    parser.add_argument('--escena', metavar='ARCHIVO',
+                        help="escena de cargas (CSV, JSON o .npz, con columna z "
+                             "opcional); por defecto, el dipolo")
+    parser.add_argument('--resolucion', type=int, default=RESOLUCION_CORTE)
+    args = parser.parse_args()
+
+    escena = EscenaCargas.cargar(args.escena) if args.escena else EscenaCargas.dipolo()
+    ventana = ctk.CTk()
+    visor = VisorCortes(ventana, lambda: escena.cargas_3d, resolucion=args.resolucion)
+    ventana.mainloop()